@@ -0,0 +1,72 @@
+"""
+GPT 요약 벤치마크: 기사별 순차 호출 vs 비동기 RewriteScheduler (로컬 stand-in 서버 사용)
+
+실행 (News_letter 폴더에서):
+    python -m bench.bench_gpt_rewrite --jobs 9 --latency-ms 800 --rpm 0
+    python -m bench.bench_gpt_rewrite --jobs 30 --latency-ms 300 --rpm 5 --window-sec 2
+"""
+import argparse
+import asyncio
+import os
+import time
+
+from bench.standin_server import StandinConfig, start_standin_server
+
+
+def _make_jobs(n: int):
+    from src.gpt_rewriter_grounded import RewriteJob
+
+    jobs = []
+    for i in range(n):
+        text = "\n".join(f"{i}번 기사 {k}번째 문장입니다. 수치와 발표 내용이 포함되어 있습니다." for k in range(20))
+        jobs.append(RewriteJob(title=f"벤치마크 기사 {i}", article_text=text, published_dt_str="2025-12-24 10:00", section="IT"))
+    return jobs
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--jobs", type=int, default=9)
+    ap.add_argument("--latency-ms", type=int, default=800)
+    ap.add_argument("--rpm", type=int, default=0, help="stand-in 서버가 window-sec 동안 허용하는 요청 수 (초과 시 429)")
+    ap.add_argument("--window-sec", type=float, default=60.0)
+    ap.add_argument("--skip-serial", action="store_true")
+    args = ap.parse_args()
+
+    srv = start_standin_server(StandinConfig(latency_ms=args.latency_ms, rpm=args.rpm, window_sec=args.window_sec))
+    os.environ["OPENAI_BASE_URL"] = srv.base_url + "/v1"
+    os.environ.setdefault("OPENAI_API_KEY", "standin")
+
+    from openai import AsyncOpenAI, OpenAI
+    from src.gpt_rewriter_grounded import RewriteScheduler, rewrite_grounded
+
+    jobs = _make_jobs(args.jobs)
+    base_url = srv.base_url + "/v1"
+
+    if not args.skip_serial:
+        client = OpenAI(api_key="standin", base_url=base_url, max_retries=8)
+        t0 = time.perf_counter()
+        ok = 0
+        for j in jobs:
+            res = rewrite_grounded(client, "standin", j.title, j.published_dt_str, j.article_text, j.related_texts)
+            ok += int(res.ok)
+        print(f"serial     jobs={len(jobs)} ok={ok} elapsed={time.perf_counter() - t0:6.2f}s")
+
+    async def run_async():
+        client = AsyncOpenAI(api_key="standin", base_url=base_url, max_retries=0)
+        try:
+            sched = RewriteScheduler(client, "standin")
+            t0 = time.perf_counter()
+            results = await sched.rewrite_all(jobs)
+            elapsed = time.perf_counter() - t0
+            ok = sum(1 for r in results if r.ok)
+            print(f"scheduler  jobs={len(jobs)} ok={ok} elapsed={elapsed:6.2f}s rate_limited={sched.rate_limited}")
+        finally:
+            await client.close()
+
+    asyncio.run(run_async())
+    print(f"server stats={srv.stats}")
+    srv.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+파이프라인 전체 벤치마크: 녹화본(FIXTURE_DIR)을 재생해 run.main()을 네트워크 없이 반복 실행하고
+전체/단계별 소요 시간(profile_<run_date>.json의 by_name)을 집계
+
+녹화 (네트워크 있는 환경에서 1회, 실제 data/가 아닌 빈 작업 폴더에서 — state.db/캐시가 작업 폴더 기준으로 생김):
+    mkdir /tmp/nl_record && cd /tmp/nl_record
+    FIXTURE_MODE=record FIXTURE_DIR=<News_letter>/data/fixtures DRY_RUN=1 python <News_letter>/run.py
+
+재생 벤치마크 (네트워크 없이):
+    python -m bench.bench_pipeline --fixtures data/fixtures --runs 5
+    python -m bench.bench_pipeline --fixtures data/fixtures --runs 5 --latency-ms 120 --jitter-ms 40
+    python -m bench.bench_pipeline --fixtures data/fixtures --runs 5 --warm-caches --out bench_result.json
+"""
+import argparse
+import glob
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 보고할 단계 (span 이름)
+STAGES = [
+    "run", "collect", "rss.http", "rss.parse", "naver.search", "select", "match",
+    "article.fetch_all", "compact", "gpt.rewrite_all", "gpt.rewrite", "render", "file.write",
+]
+
+# 실행마다 지우는 상태 / 캐시 (작업 폴더 기준 상대 경로)
+_STATE_FILES = ["data/state.db", "data/state.db-wal", "data/state.db-shm"]
+_CACHE_FILES = [
+    "data/article_cache.db", "data/article_cache.db-wal", "data/article_cache.db-shm",
+    "data/llm_cache.db", "data/llm_cache.db-wal", "data/llm_cache.db-shm",
+    "data/naver_cache.db", "data/naver_cache.db-wal", "data/naver_cache.db-shm",
+]
+_CACHE_DIRS = ["data/rss_cache"]
+
+
+def _setup_env(args) -> None:
+    # src.config는 import 시점에 환경변수를 읽으므로 run import 전에 설정
+    os.environ["FIXTURE_MODE"] = "replay"
+    os.environ["FIXTURE_DIR"] = os.path.abspath(args.fixtures)
+    os.environ["REPLAY_LATENCY_MS"] = str(args.latency_ms)
+    os.environ["REPLAY_JITTER_MS"] = str(args.jitter_ms)
+    os.environ["DRY_RUN"] = "1"
+    os.environ["PROFILE_ENABLED"] = "1"
+    os.environ["RETRY_MAX_ATTEMPTS"] = "1"
+    os.environ["RECIPIENTS"] = ""
+    # 녹화본 재생에는 실제 키가 필요 없음 (키/헤더는 fixture 키에 포함되지 않음)
+    os.environ.setdefault("OPENAI_API_KEY", "replay")
+    os.environ.setdefault("NAVER_CLIENT_ID", "replay")
+    os.environ.setdefault("NAVER_CLIENT_SECRET", "replay")
+
+
+def _clean(workdir: str, warm_caches: bool) -> None:
+    paths = list(_STATE_FILES) + ([] if warm_caches else _CACHE_FILES)
+    for rel in paths:
+        p = os.path.join(workdir, rel)
+        if os.path.exists(p):
+            os.remove(p)
+    if not warm_caches:
+        for rel in _CACHE_DIRS:
+            shutil.rmtree(os.path.join(workdir, rel), ignore_errors=True)
+
+
+def _latest_profile(workdir: str) -> Dict:
+    paths = sorted(glob.glob(os.path.join(workdir, "output", "profile_*.json")), key=os.path.getmtime)
+    if not paths:
+        raise RuntimeError("profile json not found (PROFILE_ENABLED?)")
+    with open(paths[-1], "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--fixtures", required=True, help="FIXTURE_MODE=record로 만든 폴더")
+    ap.add_argument("--runs", type=int, default=3)
+    ap.add_argument("--latency-ms", type=int, default=0, help="재생 요청마다 주입할 지연")
+    ap.add_argument("--jitter-ms", type=int, default=0)
+    ap.add_argument("--warm-caches", action="store_true", help="기사/LLM/RSS/네이버 캐시를 실행 사이에 유지")
+    ap.add_argument("--workdir", default="", help="data/, output/을 만들 폴더 (기본: 임시 폴더)")
+    ap.add_argument("--out", default="", help="결과 JSON 저장 경로")
+    args = ap.parse_args()
+
+    _setup_env(args)
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    out_path = os.path.abspath(args.out) if args.out else ""
+
+    workdir = os.path.abspath(args.workdir) if args.workdir else tempfile.mkdtemp(prefix="newsletter_bench_")
+    os.makedirs(workdir, exist_ok=True)
+    os.chdir(workdir)
+
+    import run as pipeline
+    from src.http_client import close_client
+
+    wall: List[float] = []
+    stage_ms: Dict[str, List[float]] = {name: [] for name in STAGES}
+    for i in range(args.runs):
+        _clean(workdir, args.warm_caches)
+        t0 = time.perf_counter()
+        pipeline.main()
+        wall.append(time.perf_counter() - t0)
+
+        by_name = _latest_profile(workdir).get("by_name") or {}
+        for name in STAGES:
+            stage_ms[name].append(float((by_name.get(name) or {}).get("total_ms", 0.0)))
+        print(f"[run {i + 1}/{args.runs}] {wall[-1]:.3f}s")
+    close_client()
+
+    print()
+    print(f"fixtures={os.path.abspath(args.fixtures)} runs={args.runs} latency={args.latency_ms}±{args.jitter_ms}ms warm_caches={args.warm_caches}")
+    print(f"{'stage':<20}{'median_ms':>12}{'min_ms':>12}{'max_ms':>12}")
+    print(f"{'main() wall':<20}{statistics.median(wall) * 1000:>12.1f}{min(wall) * 1000:>12.1f}{max(wall) * 1000:>12.1f}")
+    for name in STAGES:
+        v = stage_ms[name]
+        if not any(v):
+            continue
+        print(f"{name:<20}{statistics.median(v):>12.1f}{min(v):>12.1f}{max(v):>12.1f}")
+    print("(병렬 구간의 하위 span(rss.http, naver.search, gpt.rewrite 등)은 작업별 시간의 합)")
+
+    if out_path:
+        with open(out_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "runs": args.runs,
+                "latency_ms": args.latency_ms,
+                "jitter_ms": args.jitter_ms,
+                "warm_caches": args.warm_caches,
+                "wall_sec": wall,
+                "stage_ms": {k: v for k, v in stage_ms.items() if any(v)},
+            }, f, ensure_ascii=False, indent=2)
+        print(f"saved: {out_path}")
+
+
+if __name__ == "__main__":
+    main()
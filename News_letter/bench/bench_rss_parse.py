@@ -0,0 +1,87 @@
+"""
+RSS 파싱 벤치마크: 기존 BeautifulSoup 경로 vs lxml iterparse 스트리밍 경로
+
+실행 (News_letter 폴더에서):
+    python -m bench.bench_rss_parse --items 300 --window-hours 24
+"""
+import argparse
+import timeit
+from datetime import timedelta
+from email.utils import format_datetime
+from typing import List
+
+from bs4 import BeautifulSoup
+
+from src.hankyung_rss import HKItem, _parse_pubdate, iter_rss_items
+from src.time_utils import now_kst
+
+
+def _parse_rss_soup(xml_text: str, section: str) -> List[HKItem]:
+    """
+    기존 BeautifulSoup 전체 트리 파서 (비교 기준)
+    """
+    soup = BeautifulSoup(xml_text, "xml")
+    out: List[HKItem] = []
+    for it in soup.find_all("item"):
+        title = (it.title.get_text(strip=True) if it.title else "").strip()
+        link = (it.link.get_text(strip=True) if it.link else "").strip()
+        pub = (it.pubDate.get_text(strip=True) if it.pubDate else "").strip()
+        out.append(HKItem(section=section, title=title, link=link, published_kst=_parse_pubdate(pub)))
+    return out
+
+
+def _make_feed(n_items: int, step_minutes: int) -> bytes:
+    now = now_kst()
+    items = []
+    for i in range(n_items):
+        pub = format_datetime(now - timedelta(minutes=step_minutes * i))
+        items.append(
+            "<item>"
+            f"<title><![CDATA[벤치마크 기사 제목 {i} 경제 시장 동향]]></title>"
+            f"<link>https://www.hankyung.com/article/2025{i:08d}</link>"
+            f"<description><![CDATA[{'본문 요약 ' * 40}]]></description>"
+            f"<pubDate>{pub}</pubDate>"
+            "</item>"
+        )
+    xml = (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+        "<title>bench</title>" + "".join(items) + "</channel></rss>"
+    )
+    return xml.encode("utf-8")
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--items", type=int, default=300)
+    ap.add_argument("--step-minutes", type=int, default=15, help="item 간 발행 간격(분)")
+    ap.add_argument("--window-hours", type=int, default=24)
+    ap.add_argument("--repeat", type=int, default=20)
+    args = ap.parse_args()
+
+    feed = _make_feed(args.items, args.step_minutes)
+    w_end = now_kst()
+    w_start = w_end - timedelta(hours=args.window_hours)
+
+    def soup_path():
+        items = _parse_rss_soup(feed.decode("utf-8"), "bench")
+        return [x for x in items if x.published_kst and w_start <= x.published_kst <= w_end]
+
+    def stream_full():
+        return list(iter_rss_items(feed, "bench"))
+
+    def stream_cutoff():
+        return list(iter_rss_items(feed, "bench", not_before=w_start))
+
+    n_soup = len(soup_path())
+    n_cut = len(stream_cutoff())
+    print(f"feed: items={args.items} bytes={len(feed)} window={args.window_hours}h in_window={n_soup}")
+    if n_soup != n_cut:
+        print(f"WARNING: result mismatch soup={n_soup} stream_cutoff={n_cut}")
+
+    for name, fn in [("bs4(xml)+filter", soup_path), ("iterparse(full)", stream_full), ("iterparse(cutoff)", stream_cutoff)]:
+        best = min(timeit.repeat(fn, number=1, repeat=args.repeat))
+        print(f"{name:<20} best={best * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
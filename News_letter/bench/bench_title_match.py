@@ -0,0 +1,166 @@
+"""
+제목 매칭 벤치마크: 토큰 Jaccard(기존 _jaccard 이중 루프 / 역색인) vs 문자 n-gram 코사인 행렬
+
+픽스처: output/newsletter_*.html에 실린 한국경제 제목을 원본으로,
+네이버 뉴스 제목에서 흔한 변형(띄어쓰기, 조사, 말머리, 문장부호, 어순)을 가한 제목을 정답 쌍으로 만들고
+다른 날/다른 섹션 제목을 오답 후보로 섞는다.
+
+실행 (News_letter 폴더에서):
+    python -m bench.bench_title_match
+    python -m bench.bench_title_match --scale 1000
+"""
+import argparse
+import glob
+import html
+import random
+import re
+import time
+from typing import List, Tuple
+
+from src.title_matcher import (
+    MATCH_THRESHOLD, NGRAM_MATCH_THRESHOLD,
+    jaccard, match_titles, ngram_similarity_matrix,
+)
+
+_TITLE_RE = re.compile(r"<div class=\"article-title\">(.*?)</div>", re.S)
+_PREFIXES = ["[속보] ", "[단독] ", "[종합] ", "(종합) ", ""]
+_PARTICLES = [("은 ", "는 "), ("이 ", "가 "), ("을 ", "를 "), ("에 ", "에서 "), ("의 ", " ")]
+
+
+def load_history_titles(pattern: str = "output/newsletter_*.html") -> List[str]:
+    titles: List[str] = []
+    for path in sorted(glob.glob(pattern)):
+        with open(path, encoding="utf-8") as f:
+            for raw in _TITLE_RE.findall(f.read()):
+                t = html.unescape(re.sub(r"<[^>]+>", "", raw)).strip()
+                t = t.split(" | ", 1)[-1]
+                if t and t not in titles:
+                    titles.append(t)
+    return titles
+
+
+def perturb(title: str, rng: random.Random) -> str:
+    t = title
+    for a, b in _PARTICLES:
+        if a in t and rng.random() < 0.5:
+            t = t.replace(a, b, 1)
+    t = re.sub(r"\[[^\]]*\]\s*$", "", t).strip()           # [HK영상] 등 꼬리표 제거
+    t = t.replace("…", rng.choice([" ", "...", ", "]))
+    if rng.random() < 0.4:
+        t = t.replace(" ", "", 1)                           # 띄어쓰기 차이
+    if rng.random() < 0.3 and ", " in t:
+        a, b = t.split(", ", 1)
+        t = f"{b}, {a}"                                     # 어순 변경
+    if rng.random() < 0.3 and len(t) > 20:
+        t = t[: int(len(t) * 0.7)] + "..."                  # 말줄임 절단
+    return (rng.choice(_PREFIXES) + t).strip()
+
+
+def build_fixture(titles: List[str], seed: int) -> Tuple[List[str], List[str], List[int]]:
+    """
+    (hk_titles, nv_titles, gold) — gold[i]는 hk_titles[i]의 정답 nv 인덱스(없으면 -1)
+    - HK의 절반만 변형 제목(정답)을 가짐 → 나머지 HK는 오탐 측정용
+    - HK에 없는 기사 제목의 변형을 오답 후보로 섞음
+    """
+    rng = random.Random(seed)
+    titles = titles[:]
+    rng.shuffle(titles)
+    n_hk = len(titles) * 2 // 3
+    hk = titles[:n_hk]
+    nv_src = [(i, perturb(t, rng)) for i, t in enumerate(hk[: n_hk // 2])]
+    nv_src += [(-1, perturb(t, rng)) for t in titles[n_hk:]]
+    rng.shuffle(nv_src)
+    nv = [t for _, t in nv_src]
+    gold = [-1] * len(hk)
+    for j, (i, _) in enumerate(nv_src):
+        if i >= 0:
+            gold[i] = j
+    return hk, nv, gold
+
+
+def _legacy_jaccard_match(hk: List[str], nv: List[str], threshold: float) -> List[int]:
+    used = set()
+    out: List[int] = []
+    for h in hk:
+        best_j, best = -1, 0.0
+        for j, n in enumerate(nv):
+            if j in used:
+                continue
+            s = jaccard(h, n)
+            if s > best:
+                best, best_j = s, j
+        if best_j >= 0 and best >= threshold:
+            used.add(best_j)
+            out.append(best_j)
+        else:
+            out.append(-1)
+    return out
+
+
+def score(pred: List[int], gold: List[int]) -> Tuple[int, int, int]:
+    correct = sum(1 for p, g in zip(pred, gold) if g >= 0 and p == g)
+    wrong = sum(1 for p, g in zip(pred, gold) if p >= 0 and p != g)
+    return correct, wrong, sum(1 for g in gold if g >= 0)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--scale", type=int, default=600, help="속도 측정용 HK/NV 제목 수")
+    args = ap.parse_args()
+
+    titles = load_history_titles()
+    if len(titles) < 4:
+        raise SystemExit("output/ 에 newsletter_*.html 제목이 부족합니다.")
+    hk, nv, gold = build_fixture(titles, args.seed)
+    print(f"fixture: history_titles={len(titles)} hk={len(hk)} nv={len(nv)} gold_pairs={sum(1 for g in gold if g >= 0)}")
+
+    print("\n[match rate] correct / gold, wrong = 잘못된 매칭 수")
+    c, w, n = score(_legacy_jaccard_match(hk, nv, MATCH_THRESHOLD), gold)
+    print(f"  jaccard(legacy loop) th={MATCH_THRESHOLD:.2f}  correct={c}/{n} wrong={w}")
+    for th in (MATCH_THRESHOLD, 0.2):
+        c, w, n = score([m.nv_idx for m in match_titles(hk, nv, threshold=th)], gold)
+        print(f"  jaccard(index)       th={th:.2f}  correct={c}/{n} wrong={w}")
+    for th in (0.3, NGRAM_MATCH_THRESHOLD, 0.45, 0.55, 0.65):
+        c, w, n = score([m.nv_idx for m in match_titles(hk, nv, threshold=th, method="ngram")], gold)
+        print(f"  ngram(2-3)           th={th:.2f}  correct={c}/{n} wrong={w}")
+
+    for method in ("jaccard", "ngram"):
+        c, w, n = score([m.nv_idx for m in match_titles(hk, nv, method=method, assignment="optimal")], gold)
+        print(f"  {method + '(optimal)':<20} th=default correct={c}/{n} wrong={w}")
+
+    # 서로 다른 기사끼리의 최고 n-gram 점수 = 임계값 하한 참고치
+    sim = ngram_similarity_matrix(titles, titles)
+    for k in range(len(titles)):
+        sim[k, k] = 0.0
+    print(f"  unrelated max ngram score = {sim.max():.3f}")
+
+    # 속도: 제목을 번호 붙여 복제해 scale x scale 행렬
+    rng = random.Random(args.seed)
+    big_hk = [f"{rng.choice(titles)} {k}" for k in range(args.scale)]
+    big_nv = [perturb(f"{rng.choice(titles)} {k}", rng) for k in range(args.scale)]
+    print(f"\n[speed] {args.scale} x {args.scale}")
+
+    t0 = time.perf_counter()
+    _legacy_jaccard_match(big_hk[:200], big_nv, MATCH_THRESHOLD)
+    legacy = (time.perf_counter() - t0) * args.scale / 200
+    print(f"  jaccard(legacy loop)  {legacy:8.3f} s (200행 측정 후 환산)")
+
+    t0 = time.perf_counter()
+    match_titles(big_hk, big_nv)
+    print(f"  jaccard(index)        {time.perf_counter() - t0:8.3f} s")
+
+    t0 = time.perf_counter()
+    ngram_similarity_matrix(big_hk, big_nv)
+    mid = time.perf_counter()
+    match_titles(big_hk, big_nv, method="ngram")
+    print(f"  ngram matrix only     {mid - t0:8.3f} s")
+    print(f"  match_titles(ngram)   {time.perf_counter() - mid:8.3f} s")
+
+    t0 = time.perf_counter()
+    match_titles(big_hk, big_nv, assignment="optimal")
+    print(f"  jaccard(optimal)      {time.perf_counter() - t0:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,533 @@
+"""
+로컬 대체(stand-in) 업스트림 서버 — 외부 네트워크 없이 동시성/레이트리밋/재시도 동작 확인용
+
+현재 제공 엔드포인트
+- POST /v1/responses : OpenAI Responses API 형태의 응답 (근거 구절 검증을 통과하는 JSON 생성)
+- POST /v1/files, GET /v1/files/{id}/content : 배치 입력/출력 파일
+- POST /v1/batches, GET /v1/batches/{id} : Batch API (batch_delay_sec 뒤 completed)
+- GET /feed/{economy|international|it} : 한국경제 RSS (rss_items개, rss_interval_min 간격 최신순)
+- GET /article/{feed}/{n} : RSS 기사 본문 HTML
+- GET /v1/search/news.json : 네이버 뉴스 검색 (query/display/start/sort 검증, SE01~SE04 / 010 한도 초과 / 012 속도 제한)
+
+지연/5xx 비율은 모든 엔드포인트에 적용, 429는 OpenAI(rpm/window_sec)와 네이버(naver_qps, naver_daily_quota)에 각각 적용
+
+실행 (News_letter 폴더에서):
+    python -m bench.standin_server --port 8089 --latency-ms 800 --rpm 60
+    set OPENAI_BASE_URL=http://127.0.0.1:8089/v1
+
+run.py 전체를 로컬에서 부하 테스트 (실제 data/ 폴더 금지: state.db 발송 기록과 기사/LLM/네이버/RSS 캐시에
+대체 서버의 가짜 응답이 남음 → bench_pipeline처럼 빈 작업 폴더에서 실행):
+    python -m bench.standin_server --port 8089 --latency-ms 150 --jitter-ms 100 --naver-qps 10 --naver-quota 25000
+    (다른 창, 빈 폴더에서) mkdir nl_standin && cd nl_standin
+    set HANKYUNG_RSS_BASE_URL=http://127.0.0.1:8089
+    set NAVER_API_BASE_URL=http://127.0.0.1:8089
+    set OPENAI_BASE_URL=http://127.0.0.1:8089/v1
+    set NAVER_CLIENT_ID=standin / NAVER_CLIENT_SECRET=standin / OPENAI_API_KEY=standin / DRY_RUN=1
+    python <News_letter>/run.py
+"""
+import argparse
+import email.parser
+import html
+import json
+import random
+import threading
+import time
+import uuid
+import zlib
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+
+@dataclass
+class StandinConfig:
+    latency_ms: int = 0
+    jitter_ms: int = 0
+    error_rate: float = 0.0      # 5xx 비율 (0~1)
+    rpm: int = 0                 # window_sec 동안 허용 요청 수 (0이면 무제한), 초과 시 429
+    window_sec: float = 60.0
+    retry_after_sec: float = 0.0  # 0이면 창이 비는 시점까지 남은 시간을 Retry-After로 보냄
+    batch_delay_sec: float = 0.0  # 배치 생성 후 completed가 되기까지 시간
+    rss_items: int = 30          # 피드당 item 수
+    rss_interval_min: int = 20   # item 간 발행 시각 간격 (분)
+    naver_total: int = 300       # 검색어당 전체 결과 수 (start+display로 페이지 조회)
+    naver_interval_min: int = 10  # 검색 결과 간 발행 시각 간격 (분)
+    naver_qps: int = 0           # 초당 허용 호출 수 (0이면 무제한), 초과 시 429 / errorCode 012
+    naver_daily_quota: int = 0   # 서버 기동 후 허용 총 호출 수 (0이면 무제한), 초과 시 429 / errorCode 010
+
+
+class _RateWindow:
+    def __init__(self, limit: int, window_sec: float):
+        self.limit = limit
+        self.window_sec = window_sec
+        self._hits: deque = deque()
+        self._lock = threading.Lock()
+
+    def allow(self) -> Tuple[bool, float]:
+        """
+        (허용 여부, 다음 요청 가능까지 남은 초)
+        """
+        if self.limit <= 0:
+            return True, 0.0
+        now = time.monotonic()
+        with self._lock:
+            while self._hits and now - self._hits[0] > self.window_sec:
+                self._hits.popleft()
+            if len(self._hits) >= self.limit:
+                return False, self.window_sec - (now - self._hits[0])
+            self._hits.append(now)
+            return True, 0.0
+
+
+def _fake_rewrite(prompt: str) -> str:
+    """
+    프롬프트의 [기사 원문]에서 앞 문장들을 그대로 인용해 검증을 통과하는 JSON 생성
+    """
+    article = prompt.split("[기사 원문]", 1)[-1]
+    lines = [x.strip() for x in article.splitlines() if x.strip() and not x.startswith("[관련자료")]
+    if not lines:
+        lines = ["제공 텍스트만으로 확인 불가"]
+    quotes = [ln[:40] for ln in lines[:3]]
+    while len(quotes) < 2:
+        quotes.append(quotes[0])
+    body = " ".join(lines[:2])[:200]
+    return json.dumps({"body": body, "importance": "MEDIUM", "evidence_quotes": quotes}, ensure_ascii=False)
+
+
+# 피드 경로 → 기사 주제 (RSS 제목/본문 생성용)
+_FEEDS = {"economy": "한국 경제", "international": "세계 경제", "it": "IT"}
+_SUBJECTS = ["정부", "한국은행", "삼성전자", "SK하이닉스", "현대차", "미국 연준", "중국", "엔비디아", "구글", "금융위원회"]
+_TOPICS = ["금리", "수출", "반도체", "환율", "물가", "인공지능", "배터리", "고용", "부동산", "관세"]
+_VERBS = ["발표", "전망 상향", "우려 확대", "투자 확대", "규제 강화", "실적 개선", "협상 타결", "점검 착수"]
+_KST = timezone(timedelta(hours=9))
+
+
+def _headline(seed: str, n: int) -> str:
+    r = random.Random(zlib.crc32(f"{seed}#{n}".encode("utf-8")))
+    return f"{r.choice(_SUBJECTS)} {r.choice(_TOPICS)} {r.choice(_VERBS)}… {r.choice(_TOPICS)} 영향 주목 ({seed} {n})"
+
+
+def _article_html(feed: str, n: int) -> str:
+    title = _headline(feed, n)
+    r = random.Random(zlib.crc32(f"body:{feed}#{n}".encode("utf-8")))
+    paras = [
+        f"{title}. {r.choice(_SUBJECTS)}은 {r.randint(1, 30)}일 {r.choice(_TOPICS)} 관련 수치가 "
+        f"전년 대비 {r.randint(1, 40)}.{r.randint(0, 9)}% 변동했다고 밝혔다."
+        for _ in range(8)
+    ]
+    body = "".join(f"<p>{html.escape(p)}</p>" for p in paras)
+    return (
+        f"<html><head><title>{html.escape(title)}</title></head><body>"
+        f"<div class='nav'>메뉴 | 로그인 | 구독</div><article><h1>{html.escape(title)}</h1>{body}</article>"
+        f"<div class='footer'>ⓒ 한국경제신문 무단전재 및 재배포 금지</div></body></html>"
+    )
+
+
+def _rss_xml(base_url: str, feed: str, anchor: datetime, count: int, interval_min: int) -> str:
+    items = []
+    for n in range(count):
+        pub = anchor - timedelta(minutes=interval_min * n)
+        items.append(
+            f"<item><title><![CDATA[{_headline(feed, n)}]]></title>"
+            f"<link>{base_url}/article/{feed}/{n}</link>"
+            f"<pubDate>{format_datetime(pub)}</pubDate></item>"
+        )
+    return (
+        "<?xml version='1.0' encoding='UTF-8'?><rss version='2.0'><channel>"
+        f"<title>한국경제 {_FEEDS.get(feed, feed)}</title>{''.join(items)}</channel></rss>"
+    )
+
+
+def _naver_corpus(query: str, sort: str, anchor: datetime, total: int, interval_min: int) -> List[Dict[str, Any]]:
+    """
+    검색어별 고정 결과 목록 (date: 최신순 / sim: 검색어 기준 고정 셔플)
+    - 3건 중 1건은 RSS 기사 제목을 그대로 쓴 타 매체 기사 (HK↔네이버 매칭 대상)
+    - 10건 중 1건은 네이버뉴스 링크가 없는 기사 (is_naver_news_link 필터 대상)
+    - "A | B" (OR 검색): 검색어별 결과를 합친 목록 (date는 발행 시각 순, sim은 번갈아 배치)
+    """
+    terms = [t.strip() for t in query.split("|") if t.strip()]
+    if len(terms) > 1:
+        per_term = [_naver_corpus(t, sort, anchor, total, interval_min) for t in terms]
+        if sort == "date":
+            merged = sorted((it for items in per_term for it in items), key=lambda it: it["_minutes"])
+        else:
+            merged = [items[i] for i in range(total) for items in per_term if i < len(items)]
+        return merged[:total]
+    feeds = list(_FEEDS)
+    feed = feeds[zlib.crc32(query.encode("utf-8")) % len(feeds)]
+    out = []
+    for n in range(total):
+        minutes = interval_min * n + 3 + zlib.crc32(query.encode("utf-8")) % max(1, interval_min)
+        pub = anchor - timedelta(minutes=minutes)
+        title = _headline(feed, n // 3) if n % 3 == 0 else _headline(query, n)
+        oid, aid = 15 + n % 7, 10_000_000 + n
+        link = f"https://n.news.naver.com/mnews/article/{oid:03d}/{aid}" if n % 10 != 9 else f"https://news.example.com/{aid}"
+        out.append({
+            "title": f"<b>{html.escape(query)}</b> {html.escape(title)}",
+            "originallink": f"https://news.example.com/{feed}/{aid}",
+            "link": link,
+            "description": f"{html.escape(title)} 관련 <b>{html.escape(query)}</b> 기사 요약",
+            "pubDate": format_datetime(pub),
+            "_minutes": minutes,
+        })
+    if sort == "sim":
+        random.Random(zlib.crc32(query.encode("utf-8"))).shuffle(out)
+    return out
+
+
+def _naver_error(code: str, message: str) -> Dict[str, str]:
+    return {"errorMessage": message, "errorCode": code}
+
+
+def _responses_payload(model: str, prompt: str) -> Dict[str, Any]:
+    text = _fake_rewrite(prompt)
+    in_tok = len(prompt) // 2 + 1
+    out_tok = len(text) // 2 + 1
+    return {
+        "id": f"resp_{uuid.uuid4().hex}",
+        "object": "response",
+        "created_at": int(time.time()),
+        "model": model,
+        "status": "completed",
+        "output": [{
+            "type": "message",
+            "id": f"msg_{uuid.uuid4().hex}",
+            "role": "assistant",
+            "status": "completed",
+            "content": [{"type": "output_text", "text": text, "annotations": []}],
+        }],
+        "parallel_tool_calls": True,
+        "tool_choice": "auto",
+        "tools": [],
+        "usage": {
+            "input_tokens": in_tok,
+            "input_tokens_details": {"cached_tokens": 0},
+            "output_tokens": out_tok,
+            "output_tokens_details": {"reasoning_tokens": 0},
+            "total_tokens": in_tok + out_tok,
+        },
+    }
+
+
+def _parse_multipart_file(content_type: str, raw: bytes) -> bytes:
+    # files.create 업로드(multipart/form-data)에서 file 파트 내용만 추출
+    msg = email.parser.BytesParser().parsebytes(
+        b"Content-Type: " + content_type.encode("latin-1") + b"\r\n\r\n" + raw
+    )
+    for part in msg.walk():
+        if part.get_param("name", header="content-disposition") == "file":
+            return part.get_payload(decode=True) or b""
+    return b""
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    server: "StandinServer"
+
+    def log_message(self, format, *args):  # noqa: A002 - BaseHTTPRequestHandler 시그니처
+        pass
+
+    def _send_json(self, status: int, data: Any, headers: Optional[Dict[str, str]] = None):
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self) -> bytes:
+        n = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(n) if n else b""
+
+    def _read_json(self) -> Dict[str, Any]:
+        return json.loads(self._read_body() or b"{}")
+
+    def _send_text(self, status: int, text: str, content_type: str):
+        body = text.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _simulate(self, window: Optional["_RateWindow"] = None, limited: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        지연/429/5xx 주입. 응답을 이미 보냈으면 False
+        window: 429 판정에 쓸 창 (None이면 429 없음), limited: 429 응답 본문
+        """
+        cfg = self.server.config
+        self.server.count("requests")
+        delay = cfg.latency_ms + (random.randint(0, cfg.jitter_ms) if cfg.jitter_ms else 0)
+        if delay:
+            time.sleep(delay / 1000.0)
+        if window is not None:
+            allowed, wait = window.allow()
+            if not allowed:
+                self.server.count("rate_limited")
+                retry_after = cfg.retry_after_sec or max(wait, 0.05)
+                body = limited or {"error": {"message": "Rate limit reached", "type": "requests", "code": "rate_limit_exceeded"}}
+                self._send_json(429, body, headers={"Retry-After": f"{retry_after:.2f}"})
+                return False
+        if cfg.error_rate and random.random() < cfg.error_rate:
+            self.server.count("errors")
+            self._send_json(500, {"error": {"message": "stand-in injected error", "type": "server_error"}})
+            return False
+        return True
+
+    def _base_url(self) -> str:
+        return f"http://{self.headers.get('Host') or '%s:%d' % self.server.server_address[:2]}"
+
+    def _naver_search(self, query_string: str):
+        cfg = self.server.config
+        self.server.count("naver_calls")
+        if not self._simulate(self.server.naver_window, _naver_error("012", "Rate limit exceeded.")):
+            return
+        if not self.server.take_naver_quota():
+            self.server.count("naver_quota_exceeded")
+            self._send_json(429, _naver_error("010", "Query limit exceeded."))
+            return
+
+        qs = {k: v[0] for k, v in parse_qs(query_string).items()}
+        query = (qs.get("query") or "").strip()
+        if not query:
+            self._send_json(400, _naver_error("SE01", "Incorrect query request (query)"))
+            return
+        try:
+            display = int(qs.get("display") or 10)
+            start = int(qs.get("start") or 1)
+        except ValueError:
+            self._send_json(400, _naver_error("SE02", "Invalid display value"))
+            return
+        if not 1 <= display <= 100:
+            self._send_json(400, _naver_error("SE02", "Invalid display value"))
+            return
+        if not 1 <= start <= 1000:
+            self._send_json(400, _naver_error("SE03", "Invalid start value"))
+            return
+        sort = qs.get("sort") or "sim"
+        if sort not in ("sim", "date"):
+            self._send_json(400, _naver_error("SE04", "Invalid sort value"))
+            return
+
+        corpus = _naver_corpus(query, sort, self.server.anchor, cfg.naver_total, cfg.naver_interval_min)
+        page = [{k: v for k, v in it.items() if not k.startswith("_")} for it in corpus[start - 1:start - 1 + display]]
+        self._send_json(200, {
+            "lastBuildDate": format_datetime(datetime.now(_KST)),
+            "total": len(corpus),
+            "start": start,
+            "display": len(page),
+            "items": page,
+        })
+
+    def do_POST(self):
+        if self.path.rstrip("/").endswith("/v1/responses"):
+            req = self._read_json()
+            if not self._simulate(self.server.window):
+                return
+            prompt = req.get("input") or ""
+            if isinstance(prompt, list):
+                prompt = json.dumps(prompt, ensure_ascii=False)
+            self._send_json(200, _responses_payload(req.get("model") or "standin", prompt))
+            return
+        if self.path.rstrip("/").endswith("/v1/files"):
+            data = _parse_multipart_file(self.headers.get("Content-Type") or "", self._read_body())
+            self._send_json(200, self.server.add_file("rewrite_batch.jsonl", data, "batch"))
+            return
+        if self.path.rstrip("/").endswith("/v1/batches"):
+            req = self._read_json()
+            self._send_json(200, self.server.create_batch(req.get("input_file_id") or "", req.get("endpoint") or ""))
+            return
+        self._send_json(404, {"error": {"message": f"unknown path {self.path}"}})
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        path = parts.path.rstrip("/")
+        if path.endswith("/v1/search/news.json"):
+            self._naver_search(parts.query)
+            return
+        if path.startswith("/feed/") and path.rsplit("/", 1)[-1] in _FEEDS:
+            if not self._simulate():
+                return
+            cfg = self.server.config
+            xml = _rss_xml(self._base_url(), path.rsplit("/", 1)[-1], self.server.anchor, cfg.rss_items, cfg.rss_interval_min)
+            self._send_text(200, xml, "application/rss+xml; charset=utf-8")
+            return
+        if path.startswith("/article/"):
+            seg = path.split("/")
+            if len(seg) == 4 and seg[2] in _FEEDS and seg[3].isdigit():
+                if not self._simulate():
+                    return
+                self._send_text(200, _article_html(seg[2], int(seg[3])), "text/html; charset=utf-8")
+                return
+        if "/v1/batches/" in path:
+            batch = self.server.get_batch(path.rsplit("/", 1)[-1])
+            if batch is None:
+                self._send_json(404, {"error": {"message": "batch not found"}})
+            else:
+                self._send_json(200, batch)
+            return
+        if "/v1/files/" in path and path.endswith("/content"):
+            data = self.server.files.get(path.split("/")[-2], {}).get("data")
+            if data is None:
+                self._send_json(404, {"error": {"message": "file not found"}})
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "application/octet-stream")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+            return
+        self._send_json(404, {"error": {"message": f"unknown path {self.path}"}})
+
+
+class StandinServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, addr: Tuple[str, int], config: StandinConfig):
+        super().__init__(addr, StandinHandler)
+        self.config = config
+        self.window = _RateWindow(config.rpm, config.window_sec)
+        self.naver_window = _RateWindow(config.naver_qps, 1.0)
+        self._naver_used = 0
+        # RSS/네이버 결과의 발행 시각 기준 (기동 시각 고정 → 페이지를 나눠 받아도 결과가 흔들리지 않음)
+        self.anchor = datetime.now(_KST).replace(second=0, microsecond=0)
+        self.stats: Dict[str, int] = {}
+        self._stats_lock = threading.Lock()
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.batches: Dict[str, Dict[str, Any]] = {}
+
+    def count(self, key: str):
+        with self._stats_lock:
+            self.stats[key] = self.stats.get(key, 0) + 1
+
+    def take_naver_quota(self) -> bool:
+        with self._stats_lock:
+            if self.config.naver_daily_quota and self._naver_used >= self.config.naver_daily_quota:
+                return False
+            self._naver_used += 1
+            return True
+
+    def add_file(self, filename: str, data: bytes, purpose: str) -> Dict[str, Any]:
+        fid = f"file-{uuid.uuid4().hex}"
+        meta = {
+            "id": fid, "object": "file", "bytes": len(data), "created_at": int(time.time()),
+            "filename": filename, "purpose": purpose, "status": "processed",
+        }
+        self.files[fid] = {"meta": meta, "data": data}
+        return meta
+
+    def create_batch(self, input_file_id: str, endpoint: str) -> Dict[str, Any]:
+        self.count("batches")
+        bid = f"batch_{uuid.uuid4().hex}"
+        self.batches[bid] = {
+            "id": bid, "object": "batch", "endpoint": endpoint, "input_file_id": input_file_id,
+            "completion_window": "24h", "status": "in_progress", "created_at": int(time.time()),
+            "output_file_id": None, "error_file_id": None,
+            "request_counts": {"total": 0, "completed": 0, "failed": 0},
+            "_ready_at": time.monotonic() + self.config.batch_delay_sec,
+        }
+        return self._public_batch(self.batches[bid])
+
+    def get_batch(self, bid: str) -> Optional[Dict[str, Any]]:
+        batch = self.batches.get(bid)
+        if batch is None:
+            return None
+        if batch["status"] == "in_progress" and time.monotonic() >= batch["_ready_at"]:
+            self._run_batch(batch)
+        return self._public_batch(batch)
+
+    def _run_batch(self, batch: Dict[str, Any]):
+        lines = (self.files.get(batch["input_file_id"], {}).get("data") or b"").decode("utf-8").splitlines()
+        out = []
+        for line in lines:
+            if not line.strip():
+                continue
+            req = json.loads(line)
+            body = req.get("body") or {}
+            out.append(json.dumps({
+                "id": f"batch_req_{uuid.uuid4().hex}",
+                "custom_id": req.get("custom_id"),
+                "response": {"status_code": 200, "request_id": uuid.uuid4().hex,
+                             "body": _responses_payload(body.get("model") or "standin", body.get("input") or "")},
+                "error": None,
+            }, ensure_ascii=False))
+        meta = self.add_file("batch_output.jsonl", ("\n".join(out) + "\n").encode("utf-8"), "batch_output")
+        batch.update({
+            "status": "completed",
+            "output_file_id": meta["id"],
+            "request_counts": {"total": len(out), "completed": len(out), "failed": 0},
+        })
+
+    @staticmethod
+    def _public_batch(batch: Dict[str, Any]) -> Dict[str, Any]:
+        return {k: v for k, v in batch.items() if not k.startswith("_")}
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def start_standin_server(config: Optional[StandinConfig] = None, host: str = "127.0.0.1", port: int = 0) -> StandinServer:
+    """
+    백그라운드 스레드에서 서버 시작 (port=0이면 빈 포트 자동 선택). 종료는 server.shutdown()
+    """
+    srv = StandinServer((host, port), config or StandinConfig())
+    threading.Thread(target=srv.serve_forever, name="standin", daemon=True).start()
+    return srv
+
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8089)
+    ap.add_argument("--latency-ms", type=int, default=0)
+    ap.add_argument("--jitter-ms", type=int, default=0)
+    ap.add_argument("--error-rate", type=float, default=0.0)
+    ap.add_argument("--rpm", type=int, default=0)
+    ap.add_argument("--window-sec", type=float, default=60.0)
+    ap.add_argument("--retry-after", type=float, default=0.0)
+    ap.add_argument("--batch-delay", type=float, default=0.0)
+    ap.add_argument("--rss-items", type=int, default=30)
+    ap.add_argument("--rss-interval-min", type=int, default=20)
+    ap.add_argument("--naver-total", type=int, default=300)
+    ap.add_argument("--naver-interval-min", type=int, default=10)
+    ap.add_argument("--naver-qps", type=int, default=0)
+    ap.add_argument("--naver-quota", type=int, default=0)
+    return ap.parse_args(argv)
+
+
+def main():
+    args = _parse_args()
+    cfg = StandinConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        rpm=args.rpm,
+        window_sec=args.window_sec,
+        retry_after_sec=args.retry_after,
+        batch_delay_sec=args.batch_delay,
+        rss_items=args.rss_items,
+        rss_interval_min=args.rss_interval_min,
+        naver_total=args.naver_total,
+        naver_interval_min=args.naver_interval_min,
+        naver_qps=args.naver_qps,
+        naver_daily_quota=args.naver_quota,
+    )
+    srv = StandinServer((args.host, args.port), cfg)
+    print(f"stand-in server listening on {srv.base_url}")
+    try:
+        srv.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"stats={srv.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,19 @@
+import heapq
 import time
 import subprocess
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 import subprocess
 
 
 from src.logger_utils import setup_logger
 from src.time_utils import now_kst, fmt_dt, fmt_date, run_date_str, last_24h_window_from_now
-from src.state_store import StateStore
+from src.state_store import PublishedHistory, StateStore
 from src.config import (
     SECTIONS, HK_TOP_N, NAVER_TOP_N,
     RETRY_MAX_ATTEMPTS, RETRY_INTERVAL_SEC,
@@ -16,13 +21,35 @@ from src.config import (
     RECIPIENTS,
     MAIL_SUBJECT_FMT, BLOG_TITLE_FMT, TOP_NOTE,
     STATE_DB_PATH,
+    SECTION_MAX_WORKERS,
+    DEDUP_MODE, DEDUP_SECTION_PRIORITY,
+    PUBLISHED_HISTORY_DAYS, CHECKPOINT_ENABLED,
+    PROFILE_ENABLED, DRY_RUN, FIXTURE_MODE,
+    ARTICLE_FETCH_MAX_IN_FLIGHT, ARTICLE_FETCH_TIMEOUT_SEC,
+    ARTICLE_CACHE_DB_PATH, ARTICLE_CACHE_TTL_SEC, ARTICLE_CACHE_MAX_AGE_SEC, ARTICLE_CACHE_MAX_MB,
+    LLM_CACHE_DB_PATH, LLM_CACHE_MAX_AGE_SEC, LLM_CACHE_MAX_MB, LLM_CACHE_BYPASS,
+    PROMPT_TOKEN_BUDGET,
+    MATCH_METHOD, MATCH_ASSIGNMENT,
+    NAVER_SEARCH_MODE, NAVER_FETCH_MARGIN, NAVER_QUERY_GROUP_SIZE, NAVER_SECTION_KEYWORDS,
+    NAVER_CACHE_DB_PATH, NAVER_CACHE_TTL_SEC, NAVER_CACHE_MAX_ENTRIES, NAVER_CACHE_STALE_SEC,
 )
-from src.hankyung_rss import fetch_hankyung_rss, HKItem
-from src.naver_search_api import NaverNewsSearchAPI, NaverNewsItem
-from src.article_fetcher import fetch_article_text
-from src.gpt_rewriter_grounded import rewrite_article_grounded
+from src.hankyung_rss import fetch_hankyung_rss, HKItem, hkitem_from_dict, hkitem_to_dict
+from src.naver_search_api import (
+    NaverNewsSearchAPI, NaverNewsItem, NaverQuotaExceeded, NaverRateLimited,
+    is_naver_news_link, nvitem_from_dict, nvitem_to_dict,
+)
+from src.article_fetcher import fetch_articles_text
+from src.article_cache import ArticleCache, normalize_url
+from src.gpt_rewriter_grounded import RewriteJob, rewrite_articles_grounded
+from src.llm_cache import ResponseCache
+from src.naver_cache import NaverSearchCache
+from src.naver_query_planner import plan_query_groups, search_group, section_keywords
+from src.prompt_compactor import compact_article
+from src.title_matcher import match_titles
+from src.dedup_index import DedupIndex
+from src.tracing import TRACER, Span, bind, span
 from src.html_renderer import RenderItem, render_newsletter_html
-from src.outlook_app_mailer import send_mail_via_outlook_app
+from src.replay import fixture_now
 from src.config import NAVER_QUERIES
 
 
@@ -32,26 +59,13 @@ def _within_window(dt, start, end) -> bool:
     return start <= dt <= end
 
 
-def _select_latest(items: List[HKItem], start, end, n: int) -> List[HKItem]:
+def _select_latest(
+    items: List[HKItem], start, end, n: int, history: Optional[PublishedHistory] = None,
+) -> List[HKItem]:
     filtered = [x for x in items if _within_window(x.published_kst, start, end)]
-    filtered.sort(key=lambda x: x.published_kst or 0, reverse=True)
-    return filtered[:n]
-
-
-def _normalize_title(s: str) -> str:
-    s = (s or "").lower()
-    for ch in ["[", "]", "(", ")", "…", "\"", "'", "’", "“", "”", "·", "|"]:
-        s = s.replace(ch, " ")
-    s = " ".join(s.split())
-    return s.strip()
-
-
-def _jaccard(a: str, b: str) -> float:
-    sa = set(_normalize_title(a).split())
-    sb = set(_normalize_title(b).split())
-    if not sa or not sb:
-        return 0.0
-    return len(sa & sb) / len(sa | sb)
+    if history:
+        filtered = [x for x in filtered if not history.contains(x.link, x.title)]
+    return heapq.nlargest(n, filtered, key=lambda x: x.published_kst)
 
 
 def _log_top_titles(logger, tag: str, sec: str, items, limit: int = 3):
@@ -95,11 +109,503 @@ def _launch_tistory_login_only(logger, script_path: str = "src/tistory_login_onl
         logger.warning(f"[TISTORY] failed to launch login script: {e}")
 
 
+# 섹션당 싣는 네이버 추가 기사 수
+_EXTRA_MAX = 2
+
+# 재시도 attempt가 이어서 실행하도록 StateStore에 남기는 단계별 체크포인트
+# (선정/매칭은 수집 스냅샷으로부터 결정적으로 다시 계산되므로 따로 저장하지 않음)
+_CKPT_RUN = "run"              # key "window": 24시간 창 (재실행해도 같은 창 사용)
+_CKPT_COLLECT = "collect"      # key 섹션: RSS/네이버 후보 스냅샷
+_CKPT_ARTICLE = "article"      # key 정규화 URL: 기사 본문
+_CKPT_REWRITE = "rewrite"      # key "섹션#i": 요약 body_html
+_CKPT_MAIL = "mail"            # key "sent": 메일 발송 완료
+
+
+def _published_items(plans: List["SectionPlan"]) -> List[Tuple[str, str, str]]:
+    """
+    뉴스레터에 실린 기사 (section, url, title): HK 메인 + 매칭된 네이버 + 추가 네이버
+    """
+    out: List[Tuple[str, str, str]] = []
+    for plan in plans:
+        for i, hk in enumerate(plan.hk_sel):
+            out.append((plan.sec, hk.link, hk.title))
+            nv = plan.hk_to_nv.get(i)
+            if nv:
+                out.append((plan.sec, nv.originallink or nv.link, nv.title))
+        for nv in plan.extra_nv[:_EXTRA_MAX]:
+            out.append((plan.sec, nv.originallink or nv.link, nv.title))
+    return out
+
+
+@dataclass
+class SectionCandidates:
+    """
+    섹션별 수집 결과 (섹션 간 중복 제거/선정 전)
+    - hk_cands: 24시간 창 안의 HK 기사 전체 (최신순)
+    - nv_cands: 24시간 창 안의 네이버 기사 전체 (최신순)
+    """
+    sec: str
+    hk_raw_count: int
+    hk_cands: List[HKItem]
+    nv_cands: List[NaverNewsItem]
+    nv_used_sort: str
+
+
+@dataclass
+class SectionPlan:
+    """
+    섹션 준비 결과 (GPT 요약 전 단계까지)
+    - jobs[i]는 hk_sel[i]의 요약 요청 (다른 섹션 기사를 공유하면 None)
+    - shared[i] = (owner 섹션, owner HK 인덱스): 본문/요약을 가져올 곳 (DEDUP_MODE=share)
+    """
+    sec: str
+    hk_sel: List[HKItem]
+    hk_to_nv: Dict[int, Optional[NaverNewsItem]]
+    jobs: List[Optional[RewriteJob]]
+    extras: List[RenderItem]
+    shared: Dict[int, Tuple[str, int]] = field(default_factory=dict)
+    extra_nv: List[NaverNewsItem] = field(default_factory=list)   # extras[k]의 원본 네이버 기사
+
+
+def _candidates_to_dict(c: SectionCandidates) -> Dict[str, Any]:
+    return {
+        "sec": c.sec,
+        "hk_raw_count": c.hk_raw_count,
+        "hk_cands": [hkitem_to_dict(x) for x in c.hk_cands],
+        "nv_cands": [nvitem_to_dict(x) for x in c.nv_cands],
+        "nv_used_sort": c.nv_used_sort,
+    }
+
+
+def _candidates_from_dict(d: Dict[str, Any]) -> SectionCandidates:
+    return SectionCandidates(
+        sec=d["sec"],
+        hk_raw_count=int(d.get("hk_raw_count") or 0),
+        hk_cands=[hkitem_from_dict(x) for x in d.get("hk_cands") or []],
+        nv_cands=[nvitem_from_dict(x) for x in d.get("nv_cands") or []],
+        nv_used_sort=d.get("nv_used_sort") or "",
+    )
+
+
+def _search_naver_section(
+    sec: str,
+    query: str,
+    naver_api: NaverNewsSearchAPI,
+    w_start,
+    w_end,
+    logger,
+) -> Tuple[List[NaverNewsItem], str]:
+    """
+    섹션 단독 네이버 검색 (NAVER_SEARCH_MODE에 따라 speculative / sequential) → (윈도우 안 후보, 사용한 정렬)
+    """
+    nv_filtered: List[NaverNewsItem] = []
+    nv_used_sort = ""
+    if NAVER_SEARCH_MODE == "speculative":
+        # sim/date 동시 요청 → 선호 규칙(sim 충분하면 sim, 아니면 date)으로 합침
+        nv_filtered, nv_used_sort = naver_api.search_speculative(
+            query=query, need=NAVER_TOP_N, not_before=w_start, not_after=w_end, keep=is_naver_news_link,
+        )
+        by_sort: Dict[str, int] = {}
+        for x in nv_filtered:
+            by_sort[x.source_sort] = by_sort.get(x.source_sort, 0) + 1
+        logger.info(f"[NAVER_FETCH] {sec} speculative used={nv_used_sort} filtered={len(nv_filtered)} by_sort={by_sort}")
+    else:
+        items, used = naver_api.search_sim_then_date(query=query, display=100)
+        items = items or []
+        nv_used_sort = used
+        logger.info(f"[NAVER_FETCH] {sec} primary_sort_used={used} raw={len(items)}")
+        logger.info(f"[NAVER_DEBUG] {sec} type(items)={type(items)}")
+
+        items = [x for x in items if is_naver_news_link(x)]
+        nv_filtered = [x for x in items if _within_window(x.pubdate_kst, w_start, w_end)]
+        logger.info(f"[NAVER_FILTER] {sec} after_window filtered={len(nv_filtered)}")
+
+        if len(nv_filtered) < NAVER_TOP_N:
+            logger.info(f"[NAVER_FALLBACK] {sec} filtered<{NAVER_TOP_N}. fallback to sort=date with SAME query='{query}'")
+            # 최신순 페이지를 윈도우 시작 시각에 닿거나 필요 수 + 여유분이 모일 때까지 이어서 조회 (링크/윈도우 필터·중복 제거 포함)
+            nv_filtered = naver_api.search_window(
+                query=query, sort="date", not_before=w_start, not_after=w_end, keep=is_naver_news_link,
+                limit=NAVER_TOP_N + NAVER_FETCH_MARGIN,
+            )
+            nv_used_sort = "date"
+            logger.info(f"[NAVER_FILTER] {sec} after_window(filtered by date, paged) filtered={len(nv_filtered)}")
+    return nv_filtered, nv_used_sort
+
+
+def _collect_section(
+    sec: str,
+    logger,
+    naver_api: Optional[NaverNewsSearchAPI],
+    w_start,
+    w_end,
+    history: Optional[PublishedHistory] = None,
+    group: Optional["Future[Tuple[Dict[str, List[NaverNewsItem]], str]]"] = None,
+) -> SectionCandidates:
+    """
+    한 섹션의 RSS + 네이버 후보 수집 (섹션 간 공유 상태가 없으므로 스레드에서 병렬 실행 가능)
+    history: 이미 발송한 기사는 본문 수집/요약 전에 제외 (읽기 전용)
+    group: 이 섹션이 포함된 묶음 검색(search_group) 결과 future. RSS를 받은 뒤 기다림
+    """
+    with span("section.collect", section=sec) as sp:
+        logger.info(f"[SECTION] {sec} started.")
+
+        hk_raw = fetch_hankyung_rss(sec, not_before=w_start)
+        hk_cands = _select_latest(hk_raw, w_start, w_end, len(hk_raw), history)
+        if history:
+            in_window = sum(1 for x in hk_raw if _within_window(x.published_kst, w_start, w_end))
+            logger.info(f"[HISTORY] {sec} HK skipped already published={in_window - len(hk_cands)}")
+
+        nv_filtered: List[NaverNewsItem] = []
+        nv_used_sort = ""
+
+        query = NAVER_QUERIES.get(sec, sec)
+        logger.info(f"[NAVER_QUERY] {sec} query='{query}' (from NAVER_QUERIES.get(sec, sec))")
+
+        if naver_api:
+            try:
+                routed: Optional[List[NaverNewsItem]] = None
+                if group is not None:
+                    try:
+                        by_sec, group_used = group.result()
+                        routed = by_sec.get(sec) or []
+                        logger.info(f"[NAVER_GROUP] {sec} routed={len(routed)} (combined search used={group_used})")
+                    except Exception as e:
+                        logger.warning(f"[NAVER_GROUP] {sec} combined search failed: {e}. fallback to section query.")
+
+                fresh = len([x for x in routed or [] if not (history and history.contains(x.originallink or x.link, x.title))])
+                if routed is not None and fresh >= NAVER_TOP_N:
+                    nv_filtered, nv_used_sort = routed, f"group:{group_used}"
+                else:
+                    if routed is not None:
+                        logger.info(f"[NAVER_GROUP] {sec} routed(unpublished)={fresh}<{NAVER_TOP_N}. fallback to section query='{query}'")
+                    nv_filtered, nv_used_sort = _search_naver_section(sec, query, naver_api, w_start, w_end, logger)
+                    if routed:
+                        # 묶음 검색에서 이미 분류된 후보도 버리지 않고 뒤에 합침
+                        seen = {normalize_url(x.originallink or x.link) for x in nv_filtered}
+                        nv_filtered += [x for x in routed if normalize_url(x.originallink or x.link) not in seen]
+            except (NaverQuotaExceeded, NaverRateLimited) as e:
+                # 한도 문제는 재시도해도 그대로 → attempt를 실패시키지 않고 네이버 후보 없이 진행
+                logger.warning(f"[NAVER_QUOTA] {sec} naver search unavailable ({type(e).__name__}: {e}). continue without naver.")
+                nv_filtered, nv_used_sort = [], ""
+
+            if history:
+                before = len(nv_filtered)
+                nv_filtered = [x for x in nv_filtered if not history.contains(x.originallink or x.link, x.title)]
+                logger.info(f"[HISTORY] {sec} NV skipped already published={before - len(nv_filtered)}")
+
+            nv_filtered.sort(key=lambda x: x.pubdate_kst or 0, reverse=True)
+        else:
+            logger.info(f"[NAVER] {sec} skipped.")
+
+        sp.set(hk_raw=len(hk_raw), hk_cands=len(hk_cands), nv_cands=len(nv_filtered))
+        return SectionCandidates(
+            sec=sec, hk_raw_count=len(hk_raw), hk_cands=hk_cands,
+            nv_cands=nv_filtered, nv_used_sort=nv_used_sort,
+        )
+
+
+def _select_sections(
+    cands: Dict[str, SectionCandidates],
+    logger,
+) -> Dict[str, Tuple[List[HKItem], Dict[int, Tuple[str, int]], List[NaverNewsItem]]]:
+    """
+    섹션 간 중복 제거 후 섹션별 (hk_sel, shared, nv_sel) 선정
+    DEDUP_SECTION_PRIORITY 순서로 결정하므로 스레드 완료 순서와 무관하게 항상 같은 결과
+    - 1단계: 전체 섹션 HK 선정 (HK 중복 색인 완성)
+    - 2단계: 네이버 후보 선정. 다른 섹션이 실은 HK 기사의 네이버 사본(같은 정규화 URL/제목 Jaccard 기준)은 제외
+      (같은 섹션이 실은 HK 기사의 사본은 관련 기사 매칭에 쓰이므로 유지)
+    """
+    hk_index: DedupIndex[Tuple[str, int]] = DedupIndex()
+    nv_index: DedupIndex[str] = DedupIndex()
+    # HK 기사(owner) → 그 기사를 싣는 섹션들 (share 모드면 owner 외 섹션도 포함)
+    carriers: Dict[Tuple[str, int], Set[str]] = {}
+    hk_by_sec: Dict[str, Tuple[List[HKItem], Dict[int, Tuple[str, int]]]] = {}
+    out: Dict[str, Tuple[List[HKItem], Dict[int, Tuple[str, int]], List[NaverNewsItem]]] = {}
+
+    for sec in DEDUP_SECTION_PRIORITY:
+        c = cands[sec]
+        hk_sel: List[HKItem] = []
+        shared: Dict[int, Tuple[str, int]] = {}
+        for hk in c.hk_cands:
+            if len(hk_sel) >= HK_TOP_N:
+                break
+            owner = hk_index.find(hk.link, hk.title) if DEDUP_MODE != "off" else None
+            if owner is None:
+                key = (sec, len(hk_sel))
+                hk_index.add(hk.link, hk.title, key)
+                carriers[key] = {sec}
+                hk_sel.append(hk)
+            elif DEDUP_MODE == "share" and owner[0] != sec:
+                logger.info(f"[DEDUP] {sec} HK share with {owner[0]} HK#{owner[1]} title='{hk.title[:60]}'")
+                shared[len(hk_sel)] = owner
+                carriers[owner].add(sec)
+                hk_sel.append(hk)
+            else:
+                logger.info(f"[DEDUP] {sec} HK skip (owned by {owner[0]} HK#{owner[1]}) title='{hk.title[:60]}'")
+        hk_by_sec[sec] = (hk_sel, shared)
+
+    for sec in DEDUP_SECTION_PRIORITY:
+        c = cands[sec]
+        hk_sel, shared = hk_by_sec[sec]
+        nv_sel: List[NaverNewsItem] = []
+        for nv in c.nv_cands:
+            if len(nv_sel) >= NAVER_TOP_N:
+                break
+            url = nv.originallink or nv.link
+            if DEDUP_MODE != "off":
+                owner = hk_index.find(url, nv.title)
+                if owner is not None and sec not in carriers[owner]:
+                    logger.info(f"[DEDUP] {sec} NV skip (copy of {owner[0]} HK#{owner[1]}) title='{nv.title[:60]}'")
+                    continue
+            if DEDUP_MODE == "skip":
+                owner_sec = nv_index.find(url, nv.title)
+                if owner_sec is not None:
+                    logger.info(f"[DEDUP] {sec} NV skip (owned by {owner_sec}) title='{nv.title[:60]}'")
+                    continue
+                nv_index.add(url, nv.title, sec)
+            nv_sel.append(nv)
+
+        logger.info(f"[HK] {sec} raw={c.hk_raw_count} selected={len(hk_sel)} shared={len(shared)}")
+        _log_top_titles(logger, "HK_SEL", sec, hk_sel, limit=3)
+        if c.nv_used_sort:
+            logger.info(f"[NAVER_FINAL] {sec} used_sort={c.nv_used_sort} final={len(nv_sel)}")
+        out[sec] = (hk_sel, shared, nv_sel)
+
+    logger.info(f"[DEDUP] mode={DEDUP_MODE} priority={DEDUP_SECTION_PRIORITY} unique_hk={len(hk_index)}")
+    return out
+
+
+def _plan_section(
+    sec: str,
+    hk_sel: List[HKItem],
+    shared: Dict[int, Tuple[str, int]],
+    nv_filtered: List[NaverNewsItem],
+    logger,
+) -> SectionPlan:
+    """
+    선정된 HK/네이버 기사 매칭 + extras 구성 (요약 요청은 _attach_jobs에서 채움)
+    """
+    used_nv_idx = set()
+    hk_to_nv: Dict[int, Optional[NaverNewsItem]] = {}
+
+    with span("match", section=sec, hk=len(hk_sel), nv=len(nv_filtered)):
+        matches = match_titles(
+            [x.title for x in hk_sel], [x.title for x in nv_filtered],
+            method=MATCH_METHOD, assignment=MATCH_ASSIGNMENT,
+        )
+    for m in matches:
+        hk = hk_sel[m.hk_idx]
+        if m.matched:
+            hk_to_nv[m.hk_idx] = nv_filtered[m.nv_idx]
+            used_nv_idx.add(m.nv_idx)
+            logger.info(
+                f"[MATCH_DETAIL] {sec} HK#{m.hk_idx} matched NV#{m.nv_idx} score={m.score:.2f} "
+                f"HK='{hk.title[:60]}' | NV='{nv_filtered[m.nv_idx].title[:60]}'"
+            )
+        else:
+            hk_to_nv[m.hk_idx] = None
+            logger.info(
+                f"[MATCH_DETAIL] {sec} HK#{m.hk_idx} no match (best={m.score:.2f}) "
+                f"HK='{hk.title[:60]}'"
+            )
+
+    overlap = sum(1 for v in hk_to_nv.values() if v is not None)
+    logger.info(
+        f"[MATCH] {sec} overlap={overlap} (out of {len(hk_sel)}) "
+        f"unmatched_hk={len(hk_sel) - overlap} unmatched_nv={len(nv_filtered) - len(used_nv_idx)} "
+        f"assignment={MATCH_ASSIGNMENT}"
+    )
+
+    extras: List[RenderItem] = []
+    extra_nv: List[NaverNewsItem] = []
+    for j, nv in enumerate(nv_filtered):
+        if j in used_nv_idx:
+            continue
+        extra_nv.append(nv)
+
+        dt = fmt_dt(nv.pubdate_kst) if nv.pubdate_kst else "NO_DATE"
+        source_line = f"출처/작성시간: <a href='{nv.link}'>네이버 뉴스({dt})</a>"
+
+        extras.append(RenderItem(
+            section=sec,
+            title=f"{sec} | {nv.title}",
+            source_line=source_line,
+            body_html="",
+            main_links_html="",
+            related_links_html="",
+            is_extra=True,
+        ))
+
+    logger.info(f"[EXTRA] {sec} nv_total={len(nv_filtered)} used_for_match={len(used_nv_idx)} extras={len(extras)}")
+    _log_top_titles(logger, "EXTRA_SEL", sec, extras, limit=3)
+
+    return SectionPlan(
+        sec=sec, hk_sel=hk_sel, hk_to_nv=hk_to_nv, jobs=[], extras=extras,
+        shared=shared, extra_nv=extra_nv,
+    )
+
+
+def _attach_jobs(
+    plans: List[SectionPlan],
+    logger,
+    article_cache: Optional[ArticleCache],
+    store: Optional[StateStore] = None,
+    run_date: str = "",
+) -> None:
+    """
+    전체 섹션의 HK 본문을 정규화 URL 기준 1회씩만 수집하고 요약 요청(jobs)을 채움
+    store가 있으면 이전 attempt에서 받은 본문(체크포인트)은 다시 받지 않음
+    """
+    text_by_url: Dict[str, str] = {}
+    if store:
+        text_by_url = {k: v["text"] for k, v in store.load_checkpoints(run_date, _CKPT_ARTICLE).items()}
+
+    urls: List[str] = []
+    seen = set()
+    for plan in plans:
+        for i, hk in enumerate(plan.hk_sel):
+            key = normalize_url(hk.link)
+            if i not in plan.shared and key not in seen and key not in text_by_url:
+                seen.add(key)
+                urls.append(hk.link)
+
+    with span("article.fetch_all", urls=len(urls)):
+        fetched = fetch_articles_text(
+            urls,
+            max_in_flight=ARTICLE_FETCH_MAX_IN_FLIGHT,
+            timeout_sec=ARTICLE_FETCH_TIMEOUT_SEC,
+            cache=article_cache,
+        )
+    fresh = {normalize_url(r.url): r.text for r in fetched if r.ok}
+    text_by_url.update(fresh)
+    if store and fresh:
+        store.save_checkpoints(run_date, _CKPT_ARTICLE, {k: {"text": v} for k, v in fresh.items()})
+    failed = [r for r in fetched if not r.ok]
+    for r in failed:
+        logger.error(f"[FETCH] failed url={r.url} err={r.error}")
+    if failed:
+        # 본문 없이 요약할 수 없으므로 기존처럼 attempt 실패로 처리 (받은 본문은 체크포인트로 남음)
+        raise failed[0].error
+    logger.info(f"[FETCH] fetched={len(urls)} resumed={len(text_by_url) - len(urls)} (sections={len(plans)})")
+
+    for plan in plans:
+        sec = plan.sec
+        plan.jobs = []
+        for i, hk in enumerate(plan.hk_sel):
+            if i in plan.shared:
+                owner_sec, owner_i = plan.shared[i]
+                logger.info(f"[FETCH] {sec} HK#{i} shared from {owner_sec} HK#{owner_i}")
+                plan.jobs.append(None)
+                continue
+
+            published = fmt_dt(hk.published_kst) if hk.published_kst else "NO_DATE"
+            nv = plan.hk_to_nv.get(i)
+
+            hk_text = text_by_url[normalize_url(hk.link)]
+            logger.info(f"[FETCH] {sec} HK#{i} text_len={len(hk_text)} url={hk.link}")
+
+            with span("compact", section=sec, item=i) as sp:
+                hk_text, tok_before, tok_after = compact_article(hk.title, hk_text, PROMPT_TOKEN_BUDGET)
+                sp.set(tokens_before=tok_before, tokens_after=tok_after)
+            logger.info(f"[COMPACT] {sec} HK#{i} tokens {tok_before} -> {tok_after} (budget={PROMPT_TOKEN_BUDGET})")
+
+            related_texts: List[str] = []
+            if nv:
+                if (nv.description or "").strip():
+                    related_texts.append((nv.description or "").strip())
+                    logger.info(f"[RELATED_TEXT] {sec} HK#{i} add naver description len={len(related_texts[-1])}")
+                else:
+                    logger.info(f"[RELATED_TEXT] {sec} HK#{i} naver description empty.")
+            else:
+                logger.info(f"[RELATED_TEXT] {sec} HK#{i} no matched naver.")
+
+            plan.jobs.append(RewriteJob(
+                title=hk.title,
+                article_text=hk_text,
+                published_dt_str=published,
+                section=sec,
+                related_texts=related_texts,
+            ))
+
+
+def _render_section(plan: SectionPlan, bodies: List[str], logger) -> List[RenderItem]:
+    """
+    SectionPlan + GPT 요약 결과(body_html, hk_sel 순서)로 섹션 RenderItem 목록 구성
+    """
+    sec = plan.sec
+    render_items: List[RenderItem] = []
+
+    for i, hk in enumerate(plan.hk_sel):
+        published = fmt_dt(hk.published_kst) if hk.published_kst else "NO_DATE"
+        nv = plan.hk_to_nv.get(i)
+
+        if nv and nv.pubdate_kst:
+            src_line = f"출처/작성시간: 한국경제({published}), 네이버 뉴스({fmt_dt(nv.pubdate_kst)})"
+        else:
+            src_line = f"출처/작성시간: 한국경제({published})"
+
+        body_html = bodies[i]
+        logger.info(f"[GPT] {sec} HK#{i} body_html_len={len(body_html)}")
+
+        main_links_html = f"원문 링크: <a href='{hk.link}'>자세히 보기(한국경제)</a>"
+
+        rels: List[str] = []
+        if nv:
+            rels.append(f"<a href='{nv.link}'>관련기사1(네이버)</a>")
+
+        related_links_html = ""
+        if rels:
+            related_links_html = "관련기사: " + ", ".join(rels)
+
+        render_items.append(RenderItem(
+            section=sec,
+            title=f"{sec} | {hk.title}",
+            source_line=src_line,
+            body_html=body_html,
+            main_links_html=main_links_html,
+            related_links_html=related_links_html,
+            is_extra=False
+        ))
+
+    render_items.extend(plan.extras[:_EXTRA_MAX])
+
+    logger.info(f"[SECTION] {sec} done. render_items={len(render_items)} (main={len(plan.hk_sel)}, extra={min(len(plan.extras), _EXTRA_MAX)})")
+    return render_items
+
+
+def _write_profile(run_span: Span) -> None:
+    """
+    output/profile_<run_date>.json: 단계별 span 트리 + critical path + 이름별 합계
+    """
+    run_date = run_span.attrs.get("run_date")
+    if not PROFILE_ENABLED or not run_date or run_span.attrs.get("skipped"):
+        return
+    logger = setup_logger()
+    try:
+        path = TRACER.write_json(str(Path("output") / f"profile_{run_date}.json"), run_date=run_date)
+        logger.info(f"[PROFILE] saved: {path} total={run_span.duration:.1f}s")
+    except Exception as e:
+        logger.warning(f"[PROFILE] failed to save profile: {e}")
+
+
 def main():
+    TRACER.reset()
+    with span("run") as run_span:
+        try:
+            _run(run_span)
+        finally:
+            run_span.end = time.perf_counter()
+            _write_profile(run_span)
+
+
+def _run(run_span: Span):
     print("RUN.PY STARTED")
     logger = setup_logger()
-    now = now_kst()
+    now = fixture_now(now_kst())
     run_date = run_date_str(now)
+    run_span.set(run_date=run_date)
+    if FIXTURE_MODE != "off" or DRY_RUN:
+        logger.info(f"[FIXTURE] mode={FIXTURE_MODE} dry_run={DRY_RUN} now={fmt_dt(now)}")
     w_start, w_end = last_24h_window_from_now(now)
 
     recipients = list(RECIPIENTS or [])
@@ -112,232 +618,244 @@ def main():
     store = StateStore(STATE_DB_PATH)
     if store.is_success(run_date):
         logger.info(f"[{run_date}] Already SUCCESS. Exit without doing anything.")
+        run_span.set(skipped=True)
         return
 
+    # DRY_RUN 결과(가짜 응답/미발송)를 실제 실행이 이어받지 않도록 체크포인트 미사용
+    ckpt_store: Optional[StateStore] = store if CHECKPOINT_ENABLED and not DRY_RUN else None
+    if ckpt_store:
+        saved = ckpt_store.load_checkpoints(run_date, _CKPT_RUN).get("window")
+        if saved:
+            w_start = datetime.fromisoformat(saved["start"])
+            w_end = datetime.fromisoformat(saved["end"])
+            logger.info(f"[RESUME] reuse news window: {fmt_dt(w_start)} ~ {fmt_dt(w_end)}")
+        else:
+            ckpt_store.save_checkpoint(run_date, _CKPT_RUN, "window", {
+                "start": w_start.isoformat(), "end": w_end.isoformat(),
+            })
+
+    history: Optional[PublishedHistory] = None
+    if PUBLISHED_HISTORY_DAYS > 0:
+        history = store.load_published(run_date, PUBLISHED_HISTORY_DAYS)
+        logger.info(f"[HISTORY] loaded published items={len(history)} (last {PUBLISHED_HISTORY_DAYS} days)")
+
     naver_api: Optional[NaverNewsSearchAPI] = None
     if NAVER_CLIENT_ID and NAVER_CLIENT_SECRET:
-        naver_api = NaverNewsSearchAPI(NAVER_CLIENT_ID, NAVER_CLIENT_SECRET)
+        naver_cache: Optional[NaverSearchCache] = None
+        if NAVER_CACHE_DB_PATH:
+            naver_cache = NaverSearchCache(
+                NAVER_CACHE_DB_PATH, ttl_sec=NAVER_CACHE_TTL_SEC, max_entries=NAVER_CACHE_MAX_ENTRIES,
+                stale_sec=NAVER_CACHE_STALE_SEC,
+            )
+            logger.info(
+                f"[CACHE] naver cache={NAVER_CACHE_DB_PATH} ttl={NAVER_CACHE_TTL_SEC}s "
+                f"stale={NAVER_CACHE_STALE_SEC}s pruned={naver_cache.prune()}"
+            )
+        naver_api = NaverNewsSearchAPI(NAVER_CLIENT_ID, NAVER_CLIENT_SECRET, store=store, cache=naver_cache)
         logger.info("[NAVER] API enabled (client id/secret present).")
     else:
         logger.info("[NAVER] client id/secret missing. Naver part will be skipped.")
+    naver_keywords = section_keywords(SECTIONS, NAVER_QUERIES, NAVER_SECTION_KEYWORDS)
+
+    article_cache: Optional[ArticleCache] = None
+    if ARTICLE_CACHE_DB_PATH:
+        article_cache = ArticleCache(
+            ARTICLE_CACHE_DB_PATH,
+            ttl_sec=ARTICLE_CACHE_TTL_SEC,
+            max_age_sec=ARTICLE_CACHE_MAX_AGE_SEC,
+            max_bytes=ARTICLE_CACHE_MAX_MB * 1024 * 1024,
+        )
+        logger.info(f"[CACHE] article cache={ARTICLE_CACHE_DB_PATH} pruned={article_cache.prune()}")
+
+    llm_cache: Optional[ResponseCache] = None
+    if LLM_CACHE_DB_PATH:
+        llm_cache = ResponseCache(
+            LLM_CACHE_DB_PATH,
+            max_age_sec=LLM_CACHE_MAX_AGE_SEC,
+            max_bytes=LLM_CACHE_MAX_MB * 1024 * 1024,
+        )
+        logger.info(f"[CACHE] llm cache={LLM_CACHE_DB_PATH} pruned={llm_cache.prune()} bypass={LLM_CACHE_BYPASS}")
 
     last_error: Optional[Exception] = None
 
     for attempt in range(1, RETRY_MAX_ATTEMPTS + 1):
         try:
-            store.mark_running(run_date, attempt)
-            logger.info(f"[{run_date}] Attempt #{attempt} started. Status=RUNNING")
-
-            sections_render: Dict[str, List[RenderItem]] = {}
-
-            for sec in SECTIONS:
-                logger.info(f"[SECTION] {sec} started.")
-
-                hk_raw = fetch_hankyung_rss(sec)
-                hk_sel = _select_latest(hk_raw, w_start, w_end, HK_TOP_N)
-
-                logger.info(f"[HK] {sec} raw={len(hk_raw)} selected={len(hk_sel)}")
-                _log_top_titles(logger, "HK_SEL", sec, hk_sel, limit=3)
-
-                nv_filtered: List[NaverNewsItem] = []
-                nv_used_sort = ""
-
-                query = NAVER_QUERIES.get(sec, sec)
-                logger.info(f"[NAVER_QUERY] {sec} query='{query}' (from NAVER_QUERIES.get(sec, sec))")
-
+            with span("attempt", attempt=attempt):
+                store.mark_running(run_date, attempt)
+                logger.info(f"[{run_date}] Attempt #{attempt} started. Status=RUNNING")
+
+                sections_render: Dict[str, List[RenderItem]] = {}
+
+                cands: Dict[str, SectionCandidates] = {}
+                if ckpt_store:
+                    for sec, d in ckpt_store.load_checkpoints(run_date, _CKPT_COLLECT).items():
+                        if sec in SECTIONS:
+                            cands[sec] = _candidates_from_dict(d)
+                    if cands:
+                        logger.info(f"[RESUME] collect reused sections={list(cands)}")
+
+                todo = [sec for sec in SECTIONS if sec not in cands]
+                collect_errors: List[Exception] = []
+                with span("collect", sections=len(todo)), ExitStack() as stack:
+                    # 묶음 네이버 검색은 별도 풀에서 먼저 시작 → 섹션 스레드는 RSS를 받은 뒤 결과를 기다림
+                    group_of: Dict[str, Future] = {}
+                    if naver_api and NAVER_QUERY_GROUP_SIZE > 1 and len(todo) > 1:
+                        groups = plan_query_groups(todo, NAVER_QUERIES, NAVER_QUERY_GROUP_SIZE)
+                        logger.info(f"[NAVER_GROUP] {len(todo)} section(s) -> {len(groups)} combined search(es): {[g.query for g in groups]}")
+                        gx = stack.enter_context(ThreadPoolExecutor(max_workers=len(groups), thread_name_prefix="naver-group"))
+                        for g in groups:
+                            fut = gx.submit(
+                                bind(search_group), naver_api, g, naver_keywords, NAVER_TOP_N,
+                                w_start, w_end, is_naver_news_link,
+                            )
+                            for sec in g.sections:
+                                group_of[sec] = fut
+                    with ThreadPoolExecutor(max_workers=SECTION_MAX_WORKERS, thread_name_prefix="section") as ex:
+                        futures = {
+                            sec: ex.submit(
+                                bind(_collect_section), sec, logger, naver_api, w_start, w_end, history, group_of.get(sec),
+                            )
+                            for sec in todo
+                        }
+                        for sec in todo:
+                            try:
+                                cands[sec] = futures[sec].result()
+                            except Exception as e:
+                                collect_errors.append(e)
+                                continue
+                            if ckpt_store:
+                                ckpt_store.save_checkpoint(run_date, _CKPT_COLLECT, sec, _candidates_to_dict(cands[sec]))
                 if naver_api:
-                    items, used = naver_api.search_sim_then_date(query=query, display=100)
-                    items = items or []
-                    nv_used_sort = used
-                    logger.info(f"[NAVER_FETCH] {sec} primary_sort_used={used} raw={len(items)}")
-                    logger.info(f"[NAVER_DEBUG] {sec} type(items)={type(items)}")
-
-                    from src.naver_search_api import is_naver_news_link
-                    items = [x for x in items if is_naver_news_link(x)]
-                    nv_filtered = [x for x in items if _within_window(x.pubdate_kst, w_start, w_end)]
-                    logger.info(f"[NAVER_FILTER] {sec} after_window filtered={len(nv_filtered)}")
-
-                    if len(nv_filtered) < NAVER_TOP_N:
-                        logger.info(f"[NAVER_FALLBACK] {sec} filtered<{NAVER_TOP_N}. fallback to sort=date with SAME query='{query}'")
-                        items2 = naver_api.search_date(query=query, display=100)
-                        items2 = items2 or []
-                        logger.info(f"[NAVER_FETCH] {sec} fallback_sort=date raw={len(items2)}")
-                        items2 = [x for x in items2 if is_naver_news_link(x)]
-                        nv_filtered = [x for x in items2 if _within_window(x.pubdate_kst, w_start, w_end)]
-                        nv_used_sort = "date"
-                        logger.info(f"[NAVER_FILTER] {sec} after_window(filtered by date) filtered={len(nv_filtered)}")
-
-                    nv_filtered.sort(key=lambda x: x.pubdate_kst or 0, reverse=True)
-                    nv_filtered = nv_filtered[:NAVER_TOP_N]
-                    logger.info(f"[NAVER_FINAL] {sec} used_sort={nv_used_sort} final={len(nv_filtered)}")
-                else:
-                    logger.info(f"[NAVER] {sec} skipped.")
-
-                used_nv_idx = set()
-                hk_to_nv: Dict[int, Optional[NaverNewsItem]] = {}
-
-                for i, hk in enumerate(hk_sel):
-                    best_j = -1
-                    best_score = 0.0
-                    for j, nv in enumerate(nv_filtered):
-                        if j in used_nv_idx:
+                    logger.info(f"[NAVER] usage today={naver_api.calls_today} budget={naver_api.daily_budget} run_stats={naver_api.stats}")
+                if collect_errors:
+                    raise collect_errors[0]
+
+                # 섹션 간 중복 제거/선정은 스레드 밖에서 순서대로 (결과가 항상 같도록)
+                with span("select"):
+                    selections = _select_sections(cands, logger)
+                plans = [_plan_section(sec, *selections[sec], logger) for sec in SECTIONS]
+                _attach_jobs(plans, logger, article_cache, ckpt_store, run_date)
+
+                body_by: Dict[Tuple[str, int], str] = {}
+                done_rw = ckpt_store.load_checkpoints(run_date, _CKPT_REWRITE) if ckpt_store else {}
+                pending: List[Tuple[str, int, RewriteJob]] = []
+                for plan in plans:
+                    for i, job in enumerate(plan.jobs):
+                        if job is None:
                             continue
-                        score = _jaccard(hk.title, nv.title)
-                        if score > best_score:
-                            best_score = score
-                            best_j = j
-
-                    if best_j >= 0 and best_score >= 0.35:
-                        hk_to_nv[i] = nv_filtered[best_j]
-                        used_nv_idx.add(best_j)
-                        logger.info(
-                            f"[MATCH_DETAIL] {sec} HK#{i} matched NV#{best_j} score={best_score:.2f} "
-                            f"HK='{hk.title[:60]}' | NV='{nv_filtered[best_j].title[:60]}'"
-                        )
-                    else:
-                        hk_to_nv[i] = None
-                        logger.info(
-                            f"[MATCH_DETAIL] {sec} HK#{i} no match (best={best_score:.2f}) "
-                            f"HK='{hk.title[:60]}'"
-                        )
-
-                overlap = sum(1 for v in hk_to_nv.values() if v is not None)
-                logger.info(f"[MATCH] {sec} overlap={overlap} (out of {len(hk_sel)})")
-
-                render_items: List[RenderItem] = []
-
-                for i, hk in enumerate(hk_sel):
-                    published = fmt_dt(hk.published_kst) if hk.published_kst else "NO_DATE"
-                    nv = hk_to_nv.get(i)
-
-                    if nv and nv.pubdate_kst:
-                        src_line = f"출처/작성시간: 한국경제({published}), 네이버 뉴스({fmt_dt(nv.pubdate_kst)})"
-                    else:
-                        src_line = f"출처/작성시간: 한국경제({published})"
-
-                    hk_text = fetch_article_text(hk.link)
-                    logger.info(f"[FETCH] {sec} HK#{i} text_len={len(hk_text)} url={hk.link}")
-
-                    related_texts: List[str] = []
-                    if nv:
-                        if (nv.description or "").strip():
-                            related_texts.append((nv.description or "").strip())
-                            logger.info(f"[RELATED_TEXT] {sec} HK#{i} add naver description len={len(related_texts[-1])}")
+                        d = done_rw.get(f"{plan.sec}#{i}")
+                        if d and d.get("title") == job.title:
+                            body_by[(plan.sec, i)] = d["body_html"]
                         else:
-                            logger.info(f"[RELATED_TEXT] {sec} HK#{i} naver description empty.")
-                    else:
-                        logger.info(f"[RELATED_TEXT] {sec} HK#{i} no matched naver.")
-
-                    body_html = rewrite_article_grounded(
-                        title=hk.title,
-                        article_text=hk_text,
-                        published_dt_str=published,
-                        section=sec,
-                        related_texts=related_texts,
+                            pending.append((plan.sec, i, job))
+                if body_by:
+                    logger.info(f"[RESUME] rewrite reused={len(body_by)}")
+
+                def _save_rewrite(k: int, body_html: str) -> None:
+                    sec, i, job = pending[k]
+                    if ckpt_store:
+                        ckpt_store.save_checkpoint(run_date, _CKPT_REWRITE, f"{sec}#{i}", {
+                            "title": job.title, "body_html": body_html,
+                        })
+
+                # 남은 요약 요청을 한 번에 동시 처리 (RPM/TPM 스케줄러)
+                logger.info(f"[GPT] rewriting {len(pending)} article(s) concurrently")
+                with span("gpt.rewrite_all", jobs=len(pending), reused=len(body_by)):
+                    bodies = rewrite_articles_grounded(
+                        [job for _, _, job in pending],
+                        cache=llm_cache, bypass_cache=LLM_CACHE_BYPASS, on_result=_save_rewrite,
                     )
-                    logger.info(f"[GPT] {sec} HK#{i} body_html_len={len(body_html)}")
-
-                    main_links_html = f"원문 링크: <a href='{hk.link}'>자세히 보기(한국경제)</a>"
-
-                    rels: List[str] = []
-                    if nv:
-                        rels.append(f"<a href='{nv.link}'>관련기사1(네이버)</a>")
-
-                    related_links_html = ""
-                    if rels:
-                        related_links_html = "관련기사: " + ", ".join(rels)
-
-                    render_items.append(RenderItem(
-                        section=sec,
-                        title=f"{sec} | {hk.title}",
-                        source_line=src_line,
-                        body_html=body_html,
-                        main_links_html=main_links_html,
-                        related_links_html=related_links_html,
-                        is_extra=False
-                    ))
-
-                extras: List[RenderItem] = []
-                for j, nv in enumerate(nv_filtered):
-                    if j in used_nv_idx:
-                        continue
-
-                    dt = fmt_dt(nv.pubdate_kst) if nv.pubdate_kst else "NO_DATE"
-                    source_line = f"출처/작성시간: <a href='{nv.link}'>네이버 뉴스({dt})</a>"
-
-                    extras.append(RenderItem(
-                        section=sec,
-                        title=f"{sec} | {nv.title}",
-                        source_line=source_line,
-                        body_html="",
-                        main_links_html="",
-                        related_links_html="",
-                        is_extra=True,
-                    ))
-
-                logger.info(f"[EXTRA] {sec} nv_total={len(nv_filtered)} used_for_match={len(used_nv_idx)} extras={len(extras)}")
-                _log_top_titles(logger, "EXTRA_SEL", sec, extras, limit=3)
-
-                render_items.extend(extras[:2])
-
-                sections_render[sec] = render_items
-                logger.info(f"[SECTION] {sec} done. render_items={len(render_items)} (main={len(hk_sel)}, extra={min(len(extras), 2)})")
-
-            date_title = fmt_date(now)
-            blog_title = BLOG_TITLE_FMT.format(date=date_title)
-            mail_subject = MAIL_SUBJECT_FMT.format(date=date_title)
-
-            logger.info(f"[RENDER] building HTML title='{blog_title}' subject='{mail_subject}'")
-            newsletter_html = render_newsletter_html(
-                top_note_html=TOP_NOTE,
-                title=blog_title,
-                sections=sections_render,
-            )
-            logger.info(f"[RENDER] HTML built len={len(newsletter_html)}")
-
-            out_dir = Path("output")
-            out_dir.mkdir(exist_ok=True)
-
-            html_path = out_dir / f"newsletter_{run_date}.html"
-            html_path.write_text(newsletter_html, encoding="utf-8")
-            logger.info(f"[FILE] newsletter html saved: {html_path}")
-
-            txt_path = out_dir / f"newsletter_{run_date}.txt"
-            blog_tags = "경제, 한국경제, 미국경제, IT, Tech, 뉴스, 네이버, 미국, 엔비디아, 구글"
-            separator = "\n\n"
-            txt_content = f"{blog_title}{separator}{blog_tags}{separator}{newsletter_html}"
-            txt_path.write_text(txt_content, encoding="utf-8")
-            logger.info(f"[FILE] newsletter txt saved: {txt_path}")
-
-            if recipients:
-                logger.info(f"[MAIL] send start to={recipients} subject='{mail_subject}' html_len={len(newsletter_html)}")
-                send_mail_via_outlook_app(
-                    to_addrs=recipients,
-                    subject=mail_subject,
-                    html_body=newsletter_html,
-                )
-                logger.info("[MAIL] send success.")
-                logger.info(f"[{run_date}] Mail sent successfully (HTML).")
-            else:
-                logger.info(f"[{run_date}] Recipients empty. Skip sending mail.")
-
-            # ✅ TXT 열기 (왼쪽 스냅)
-            txt_proc = subprocess.Popen(["notepad.exe", str(txt_path)])
-            time.sleep(0.8)
-            
-            # 창 왼쪽 스냅 (notepad가 활성창이어야 함)
-            try:
-                import pyautogui
-                pyautogui.hotkey("win", "left")
-            except Exception as e:
-                logger.warning(f"[SNAP] left snap failed (install pyautogui?): {e}")
+                for (sec, i, _), body_html in zip(pending, bodies):
+                    body_by[(sec, i)] = body_html
+
+                with span("render") as sp:
+                    for plan in plans:
+                        sec_bodies = [body_by[plan.shared.get(i, (plan.sec, i))] for i in range(len(plan.hk_sel))]
+                        sections_render[plan.sec] = _render_section(plan, sec_bodies, logger)
+
+                    date_title = fmt_date(now)
+                    blog_title = BLOG_TITLE_FMT.format(date=date_title)
+                    mail_subject = MAIL_SUBJECT_FMT.format(date=date_title)
+
+                    logger.info(f"[RENDER] building HTML title='{blog_title}' subject='{mail_subject}'")
+                    newsletter_html = render_newsletter_html(
+                        top_note_html=TOP_NOTE,
+                        title=blog_title,
+                        sections=sections_render,
+                    )
+                    logger.info(f"[RENDER] HTML built len={len(newsletter_html)}")
+                    sp.set(bytes=len(newsletter_html.encode("utf-8")))
+
+                with span("file.write"):
+                    out_dir = Path("output")
+                    out_dir.mkdir(exist_ok=True)
+
+                    html_path = out_dir / f"newsletter_{run_date}.html"
+                    html_path.write_text(newsletter_html, encoding="utf-8")
+                    logger.info(f"[FILE] newsletter html saved: {html_path}")
+
+                    txt_path = out_dir / f"newsletter_{run_date}.txt"
+                    blog_tags = "경제, 한국경제, 미국경제, IT, Tech, 뉴스, 네이버, 미국, 엔비디아, 구글"
+                    separator = "\n\n"
+                    txt_content = f"{blog_title}{separator}{blog_tags}{separator}{newsletter_html}"
+                    txt_path.write_text(txt_content, encoding="utf-8")
+                    logger.info(f"[FILE] newsletter txt saved: {txt_path}")
+
+                mail_sent = bool(ckpt_store and ckpt_store.load_checkpoints(run_date, _CKPT_MAIL).get("sent"))
+                if mail_sent:
+                    logger.info("[RESUME] mail already sent in a previous attempt. skip sending.")
+                elif DRY_RUN:
+                    logger.info(f"[DRY_RUN] skip sending mail to={recipients}")
+                elif recipients:
+                    logger.info(f"[MAIL] send start to={recipients} subject='{mail_subject}' html_len={len(newsletter_html)}")
+                    with span("mail.send", recipients=len(recipients)):
+                        # win32com은 Windows 전용 → 실제 발송할 때만 import
+                        from src.outlook_app_mailer import send_mail_via_outlook_app
+                        send_mail_via_outlook_app(
+                            to_addrs=recipients,
+                            subject=mail_subject,
+                            html_body=newsletter_html,
+                        )
+                    logger.info("[MAIL] send success.")
+                    if ckpt_store:
+                        ckpt_store.save_checkpoint(run_date, _CKPT_MAIL, "sent", {"to": recipients})
+                    logger.info(f"[{run_date}] Mail sent successfully (HTML).")
+                else:
+                    logger.info(f"[{run_date}] Recipients empty. Skip sending mail.")
 
-            # ✅ 티스토리 로그인 스크립트 실행 (별도 프로세스)
-            _launch_tistory_login_only(logger, script_path="src/tistory_login_only.py")
+                # 발송(파일 저장)까지 끝난 기사는 다음 실행부터 후보에서 제외 (DRY_RUN은 발송하지 않았으므로 기록 안 함)
+                if DRY_RUN:
+                    logger.info("[DRY_RUN] skip marking published items")
+                else:
+                    marked = store.mark_published(run_date, _published_items(plans))
+                    logger.info(f"[HISTORY] marked published items={marked}")
 
-            store.mark_success(run_date, attempt)
-            logger.info(f"[{run_date}] FINAL SUCCESS after {attempt} attempt(s).")
-            return
+                if DRY_RUN:
+                    logger.info("[DRY_RUN] skip notepad / tistory launch")
+                else:
+                    # ✅ TXT 열기 (왼쪽 스냅)
+                    txt_proc = subprocess.Popen(["notepad.exe", str(txt_path)])
+                    time.sleep(0.8)
+
+                    # 창 왼쪽 스냅 (notepad가 활성창이어야 함)
+                    try:
+                        import pyautogui
+                        pyautogui.hotkey("win", "left")
+                    except Exception as e:
+                        logger.warning(f"[SNAP] left snap failed (install pyautogui?): {e}")
+
+                    # ✅ 티스토리 로그인 스크립트 실행 (별도 프로세스)
+                    with span("tistory.launch"):
+                        _launch_tistory_login_only(logger, script_path="src/tistory_login_only.py")
+
+                if DRY_RUN:
+                    # SUCCESS로 남기면 같은 날 실제 실행이 "Already SUCCESS"로 끝나버림
+                    logger.info("[DRY_RUN] skip marking run SUCCESS")
+                else:
+                    store.mark_success(run_date, attempt)
+                    store.clear_checkpoints(run_date)
+                logger.info(f"[{run_date}] FINAL SUCCESS after {attempt} attempt(s).")
+                return
 
         except Exception as e:
             last_error = e
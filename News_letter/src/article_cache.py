@@ -0,0 +1,123 @@
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from src.sqlite_cache import SQLiteCache
+
+# 캐시 키에서 제외할 추적용 쿼리 파라미터
+_TRACKING_PARAMS = {"utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content", "fbclid", "gclid"}
+
+
+def normalize_url(url: str) -> str:
+    """
+    캐시 키용 URL 정규화: scheme/host 소문자, www 제거, fragment/추적 파라미터 제거,
+    쿼리 정렬, 끝 슬래시 제거
+    """
+    parts = urlsplit((url or "").strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k not in _TRACKING_PARAMS)
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower() or "https", host, path, urlencode(query), ""))
+
+
+@dataclass
+class CachedArticle:
+    url: str
+    text: str
+    content_hash: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+    def is_fresh(self, ttl_sec: int) -> bool:
+        return (time.time() - self.fetched_at) < ttl_sec
+
+    def validators(self) -> Dict[str, str]:
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ArticleCache(SQLiteCache):
+    """
+    추출된 기사 본문 캐시 (SQLite)
+    - 키: 정규화 URL
+    - ttl_sec 이내면 네트워크 없이 재사용, 지나면 조건부 GET으로 재검증
+    - prune(): fetched_at 기준 max_age_sec 지난 항목 + max_bytes 초과분(LRU) 삭제
+    """
+
+    _TABLE = "article_cache"
+    _KEY_COL = "url_key"
+    _AGE_COL = "fetched_at"
+
+    def __init__(self, db_path: str, ttl_sec: int = 6 * 3600, max_age_sec: int = 7 * 86400, max_bytes: int = 50 * 1024 * 1024):
+        self.ttl_sec = ttl_sec
+        super().__init__(db_path, max_age_sec, max_bytes)
+
+    def _init_db(self):
+        with self._use() as con:
+            con.execute("""
+                CREATE TABLE IF NOT EXISTS article_cache (
+                    url_key TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    text TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    fetched_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    size INTEGER NOT NULL
+                )
+            """)
+            con.execute("CREATE INDEX IF NOT EXISTS idx_article_cache_accessed ON article_cache(accessed_at)")
+            con.commit()
+
+    def get(self, url: str) -> Optional[CachedArticle]:
+        key = normalize_url(url)
+        with self._use() as con:
+            row = con.execute("""
+                SELECT url, text, content_hash, etag, last_modified, fetched_at
+                FROM article_cache WHERE url_key = ?
+            """, (key,)).fetchone()
+            if not row:
+                return None
+            con.execute("UPDATE article_cache SET accessed_at = ? WHERE url_key = ?", (time.time(), key))
+            con.commit()
+        return CachedArticle(*row)
+
+    def put(self, url: str, text: str, content_hash: str, etag: Optional[str], last_modified: Optional[str]):
+        now = time.time()
+        size = len(text.encode("utf-8"))
+        with self._use() as con:
+            con.execute("""
+                INSERT INTO article_cache (url_key, url, text, content_hash, etag, last_modified, fetched_at, accessed_at, size)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url_key) DO UPDATE SET
+                    url=excluded.url,
+                    text=excluded.text,
+                    content_hash=excluded.content_hash,
+                    etag=excluded.etag,
+                    last_modified=excluded.last_modified,
+                    fetched_at=excluded.fetched_at,
+                    accessed_at=excluded.accessed_at,
+                    size=excluded.size
+            """, (normalize_url(url), url, text, content_hash, etag, last_modified, now, now, size))
+            con.commit()
+
+    def touch(self, url: str):
+        """
+        304 재검증 성공 시 fetched_at 갱신 (다시 ttl_sec 동안 fresh)
+        """
+        now = time.time()
+        with self._use() as con:
+            con.execute(
+                "UPDATE article_cache SET fetched_at = ?, accessed_at = ? WHERE url_key = ?",
+                (now, now, normalize_url(url)),
+            )
+            con.commit()
@@ -1,13 +1,88 @@
-import requests
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional
 from readability import Document
 from bs4 import BeautifulSoup
 
-def fetch_article_text(url: str, timeout_sec: int = 10) -> str:
-    r = requests.get(url, timeout=timeout_sec, headers={"User-Agent": "Mozilla/5.0"})
-    r.raise_for_status()
+from src.article_cache import ArticleCache
+from src.http_client import http_get
+from src.tracing import bind, span
+
+
+@dataclass
+class ArticleFetchResult:
+    url: str
+    text: str
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
 
-    doc = Document(r.text)
+
+def _extract_text(page_html: str) -> str:
+    doc = Document(page_html)
     html = doc.summary()
     soup = BeautifulSoup(html, "lxml")
     text = soup.get_text("\n", strip=True)
     return text.strip()
+
+
+def fetch_article_text(url: str, timeout_sec: int = 10, cache: Optional[ArticleCache] = None) -> str:
+    """
+    기사 본문 텍스트 추출 (readability).
+    cache가 있으면 fresh 항목은 그대로 쓰고, 오래된 항목은 조건부 GET으로 재검증한다.
+    원문 HTML 해시가 같으면 readability를 다시 돌리지 않는다.
+    """
+    hit = cache.get(url) if cache else None
+    if hit and hit.is_fresh(cache.ttl_sec):
+        return hit.text
+
+    with span("article.http", url=url, revalidate=bool(hit)) as sp:
+        r = http_get(url, headers=(hit.validators() if hit else None) or None, timeout_sec=timeout_sec)
+        sp.set(status=r.status_code, bytes=len(r.content or b""))
+    if r.status_code == 304 and hit:
+        cache.touch(url)
+        return hit.text
+    r.raise_for_status()
+
+    if not cache:
+        return _extract_text(r.text)
+
+    content_hash = hashlib.sha256(r.content).hexdigest()
+    text = hit.text if hit and hit.content_hash == content_hash else _extract_text(r.text)
+    cache.put(url, text, content_hash, r.headers.get("ETag"), r.headers.get("Last-Modified"))
+    return text
+
+
+def _fetch_one(url: str, timeout_sec: int, cache: Optional[ArticleCache]) -> ArticleFetchResult:
+    with span("article.fetch", url=url) as sp:
+        try:
+            text = fetch_article_text(url, timeout_sec=timeout_sec, cache=cache)
+        except Exception as e:
+            sp.set(error=str(e))
+            return ArticleFetchResult(url=url, text="", error=e)
+        sp.set(chars=len(text))
+        return ArticleFetchResult(url=url, text=text)
+
+
+def fetch_articles_text(
+    urls: List[str],
+    max_in_flight: int = 4,
+    timeout_sec: int = 10,
+    cache: Optional[ArticleCache] = None,
+) -> List[ArticleFetchResult]:
+    """
+    여러 기사 본문을 동시에 가져온다.
+    - 동시에 진행되는 요청 수는 max_in_flight로 제한
+    - 결과는 urls 입력 순서 그대로 반환
+    - URL별 실패는 ArticleFetchResult.error에 담기며 배치 전체를 실패시키지 않음
+    """
+    if not urls:
+        return []
+
+    workers = max(1, min(int(max_in_flight), len(urls)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="article") as ex:
+        # bind: 워커 스레드의 span이 호출한 쪽 span 아래에 기록되도록
+        return list(ex.map(bind(lambda u: _fetch_one(u, timeout_sec, cache)), urls))
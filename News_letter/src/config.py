@@ -23,12 +23,52 @@ NAVER_QUERIES = {
     "IT": "IT 인공지능",
 }
 
+# 묶음 검색 결과를 섹션으로 나눌 때 쓰는 키워드 (섹션 검색어와 그 단어들은 자동 포함)
+NAVER_SECTION_KEYWORDS = {
+    "한국 경제": ["국내", "코스피", "코스닥", "한은", "한국은행", "기재부", "부동산", "수출", "가계부채"],
+    "세계 경제": ["미국", "연준", "중국", "일본", "유럽", "글로벌", "해외", "관세", "달러"],
+    "IT": ["AI", "반도체", "플랫폼", "클라우드", "소프트웨어", "빅테크", "오픈AI", "엔비디아"],
+}
+
+# 섹션 검색어를 몇 개씩 OR(|)로 묶어 한 번에 검색할지 (1이면 섹션별 검색)
+# 묶음 결과는 키워드로 섹션에 나누고, NAVER_TOP_N개가 안 되는 섹션만 단독 검색으로 보충
+NAVER_QUERY_GROUP_SIZE = max(1, _int_env("NAVER_QUERY_GROUP_SIZE", 1))
+
 
 
 # 각 섹션 메인 기사 수
 HK_TOP_N = _int_env("HK_TOP_N", 3)
 NAVER_TOP_N = _int_env("NAVER_TOP_N", 3)
 
+# 섹션 병렬 실행 스레드 수 (1이면 순차 실행과 동일)
+SECTION_MAX_WORKERS = max(1, _int_env("SECTION_MAX_WORKERS", len(SECTIONS)))
+
+# 섹션 간 중복 기사(같은 URL/거의 같은 제목) 처리
+# skip(기본): 우선순위가 높은 섹션만 싣고 나머지 섹션은 다음 후보 / share: 양쪽에 싣되 본문 수집·요약은 1회 / off
+DEDUP_MODE = (os.getenv("DEDUP_MODE") or "skip").strip().lower()
+# 중복 기사를 가져갈 섹션 우선순위 (쉼표 구분, 빠진 섹션은 SECTIONS 순서로 뒤에 붙음)
+DEDUP_SECTION_PRIORITY = [x.strip() for x in (os.getenv("DEDUP_SECTION_PRIORITY") or "").split(",") if x.strip() in SECTIONS]
+DEDUP_SECTION_PRIORITY += [s for s in SECTIONS if s not in DEDUP_SECTION_PRIORITY]
+
+# 지난 N일 동안 이미 발송한 기사(URL/제목)는 후보에서 제외 (0이면 사용 안 함)
+PUBLISHED_HISTORY_DAYS = _int_env("PUBLISHED_HISTORY_DAYS", 7)
+
+# 단계별(수집/본문/요약/메일) 체크포인트: 재시도 시 끝난 항목은 건너뛰고 이어서 실행 (0이면 매번 처음부터)
+CHECKPOINT_ENABLED = _int_env("CHECKPOINT_ENABLED", 1) == 1
+
+# 단계별 소요 시간 프로파일 output/profile_<run_date>.json 저장 (0이면 저장 안 함)
+PROFILE_ENABLED = _int_env("PROFILE_ENABLED", 1) == 1
+
+# 기사 본문 동시 다운로드 수 / URL별 타임아웃(초)
+ARTICLE_FETCH_MAX_IN_FLIGHT = max(1, _int_env("ARTICLE_FETCH_MAX_IN_FLIGHT", 4))
+ARTICLE_FETCH_TIMEOUT_SEC = _int_env("ARTICLE_FETCH_TIMEOUT_SEC", 10)
+
+# 공유 HTTP 클라이언트 (keep-alive 풀 / 선택적 HTTP/2: httpx[http2] 필요)
+HTTP_USER_AGENT = (os.getenv("HTTP_USER_AGENT") or "Mozilla/5.0").strip()
+HTTP2_ENABLED = _int_env("HTTP2_ENABLED", 0) == 1
+HTTP_POOL_HOSTS = max(1, _int_env("HTTP_POOL_HOSTS", 10))
+HTTP_POOL_PER_HOST = max(1, _int_env("HTTP_POOL_PER_HOST", 8))
+
 # 네이버 검색 결과(관련기사) 최대 2개
 RELATED_MAX = _int_env("RELATED_MAX", 2)
 
@@ -39,10 +79,44 @@ RETRY_INTERVAL_SEC = _int_env("RETRY_INTERVAL_SEC", 60)
 # OpenAI
 OPENAI_API_KEY = (os.getenv("OPENAI_API_KEY") or "").strip()
 OPENAI_MODEL = (os.getenv("OPENAI_MODEL") or "gpt-4.1-mini").strip()
+# 로컬 대체 서버 등으로 바꿀 때만 지정 (빈 값이면 기본 엔드포인트)
+OPENAI_BASE_URL = (os.getenv("OPENAI_BASE_URL") or "").strip()
+# 비동기 요약 스케줄러: 분당 요청/토큰 한도(0이면 제한 없음), 동시 요청 수, 429 재시도 횟수
+OPENAI_RPM = _int_env("OPENAI_RPM", 500)
+OPENAI_TPM = _int_env("OPENAI_TPM", 200000)
+OPENAI_MAX_CONCURRENCY = _int_env("OPENAI_MAX_CONCURRENCY", 8)
+OPENAI_MAX_RETRIES = _int_env("OPENAI_MAX_RETRIES", 5)
+# 프롬프트에 넣는 기사 본문 토큰 예산 (boilerplate 제거 후 초과분만 잘라냄, 0이면 자르지 않음)
+PROMPT_TOKEN_BUDGET = _int_env("PROMPT_TOKEN_BUDGET", 1500)
+# 요약 방식: async(기본, 대화형 동시 호출) / batch(OpenAI Batch API, 백필·미리 준비하는 뉴스레터용)
+OPENAI_REWRITE_MODE = (os.getenv("OPENAI_REWRITE_MODE") or "async").strip().lower()
+OPENAI_BATCH_POLL_SEC = _int_env("OPENAI_BATCH_POLL_SEC", 30)
+OPENAI_BATCH_TIMEOUT_SEC = _int_env("OPENAI_BATCH_TIMEOUT_SEC", 24 * 3600)
+
+# HK ↔ 네이버 제목 매칭: jaccard(기본, 공백 토큰) / ngram(문자 2~3-gram 코사인, numpy·scipy 필요)
+MATCH_METHOD = (os.getenv("MATCH_METHOD") or "jaccard").strip().lower()
+# 1:1 배정 방식: greedy(기본, HK 순서대로) / optimal(점수 합 최대, scipy 없으면 순수 파이썬 헝가리안)
+MATCH_ASSIGNMENT = (os.getenv("MATCH_ASSIGNMENT") or "greedy").strip().lower()
 
 # NAVER OpenAPI
+# 로컬 대체 서버(bench/standin_server.py) 등으로 바꿀 때만 지정
+NAVER_API_BASE_URL = (os.getenv("NAVER_API_BASE_URL") or "https://openapi.naver.com").strip().rstrip("/")
 NAVER_CLIENT_ID = (os.getenv("NAVER_CLIENT_ID") or "").strip()
 NAVER_CLIENT_SECRET = (os.getenv("NAVER_CLIENT_SECRET") or "").strip()
+# 페이지 검색(start=1,101,...): 검색어당 최대 페이지 수(API 한도 start<=1000 → 최대 10) / 동시에 받을 페이지 수
+NAVER_MAX_PAGES = max(1, min(_int_env("NAVER_MAX_PAGES", 10), 10))
+NAVER_PAGE_WORKERS = max(1, _int_env("NAVER_PAGE_WORKERS", 4))
+# 페이지 검색은 필요 수(NAVER_TOP_N 등) + 이 여유분만큼 모이면 다음 페이지를 요청하지 않음 (발송 이력/중복 제거로 빠지는 몫)
+NAVER_FETCH_MARGIN = max(0, _int_env("NAVER_FETCH_MARGIN", 10))
+# 네이버 호출 한도: 초당 요청 수(0이면 제한 없음) / 하루 호출 예산(KST 기준, 0이면 제한 없음, API 기본 한도 25,000)
+NAVER_RPS = _int_env("NAVER_RPS", 10)
+NAVER_DAILY_BUDGET = _int_env("NAVER_DAILY_BUDGET", 25000)
+# 속도 제한(429/012) 응답 시 잠시 쉬고 다시 보내는 횟수 (소진되면 마지막 성공 응답으로 대체)
+NAVER_RATE_LIMIT_RETRIES = _int_env("NAVER_RATE_LIMIT_RETRIES", 2)
+# sim/date 조회 방식: speculative(기본, 두 정렬을 동시에 요청) / sequential(sim 부족 시에만 date 요청)
+NAVER_SEARCH_MODE = (os.getenv("NAVER_SEARCH_MODE") or "speculative").strip().lower()
+# speculative에서 sim만으로 NAVER_TOP_N을 채우면 date 요청을 중단 (0이면 date도 끝까지 받아 뒤에 합침)
+NAVER_SPECULATIVE_CANCEL = _int_env("NAVER_SPECULATIVE_CANCEL", 1) == 1
 
 # 메일 수신자: 쉼표로 확장 가능
 RECIPIENTS = [x.strip() for x in (os.getenv("RECIPIENTS") or "").split(",") if x.strip()]
@@ -65,5 +139,42 @@ TOP_NOTE = (
     '</div>'
 )
 
-# state db
-STATE_DB_PATH = os.path.join("data", "state.db")
+# 오프라인 녹화/재생 (src/replay.py): off(기본) / record(실제 응답을 FIXTURE_DIR에 저장) / replay(네트워크 없이 저장본 사용)
+FIXTURE_MODE = (os.getenv("FIXTURE_MODE") or "off").strip().lower()
+FIXTURE_DIR = (os.getenv("FIXTURE_DIR") or os.path.join("data", "fixtures")).strip()
+# replay 시 요청마다 주입할 지연(ms) = LATENCY ± JITTER
+REPLAY_LATENCY_MS = _int_env("REPLAY_LATENCY_MS", 0)
+REPLAY_JITTER_MS = _int_env("REPLAY_JITTER_MS", 0)
+# 1이면 메일 발송/메모장/티스토리 실행 생략 (벤치마크·재생 실행용)
+DRY_RUN = _int_env("DRY_RUN", 0) == 1
+
+# 한국경제 RSS 호스트 (로컬 대체 서버 등으로 바꿀 때만 지정)
+HANKYUNG_RSS_BASE_URL = (os.getenv("HANKYUNG_RSS_BASE_URL") or "https://www.hankyung.com").strip().rstrip("/")
+
+# state db (녹화/벤치마크 실행은 별도 경로 지정 권장)
+STATE_DB_PATH = os.getenv("STATE_DB_PATH", os.path.join("data", "state.db")).strip()
+
+# 기사 본문 캐시 (SQLite), 빈 값이면 캐시 미사용
+ARTICLE_CACHE_DB_PATH = os.getenv("ARTICLE_CACHE_DB_PATH", os.path.join("data", "article_cache.db")).strip()
+ARTICLE_CACHE_TTL_SEC = _int_env("ARTICLE_CACHE_TTL_SEC", 6 * 3600)
+ARTICLE_CACHE_MAX_AGE_SEC = _int_env("ARTICLE_CACHE_MAX_AGE_SEC", 7 * 86400)
+ARTICLE_CACHE_MAX_MB = _int_env("ARTICLE_CACHE_MAX_MB", 50)
+
+# LLM 응답 캐시 (SQLite), 빈 값이면 캐시 미사용 / LLM_CACHE_BYPASS=1이면 조회 없이 새로 호출
+LLM_CACHE_DB_PATH = os.getenv("LLM_CACHE_DB_PATH", os.path.join("data", "llm_cache.db")).strip()
+LLM_CACHE_MAX_AGE_SEC = _int_env("LLM_CACHE_MAX_AGE_SEC", 30 * 86400)
+LLM_CACHE_MAX_MB = _int_env("LLM_CACHE_MAX_MB", 20)
+LLM_CACHE_BYPASS = _int_env("LLM_CACHE_BYPASS", 0) == 1
+
+# 네이버 검색 결과 캐시 (SQLite), 빈 값이면 캐시 미사용 / TTL(초) 안의 같은 검색은 API 호출 없이 재사용, 최대 항목 수(LRU)
+NAVER_CACHE_DB_PATH = os.getenv("NAVER_CACHE_DB_PATH", os.path.join("data", "naver_cache.db")).strip()
+NAVER_CACHE_TTL_SEC = _int_env("NAVER_CACHE_TTL_SEC", 600)
+NAVER_CACHE_MAX_ENTRIES = _int_env("NAVER_CACHE_MAX_ENTRIES", 500)
+# TTL이 지난 항목도 이 기간(초) 동안은 남겨 두고 한도 초과/속도 제한 시 대체 응답으로 사용
+NAVER_CACHE_STALE_SEC = _int_env("NAVER_CACHE_STALE_SEC", 3 * 86400)
+
+# RSS 조건부 GET 캐시 (ETag/Last-Modified + 파싱 결과), 빈 값이면 캐시 미사용
+RSS_CACHE_DIR = os.getenv("RSS_CACHE_DIR", os.path.join("data", "rss_cache")).strip()
+# RSS 피드가 최신순이라는 가정으로, 창(24시간)보다 오래된 item이 이만큼 연속되면 나머지는 파싱하지 않음
+# (최신순이 깨진 피드면 늘리고, 0이면 끝까지 파싱하며 걸러내기만 함)
+RSS_CUTOFF_GRACE = max(0, _int_env("RSS_CUTOFF_GRACE", 3))
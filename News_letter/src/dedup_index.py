@@ -0,0 +1,45 @@
+from typing import Dict, Generic, List, Optional, TypeVar
+
+from src.article_cache import normalize_url
+from src.title_matcher import TitleIndex, title_tokens
+
+# 같은 기사로 볼 제목 Jaccard 기준 (섹션 간 매칭 기준 0.35보다 엄격하게)
+DEDUP_TITLE_THRESHOLD = 0.6
+
+T = TypeVar("T")
+
+
+class DedupIndex(Generic[T]):
+    """
+    실행(run) 전체 기사 중복 색인
+    - 정규화 URL이 같거나 제목 Jaccard가 title_threshold 이상이면 같은 기사
+    - 먼저 add한 쪽이 owner (섹션 우선순위 순서로 add)
+    """
+
+    def __init__(self, title_threshold: float = DEDUP_TITLE_THRESHOLD):
+        self.title_threshold = title_threshold
+        self._by_url: Dict[str, T] = {}
+        self._titles = TitleIndex([])
+        self._owners: List[T] = []
+
+    def __len__(self) -> int:
+        return len(self._owners)
+
+    def find(self, url: str, title: str) -> Optional[T]:
+        if url:
+            owner = self._by_url.get(normalize_url(url))
+            if owner is not None:
+                return owner
+        best_j, best = -1, 0.0
+        for j, score in self._titles.scores(title_tokens(title)).items():
+            if score > best or (score == best and j < best_j):
+                best_j, best = j, score
+        if best_j >= 0 and best >= self.title_threshold:
+            return self._owners[best_j]
+        return None
+
+    def add(self, url: str, title: str, owner: T) -> None:
+        if url:
+            self._by_url.setdefault(normalize_url(url), owner)
+        self._titles.add(title)
+        self._owners.append(owner)
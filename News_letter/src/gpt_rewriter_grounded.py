@@ -1,11 +1,30 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional, Dict, Any, List
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional, Dict, Any, Callable, List
+import asyncio
+import io
 import json
 import os
+import time
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI, RateLimitError
+
+from src.config import (
+    OPENAI_BASE_URL, OPENAI_RPM, OPENAI_TPM,
+    OPENAI_MAX_CONCURRENCY, OPENAI_MAX_RETRIES,
+    OPENAI_REWRITE_MODE, OPENAI_BATCH_POLL_SEC, OPENAI_BATCH_TIMEOUT_SEC,
+)
+from src.llm_cache import ResponseCache
+from src.prompt_compactor import count_tokens
+from src.rate_limiter import TokenBucket
+from src.replay import openai_http_client
+from src.tracing import span
+
+# TPM 예약용 출력 토큰 추정치 (body 2~5문장 + 근거 구절)
+_OUTPUT_TOKENS_EST = 600
 
 
 @dataclass
@@ -14,6 +33,18 @@ class RewriteResult:
     body: str
     importance: str
     reason_if_fail: Optional[str] = None
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cached: bool = False
+
+
+@dataclass
+class RewriteJob:
+    title: str
+    article_text: str
+    published_dt_str: str
+    section: str
+    related_texts: List[str] = field(default_factory=list)
 
 
 def _build_prompt(title: str, published_kst: str, article_text: str, related_texts: List[str]) -> str:
@@ -58,13 +89,72 @@ def rewrite_grounded(
     published_kst: str,
     article_text: str,
     related_texts: Optional[List[str]] = None,
+    cache: Optional[ResponseCache] = None,
+    bypass_cache: bool = False,
 ) -> RewriteResult:
+    """
+    cache가 있으면 (model, prompt) 해시로 이전 검증 결과를 재사용한다.
+    bypass_cache=True면 캐시 조회 없이 호출하고 결과만 갱신한다.
+    """
     related_texts = related_texts or []
     prompt = _build_prompt(title, published_kst, article_text, related_texts)
 
+    hit = _cache_lookup(cache, bypass_cache, model, prompt)
+    if hit:
+        return hit
+
     resp = client.responses.create(model=model, input=prompt)
-    out = resp.output_text.strip()
+    return _finish_response(resp, cache, model, prompt, article_text, related_texts)
+
+
+def _cache_lookup(cache: Optional[ResponseCache], bypass_cache: bool, model: str, prompt: str) -> Optional[RewriteResult]:
+    if not cache or bypass_cache:
+        return None
+    hit = cache.get(model, prompt)
+    if not hit:
+        return None
+    hit["cached"] = True
+    return RewriteResult(**hit)
+
 
+def _finish_response(
+    resp: Any,
+    cache: Optional[ResponseCache],
+    model: str,
+    prompt: str,
+    article_text: str,
+    related_texts: List[str],
+) -> RewriteResult:
+    usage = getattr(resp, "usage", None)
+    return _finish_output(
+        resp.output_text.strip(),
+        int(getattr(usage, "input_tokens", 0) or 0),
+        int(getattr(usage, "output_tokens", 0) or 0),
+        cache, model, prompt, article_text, related_texts,
+    )
+
+
+def _finish_output(
+    out: str,
+    input_tokens: int,
+    output_tokens: int,
+    cache: Optional[ResponseCache],
+    model: str,
+    prompt: str,
+    article_text: str,
+    related_texts: List[str],
+) -> RewriteResult:
+    res = _validate_output(out, article_text, related_texts)
+    res.input_tokens = input_tokens
+    res.output_tokens = output_tokens
+
+    # 실패 결과는 일시적일 수 있으므로 캐시하지 않음
+    if cache and res.ok:
+        cache.put(model, prompt, asdict(res), input_tokens=input_tokens, output_tokens=output_tokens)
+    return res
+
+
+def _validate_output(out: str, article_text: str, related_texts: List[str]) -> RewriteResult:
     try:
         data: Dict[str, Any] = json.loads(out)
         body = (data.get("body") or "").strip()
@@ -95,6 +185,308 @@ def _text_to_html(s: str) -> str:
     return f"<p style='margin:0 0 10px 0; line-height:1.6;'>{s}</p>"
 
 
+def _fallback_html(article_text: str) -> str:
+    # 요약 실패/키 없음 → “근거 기반(원문 발췌)”
+    fallback = (article_text or "").strip()
+    if len(fallback) > 800:
+        fallback = fallback[:800] + "…"
+    return _text_to_html(fallback)
+
+
+def _retry_after_sec(err: Exception, default: float) -> float:
+    """
+    429 응답의 retry-after-ms / retry-after(초 또는 HTTP-date) 헤더 해석
+    """
+    headers = getattr(getattr(err, "response", None), "headers", None) or {}
+    try:
+        ms = headers.get("retry-after-ms")
+        if ms:
+            return max(0.0, float(ms) / 1000.0)
+        ra = headers.get("retry-after")
+        if ra:
+            try:
+                return max(0.0, float(ra))
+            except ValueError:
+                return max(0.0, (parsedate_to_datetime(ra) - datetime.now(timezone.utc)).total_seconds())
+    except Exception:
+        pass
+    return default
+
+
+class RewriteScheduler:
+    """
+    하나의 AsyncOpenAI 클라이언트로 여러 기사 요약을 동시에 보내는 스케줄러
+    - RPM/TPM 토큰 버킷으로 요청 발급 속도 제한 (0이면 제한 없음)
+    - 동시 진행 요청 수는 max_concurrency로 제한
+    - 429 시 Retry-After만큼 전체 발급을 멈추고 발급 속도를 절반으로 낮춘 뒤 재시도 (최대 max_retries회, 성공할 때마다 설정값까지 회복)
+    asyncio 루프 안에서 생성할 것 (Semaphore가 루프에 묶임)
+    """
+
+    def __init__(
+        self,
+        client: AsyncOpenAI,
+        model: str,
+        rpm: int = OPENAI_RPM,
+        tpm: int = OPENAI_TPM,
+        max_concurrency: int = OPENAI_MAX_CONCURRENCY,
+        max_retries: int = OPENAI_MAX_RETRIES,
+        cache: Optional[ResponseCache] = None,
+        bypass_cache: bool = False,
+    ):
+        self.client = client
+        self.model = model
+        # 버스트는 동시 요청 수까지만 (그 이상 쌓아 둔 토큰은 세마포어 앞에서 한꺼번에 나가 429만 늘림)
+        self.requests = TokenBucket(rpm / 60.0, min(rpm, max(1, max_concurrency))) if rpm > 0 else TokenBucket(0, 1)
+        self.tokens = TokenBucket.per_minute(tpm) if tpm > 0 else TokenBucket(0, 1)
+        self.max_retries = max_retries
+        self.cache = cache
+        self.bypass_cache = bypass_cache
+        self.rate_limited = 0
+        self._sem = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def rewrite(self, job: RewriteJob) -> RewriteResult:
+        with span("gpt.rewrite", section=job.section, title=job.title[:40]) as sp:
+            res = await self._rewrite(job)
+            sp.set(
+                ok=res.ok, cached=res.cached,
+                input_tokens=res.input_tokens, output_tokens=res.output_tokens,
+            )
+            return res
+
+    async def _rewrite(self, job: RewriteJob) -> RewriteResult:
+        related_texts = job.related_texts or []
+        article_text = job.article_text or ""
+        prompt = _build_prompt(job.title, job.published_dt_str or "", article_text, related_texts)
+
+        hit = _cache_lookup(self.cache, self.bypass_cache, self.model, prompt)
+        if hit:
+            return hit
+
+        est = count_tokens(prompt) + _OUTPUT_TOKENS_EST
+        backoff = 1.0
+        for attempt in range(self.max_retries + 1):
+            await self.requests.acquire_async(1)
+            await self.tokens.acquire_async(est)
+            pauses = self.requests.pauses
+            try:
+                async with self._sem:
+                    resp = await self.client.responses.create(model=self.model, input=prompt)
+            except RateLimitError as e:
+                self.rate_limited += 1
+                if attempt >= self.max_retries:
+                    # 이 기사만 실패 처리 (gather 전체를 중단시키지 않음)
+                    return RewriteResult(False, "", "", f"Rate limited after {attempt + 1} attempt(s): {e}")
+                delay = _retry_after_sec(e, backoff)
+                backoff = min(backoff * 2, 60.0)
+                # 발급 속도를 낮추고 버킷을 비움 → 재개 후 요청이 한꺼번에 몰리지 않고 간격을 두고 나감
+                # (이미 다른 429로 멈춘 뒤 돌아온 같은 묶음의 429는 속도를 한 번 더 낮추지 않음)
+                if self.requests.pauses == pauses:
+                    self.requests.slow_down()
+                self.requests.pause(delay)
+                self.tokens.pause(delay)
+                continue
+            self.requests.speed_up()
+            return _finish_response(resp, self.cache, self.model, prompt, article_text, related_texts)
+
+        raise RuntimeError("unreachable")
+
+    async def rewrite_all(
+        self,
+        jobs: List[RewriteJob],
+        on_done: Optional[Callable[[int, RewriteResult], None]] = None,
+    ) -> List[RewriteResult]:
+        """
+        on_done(i, result): 각 기사 요약이 끝나는 즉시 호출 (다른 기사가 실패해도 끝난 결과는 보존)
+        """
+        async def _one(i: int, job: RewriteJob) -> RewriteResult:
+            res = await self.rewrite(job)
+            if on_done:
+                on_done(i, res)
+            return res
+
+        return list(await asyncio.gather(*(_one(i, j) for i, j in enumerate(jobs))))
+
+
+async def _rewrite_all_async(
+    jobs: List[RewriteJob],
+    api_key: str,
+    model: str,
+    cache: Optional[ResponseCache],
+    bypass_cache: bool,
+    on_done: Optional[Callable[[int, RewriteResult], None]] = None,
+) -> List[RewriteResult]:
+    client = AsyncOpenAI(
+        api_key=api_key, base_url=OPENAI_BASE_URL or None, max_retries=0,
+        http_client=openai_http_client(async_client=True),
+    )
+    try:
+        scheduler = RewriteScheduler(client, model, cache=cache, bypass_cache=bypass_cache)
+        return await scheduler.rewrite_all(jobs, on_done=on_done)
+    finally:
+        await client.close()
+
+
+# ---- OpenAI Batch API (비대화형: 백필/미리 준비하는 뉴스레터) ----
+
+_BATCH_ENDPOINT = "/v1/responses"
+_BATCH_DONE_FAILED = {"failed", "expired", "cancelled"}
+
+
+def _job_prompt(job: RewriteJob) -> str:
+    return _build_prompt(job.title, job.published_dt_str or "", job.article_text or "", job.related_texts or [])
+
+
+def submit_rewrite_batch(client: OpenAI, model: str, jobs: List[RewriteJob]) -> str:
+    """
+    jobs 프롬프트를 JSONL 배치 파일로 올리고 배치를 생성. batch id 반환
+    (custom_id = "job-<jobs 인덱스>")
+    """
+    lines = [
+        json.dumps({
+            "custom_id": f"job-{i}",
+            "method": "POST",
+            "url": _BATCH_ENDPOINT,
+            "body": {"model": model, "input": _job_prompt(job)},
+        }, ensure_ascii=False)
+        for i, job in enumerate(jobs)
+    ]
+    data = ("\n".join(lines) + "\n").encode("utf-8")
+    f = client.files.create(file=("rewrite_batch.jsonl", io.BytesIO(data)), purpose="batch")
+    batch = client.batches.create(input_file_id=f.id, endpoint=_BATCH_ENDPOINT, completion_window="24h")
+    return batch.id
+
+
+def wait_rewrite_batch(
+    client: OpenAI,
+    batch_id: str,
+    poll_sec: int = OPENAI_BATCH_POLL_SEC,
+    timeout_sec: int = OPENAI_BATCH_TIMEOUT_SEC,
+) -> Any:
+    """
+    배치가 completed가 될 때까지 poll_sec 간격으로 조회. 실패/만료/취소/시간초과면 RuntimeError
+    """
+    deadline = time.monotonic() + timeout_sec
+    while True:
+        batch = client.batches.retrieve(batch_id)
+        if batch.status == "completed":
+            return batch
+        if batch.status in _BATCH_DONE_FAILED:
+            raise RuntimeError(f"OpenAI batch {batch_id} ended with status={batch.status}")
+        if time.monotonic() >= deadline:
+            raise RuntimeError(f"OpenAI batch {batch_id} not completed within {timeout_sec}s (status={batch.status})")
+        time.sleep(poll_sec)
+
+
+def _output_text_from_body(body: Dict[str, Any]) -> str:
+    # 배치 결과의 body는 Responses 객체 원형(JSON) → output_text를 직접 모음
+    texts: List[str] = []
+    for item in body.get("output") or []:
+        for c in item.get("content") or []:
+            if c.get("type") == "output_text":
+                texts.append(c.get("text") or "")
+    return "".join(texts).strip()
+
+
+def collect_rewrite_batch(
+    client: OpenAI,
+    batch: Any,
+    model: str,
+    jobs: List[RewriteJob],
+    cache: Optional[ResponseCache] = None,
+) -> List[RewriteResult]:
+    """
+    완료된 배치 출력을 custom_id로 jobs에 다시 매핑하고, 대화형 경로와 같은 JSON/근거 검증을 적용
+    """
+    outputs: Dict[str, Dict[str, Any]] = {}
+    if batch.output_file_id:
+        for line in client.files.content(batch.output_file_id).text.splitlines():
+            if line.strip():
+                row = json.loads(line)
+                outputs[row.get("custom_id") or ""] = row
+
+    results: List[RewriteResult] = []
+    for i, job in enumerate(jobs):
+        resp = (outputs.get(f"job-{i}") or {}).get("response") or {}
+        if resp.get("status_code") != 200:
+            results.append(RewriteResult(False, "", "", f"Batch item failed: status={resp.get('status_code')}"))
+            continue
+        body = resp.get("body") or {}
+        usage = body.get("usage") or {}
+        results.append(_finish_output(
+            _output_text_from_body(body),
+            int(usage.get("input_tokens") or 0),
+            int(usage.get("output_tokens") or 0),
+            cache, model, _job_prompt(job), job.article_text or "", job.related_texts or [],
+        ))
+    return results
+
+
+def rewrite_batch_grounded(
+    client: OpenAI,
+    model: str,
+    jobs: List[RewriteJob],
+    cache: Optional[ResponseCache] = None,
+    bypass_cache: bool = False,
+) -> List[RewriteResult]:
+    """
+    캐시에 없는 job만 배치로 제출 → 완료까지 대기 → jobs 순서대로 RewriteResult 반환
+    """
+    results: List[Optional[RewriteResult]] = [
+        _cache_lookup(cache, bypass_cache, model, _job_prompt(job)) for job in jobs
+    ]
+    pending = [i for i, r in enumerate(results) if r is None]
+    if pending:
+        pending_jobs = [jobs[i] for i in pending]
+        with span("gpt.batch.submit", jobs=len(pending_jobs)):
+            batch_id = submit_rewrite_batch(client, model, pending_jobs)
+        with span("gpt.batch.wait", batch_id=batch_id):
+            batch = wait_rewrite_batch(client, batch_id)
+        with span("gpt.batch.collect"):
+            collected = collect_rewrite_batch(client, batch, model, pending_jobs, cache=cache)
+        for i, res in zip(pending, collected):
+            results[i] = res
+    return results
+
+
+def rewrite_articles_grounded(
+    jobs: List[RewriteJob],
+    cache: Optional[ResponseCache] = None,
+    bypass_cache: bool = False,
+    mode: str = OPENAI_REWRITE_MODE,
+    on_result: Optional[Callable[[int, str], None]] = None,
+) -> List[str]:
+    """
+    여러 기사를 한 번에 요약해 body_html 목록을 jobs 순서대로 반환
+    (rewrite_article_grounded의 배치 버전)
+    - mode="async": RewriteScheduler로 동시 호출 (기본)
+    - mode="batch": OpenAI Batch API로 제출 후 완료까지 대기 (백필/급하지 않은 뉴스레터)
+    on_result(i, body_html): 요약에 성공한 기사마다 호출 (체크포인트 저장용, fallback은 제외)
+    """
+    api_key = (os.getenv("OPENAI_API_KEY") or "").strip()
+    model = (os.getenv("OPENAI_MODEL") or "gpt-4.1-mini").strip()
+
+    if not jobs:
+        return []
+    if not api_key:
+        return [_fallback_html(j.article_text) for j in jobs]
+
+    def _on_done(i: int, res: RewriteResult) -> None:
+        if on_result and res.ok:
+            on_result(i, _text_to_html(res.body))
+
+    if mode == "batch":
+        client = OpenAI(api_key=api_key, base_url=OPENAI_BASE_URL or None, http_client=openai_http_client(async_client=False))
+        results = rewrite_batch_grounded(client, model, jobs, cache=cache, bypass_cache=bypass_cache)
+        for i, res in enumerate(results):
+            _on_done(i, res)
+    else:
+        results = asyncio.run(_rewrite_all_async(jobs, api_key, model, cache, bypass_cache, on_done=_on_done))
+    return [
+        _text_to_html(res.body) if res.ok else _fallback_html(job.article_text)
+        for job, res in zip(jobs, results)
+    ]
+
+
 # ✅ run.py가 import해서 쓰는 고정 함수명
 def rewrite_article_grounded(
     title: str,
@@ -102,18 +494,17 @@ def rewrite_article_grounded(
     published_dt_str: str,
     section: str,
     related_texts: Optional[List[str]] = None,
+    cache: Optional[ResponseCache] = None,
+    bypass_cache: bool = False,
 ) -> str:
     api_key = (os.getenv("OPENAI_API_KEY") or "").strip()
     model = (os.getenv("OPENAI_MODEL") or "gpt-4.1-mini").strip()
 
     # 키 없으면 “근거 기반(원문 발췌)”로만
     if not api_key:
-        fallback = (article_text or "").strip()
-        if len(fallback) > 800:
-            fallback = fallback[:800] + "…"
-        return _text_to_html(fallback)
+        return _fallback_html(article_text)
 
-    client = OpenAI(api_key=api_key)
+    client = OpenAI(api_key=api_key, base_url=OPENAI_BASE_URL or None, http_client=openai_http_client(async_client=False))
     res = rewrite_grounded(
         client=client,
         model=model,
@@ -121,12 +512,11 @@ def rewrite_article_grounded(
         published_kst=published_dt_str or "",
         article_text=article_text or "",
         related_texts=related_texts or [],
+        cache=cache,
+        bypass_cache=bypass_cache,
     )
 
     if not res.ok:
-        fallback = (article_text or "").strip()
-        if len(fallback) > 800:
-            fallback = fallback[:800] + "…"
-        return _text_to_html(fallback)
+        return _fallback_html(article_text)
 
     return _text_to_html(res.body)
@@ -1,17 +1,24 @@
-import requests
-from bs4 import BeautifulSoup
 from dataclasses import dataclass
-from typing import List, Optional, Dict
+from typing import Any, Iterator, List, Optional, Dict
 from email.utils import parsedate_to_datetime
 from datetime import datetime
+import hashlib
+import io
+import json
+import os
 import pytz
+from lxml import etree
+
+from src.config import HANKYUNG_RSS_BASE_URL, RSS_CACHE_DIR, RSS_CUTOFF_GRACE
+from src.http_client import http_get
+from src.tracing import span
 
 KST = pytz.timezone("Asia/Seoul")
 
 SECTION_TO_RSS_URL: Dict[str, str] = {
-    "한국 경제": "https://www.hankyung.com/feed/economy",
-    "세계 경제": "https://www.hankyung.com/feed/international",
-    "IT": "https://www.hankyung.com/feed/it",
+    "한국 경제": f"{HANKYUNG_RSS_BASE_URL}/feed/economy",
+    "세계 경제": f"{HANKYUNG_RSS_BASE_URL}/feed/international",
+    "IT": f"{HANKYUNG_RSS_BASE_URL}/feed/it",
 }
 
 @dataclass
@@ -34,19 +41,129 @@ def _parse_pubdate(pubdate: str) -> Optional[datetime]:
     except Exception:
         return None
 
-def fetch_hankyung_rss(section: str, timeout_sec: int = 10) -> List[HKItem]:
+def hkitem_to_dict(item: HKItem) -> Dict[str, Any]:
+    return {
+        "section": item.section,
+        "title": item.title,
+        "link": item.link,
+        "published_kst": item.published_kst.isoformat() if item.published_kst else None,
+    }
+
+def hkitem_from_dict(d: Dict[str, Any]) -> HKItem:
+    pub = d.get("published_kst")
+    return HKItem(
+        section=d.get("section") or "",
+        title=d.get("title") or "",
+        link=d.get("link") or "",
+        published_kst=datetime.fromisoformat(pub).astimezone(KST) if pub else None,
+    )
+
+def _feed_cache_path(cache_dir: str, url: str) -> str:
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(cache_dir, f"feed_{key}.json")
+
+def _load_feed_cache(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _save_feed_cache(path: str, data: Dict[str, Any]) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp, path)
+
+def _cache_covers(cached: Dict[str, Any], not_before: Optional[datetime]) -> bool:
+    cached_nb = cached.get("not_before")
+    if not cached_nb:
+        return True
+    return not_before is not None and datetime.fromisoformat(cached_nb) <= not_before
+
+def iter_rss_items(
+    xml_bytes: bytes,
+    section: str,
+    not_before: Optional[datetime] = None,
+    cutoff_grace: int = RSS_CUTOFF_GRACE,
+) -> Iterator[HKItem]:
+    """
+    lxml iterparse로 <item>을 하나씩 HKItem으로 yield (처리한 element는 바로 해제).
+    not_before가 있으면 그보다 오래된 item은 건너뛰고,
+    cutoff_grace개 연속으로 오래된 item이 나오면 파싱을 중단한다.
+    피드가 최신순(pubDate 내림차순)이라고 가정하므로, 오래된 item 사이에 새 item이 섞인 피드는
+    cutoff_grace를 늘리거나 0(중단 없이 끝까지 걸러내기)으로 둔다.
+    """
+    older_streak = 0
+    for _, elem in etree.iterparse(io.BytesIO(xml_bytes), events=("end",), tag="item", recover=True):
+        title = (elem.findtext("title") or "").strip()
+        link = (elem.findtext("link") or "").strip()
+        pub = (elem.findtext("pubDate") or "").strip()
+
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+        published = _parse_pubdate(pub)
+        if not_before is not None and published is not None and published < not_before:
+            older_streak += 1
+            if cutoff_grace > 0 and older_streak >= cutoff_grace:
+                return
+            continue
+        older_streak = 0
+        yield HKItem(section=section, title=title, link=link, published_kst=published)
+
+def fetch_hankyung_rss(
+    section: str,
+    timeout_sec: int = 10,
+    cache_dir: Optional[str] = RSS_CACHE_DIR,
+    not_before: Optional[datetime] = None,
+) -> List[HKItem]:
+    """
+    섹션 RSS를 가져와 HKItem 목록으로 반환.
+    cache_dir가 있으면 ETag/Last-Modified로 조건부 GET을 보내고,
+    304 Not Modified면 저장된 파싱 결과를 그대로 재사용한다.
+    not_before를 주면 그보다 오래된 item은 파싱 단계에서 잘라낸다.
+    """
     url = SECTION_TO_RSS_URL.get(section)
     if not url:
         raise ValueError(f"Unknown section: {section}")
 
-    r = requests.get(url, timeout=timeout_sec, headers={"User-Agent": "Mozilla/5.0"})
+    cache_path = _feed_cache_path(cache_dir, url) if cache_dir else None
+    cached = _load_feed_cache(cache_path) if cache_path else None
+    if cached and not _cache_covers(cached, not_before):
+        # 캐시가 더 좁은 윈도우로 잘려 저장된 경우 → 검증자 없이 새로 받기
+        cached = None
+
+    headers: Dict[str, str] = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    with span("rss.http", section=section) as sp:
+        r = http_get(url, headers=headers or None, timeout_sec=timeout_sec)
+        sp.set(status=r.status_code, bytes=len(r.content or b""))
+    if r.status_code == 304 and cached:
+        items = [hkitem_from_dict(d) for d in cached.get("items") or []]
+        if not_before is not None:
+            items = [x for x in items if x.published_kst is None or x.published_kst >= not_before]
+        return items
     r.raise_for_status()
 
-    soup = BeautifulSoup(r.text, "xml")
-    out: List[HKItem] = []
-    for it in soup.find_all("item"):
-        title = (it.title.get_text(strip=True) if it.title else "").strip()
-        link = (it.link.get_text(strip=True) if it.link else "").strip()
-        pub = (it.pubDate.get_text(strip=True) if it.pubDate else "").strip()
-        out.append(HKItem(section=section, title=title, link=link, published_kst=_parse_pubdate(pub)))
+    with span("rss.parse", section=section) as sp:
+        out = list(iter_rss_items(r.content, section, not_before=not_before))
+        sp.set(items=len(out))
+
+    if cache_path:
+        _save_feed_cache(cache_path, {
+            "url": url,
+            "etag": r.headers.get("ETag"),
+            "last_modified": r.headers.get("Last-Modified"),
+            "fetched_at": datetime.now(KST).isoformat(timespec="seconds"),
+            "not_before": not_before.isoformat() if not_before else None,
+            "items": [hkitem_to_dict(x) for x in out],
+        })
     return out
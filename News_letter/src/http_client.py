@@ -0,0 +1,128 @@
+import threading
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.config import FIXTURE_DIR, FIXTURE_MODE, HTTP_USER_AGENT, HTTP2_ENABLED, HTTP_POOL_HOSTS, HTTP_POOL_PER_HOST
+from src.replay import FixtureStore, record_http, replay_http
+
+# 모든 네트워크 모듈이 공유하는 기본 헤더 정책
+DEFAULT_HEADERS: Dict[str, str] = {
+    "User-Agent": HTTP_USER_AGENT,
+    "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
+}
+
+# 녹화 시 제거하는 조건부 GET 헤더 (항상 전체 본문을 저장해야 재생 가능)
+_CONDITIONAL_HEADERS = ("If-None-Match", "If-Modified-Since")
+
+
+
+def _transport_errors() -> Tuple[type, ...]:
+    errors = [requests.RequestException]
+    try:
+        import httpx  # type: ignore
+
+        errors.append(httpx.HTTPError)
+    except ImportError:
+        pass
+    return tuple(errors)
+
+
+# 공유 클라이언트(requests/httpx)의 네트워크 오류 (호출 측에서 프로그래밍 오류와 구분해 잡을 때 사용)
+TRANSPORT_ERRORS: Tuple[type, ...] = _transport_errors()
+
+_client_lock = threading.Lock()
+_client: Optional[Any] = None
+_fixtures: Optional[FixtureStore] = None
+# 호스트별 동시 요청 수 제한 (httpx.Limits는 전체 한도만 있어서 두 클라이언트 공통으로 여기서 제한)
+_host_slots: Dict[str, threading.BoundedSemaphore] = {}
+
+
+def _build_requests_session() -> requests.Session:
+    # pool_connections: 캐시할 호스트별 풀 수, pool_maxsize: 호스트당 커넥션 수
+    # pool_block=True: 풀이 다 차면 새 커넥션을 만들지 않고 반납을 기다림 (pool_maxsize가 실제 상한)
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_HOSTS, pool_maxsize=HTTP_POOL_PER_HOST, pool_block=True)
+    s = requests.Session()
+    s.headers.update(DEFAULT_HEADERS)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    return s
+
+
+def _build_httpx_client() -> Optional[Any]:
+    """
+    HTTP/2 클라이언트 (httpx[http2] 설치 시에만). 없으면 None → requests 세션 사용
+    Limits는 전체 커넥션 수만 제한하므로 호스트별 상한은 http_get의 _host_slot이 맡음
+    """
+    try:
+        import httpx  # type: ignore
+
+        limits = httpx.Limits(
+            max_connections=HTTP_POOL_HOSTS * HTTP_POOL_PER_HOST,
+            max_keepalive_connections=HTTP_POOL_HOSTS * HTTP_POOL_PER_HOST,
+        )
+        return httpx.Client(http2=True, headers=DEFAULT_HEADERS, limits=limits, follow_redirects=True)
+    except ImportError:
+        return None
+
+
+def get_client() -> Any:
+    """
+    프로세스 전체에서 공유하는 HTTP 클라이언트 (스레드 안전, keep-alive 재사용)
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                client = _build_httpx_client() if HTTP2_ENABLED else None
+                _client = client or _build_requests_session()
+    return _client
+
+
+def _host_slot(url: str) -> threading.BoundedSemaphore:
+    host = urlsplit(url).netloc.lower()
+    slot = _host_slots.get(host)
+    if slot is None:
+        with _client_lock:
+            slot = _host_slots.setdefault(host, threading.BoundedSemaphore(HTTP_POOL_PER_HOST))
+    return slot
+
+
+def http_get(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout_sec: float = 10,
+) -> Any:
+    """
+    공유 클라이언트로 GET. 반환 객체는 requests/httpx 공통 인터페이스
+    (status_code, headers, text, content, json(), raise_for_status())만 사용할 것.
+    FIXTURE_MODE=record/replay면 응답을 녹화하거나 녹화본을 돌려줌 (src/replay.py)
+    같은 호스트로 동시에 보내는 요청은 HTTP_POOL_PER_HOST개까지 (넘으면 대기)
+    """
+    if FIXTURE_MODE == "replay":
+        return replay_http(_fixture_store(), url, params)
+    if FIXTURE_MODE == "record" and headers:
+        headers = {k: v for k, v in headers.items() if k not in _CONDITIONAL_HEADERS}
+    with _host_slot(url):
+        r = get_client().get(url, params=params, headers=headers, timeout=timeout_sec)
+    if FIXTURE_MODE == "record":
+        record_http(_fixture_store(), url, params, r)
+    return r
+
+
+def _fixture_store() -> FixtureStore:
+    global _fixtures
+    if _fixtures is None:
+        _fixtures = FixtureStore(FIXTURE_DIR)
+    return _fixtures
+
+
+def close_client() -> None:
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from typing import Any, Dict, Optional
+
+from src.sqlite_cache import SQLiteCache
+
+
+def prompt_key(model: str, prompt: str) -> str:
+    h = hashlib.sha256()
+    h.update(model.encode("utf-8"))
+    h.update(b"\0")
+    h.update(prompt.encode("utf-8"))
+    return h.hexdigest()
+
+
+class ResponseCache(SQLiteCache):
+    """
+    LLM 응답 캐시 (SQLite, content-addressed)
+    - 키: sha256(model, prompt)
+    - 값: 검증을 통과한 RewriteResult(JSON) + 토큰 사용량
+    - prune(): created_at 기준 max_age_sec 지난 항목 + max_bytes 초과분(LRU) 삭제
+    """
+
+    _TABLE = "llm_cache"
+    _KEY_COL = "key"
+    _AGE_COL = "created_at"
+
+    def __init__(self, db_path: str, max_age_sec: int = 30 * 86400, max_bytes: int = 20 * 1024 * 1024):
+        super().__init__(db_path, max_age_sec, max_bytes)
+
+    def _init_db(self):
+        with self._use() as con:
+            con.execute("""
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    result TEXT NOT NULL,
+                    input_tokens INTEGER NOT NULL,
+                    output_tokens INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    size INTEGER NOT NULL
+                )
+            """)
+            con.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed ON llm_cache(accessed_at)")
+            con.commit()
+
+    def get(self, model: str, prompt: str) -> Optional[Dict[str, Any]]:
+        key = prompt_key(model, prompt)
+        with self._use() as con:
+            row = con.execute("SELECT result FROM llm_cache WHERE key = ?", (key,)).fetchone()
+            if not row:
+                return None
+            con.execute("UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            con.commit()
+        return json.loads(row[0])
+
+    def put(self, model: str, prompt: str, result: Dict[str, Any], input_tokens: int = 0, output_tokens: int = 0):
+        now = time.time()
+        payload = json.dumps(result, ensure_ascii=False)
+        with self._use() as con:
+            con.execute("""
+                INSERT INTO llm_cache (key, model, result, input_tokens, output_tokens, created_at, accessed_at, size)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    result=excluded.result,
+                    input_tokens=excluded.input_tokens,
+                    output_tokens=excluded.output_tokens,
+                    created_at=excluded.created_at,
+                    accessed_at=excluded.accessed_at,
+                    size=excluded.size
+            """, (
+                prompt_key(model, prompt), model, payload,
+                int(input_tokens), int(output_tokens), now, now, len(payload.encode("utf-8")),
+            ))
+            con.commit()
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import json
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.sqlite_cache import SQLiteCache
+
+
+def search_key(query: str, sort: str, display: int, start: int) -> str:
+    return json.dumps([query, sort, int(display), int(start)], ensure_ascii=False)
+
+
+class NaverSearchCache(SQLiteCache):
+    """
+    네이버 뉴스 검색 결과 캐시 (SQLite)
+    - 키: (query, sort, display, start)
+    - 값: 파싱된 item dict 목록 (pubdate는 ISO 문자열 → fromisoformat으로 바로 복원) + total
+    - ttl_sec 안의 항목만 반환 (재시도/재실행 간 같은 호출은 API를 쓰지 않음)
+    - get_stale(): TTL과 무관하게 stale_sec 안의 항목 반환 (한도 초과/속도 제한 시 대체 응답)
+    - max_entries 초과 시 오래 안 쓴 순으로 삭제 (LRU), prune()은 stale_sec 지난 항목 삭제
+    """
+
+    _TABLE = "naver_search_cache"
+    _KEY_COL = "key"
+    _AGE_COL = "created_at"
+
+    def __init__(self, db_path: str, ttl_sec: int = 600, max_entries: int = 500, stale_sec: int = 3 * 86400):
+        self.ttl_sec = ttl_sec
+        self.max_entries = max_entries
+        self.stale_sec = max(ttl_sec, stale_sec)
+        # prune()은 stale_sec 기준 (TTL만 지난 항목은 대체 응답용으로 남김), 용량 제한 대신 put()에서 max_entries LRU
+        super().__init__(db_path, self.stale_sec)
+
+    def _init_db(self):
+        with self._use() as con:
+            con.execute("""
+                CREATE TABLE IF NOT EXISTS naver_search_cache (
+                    key TEXT PRIMARY KEY,
+                    items TEXT NOT NULL,
+                    total INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            con.execute("CREATE INDEX IF NOT EXISTS idx_naver_cache_accessed ON naver_search_cache(accessed_at)")
+            con.commit()
+
+    def _get(self, key: str, max_age_sec: int) -> Optional[Tuple[List[Dict[str, Any]], int, float]]:
+        now = time.time()
+        with self._use() as con:
+            row = con.execute(
+                "SELECT items, total, created_at FROM naver_search_cache WHERE key = ? AND created_at >= ?",
+                (key, now - max_age_sec),
+            ).fetchone()
+            if not row:
+                return None
+            con.execute("UPDATE naver_search_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            con.commit()
+        return json.loads(row[0]), int(row[1]), float(row[2])
+
+    def get(self, query: str, sort: str, display: int, start: int) -> Optional[Tuple[List[Dict[str, Any]], int]]:
+        """
+        TTL 안의 (items, total) 또는 None
+        """
+        hit = self._get(search_key(query, sort, display, start), self.ttl_sec)
+        return (hit[0], hit[1]) if hit else None
+
+    def get_stale(self, query: str, sort: str, display: int, start: int) -> Optional[Tuple[List[Dict[str, Any]], int, float]]:
+        """
+        TTL이 지났어도 stale_sec 안이면 (items, total, 저장 시각 epoch) 또는 None
+        """
+        return self._get(search_key(query, sort, display, start), self.stale_sec)
+
+    def put(self, query: str, sort: str, display: int, start: int, items: List[Dict[str, Any]], total: int):
+        now = time.time()
+        with self._use() as con:
+            con.execute("""
+                INSERT INTO naver_search_cache (key, items, total, created_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    items=excluded.items,
+                    total=excluded.total,
+                    created_at=excluded.created_at,
+                    accessed_at=excluded.accessed_at
+            """, (search_key(query, sort, display, start), json.dumps(items, ensure_ascii=False), int(total), now, now))
+            if self.max_entries > 0:
+                con.execute("""
+                    DELETE FROM naver_search_cache WHERE key IN (
+                        SELECT key FROM naver_search_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                    )
+                """, (self.max_entries,))
+            con.commit()
@@ -0,0 +1,158 @@
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from src.naver_search_api import NaverNewsItem, NaverNewsSearchAPI
+from src.tracing import span
+
+
+@dataclass
+class QueryGroup:
+    """
+    여러 섹션을 묶은 검색 1건 (query는 섹션 검색어를 OR(|)로 연결)
+    """
+    query: str
+    sections: List[str]
+
+
+def _norm(s: str) -> str:
+    # 띄어쓰기 차이("한국 경제"/"한국경제") 무시, 영문 대소문자 무시
+    return re.sub(r"\s+", "", (s or "").lower())
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isascii() and ch.isalnum()
+
+
+@lru_cache(maxsize=512)
+def _keyword_pattern(keyword: str) -> "re.Pattern[str]":
+    """
+    정규화된 키워드 → 본문(소문자, 띄어쓰기 유지)용 패턴
+    - 글자 사이 띄어쓰기 허용 ("한국경제"가 "한국 경제"에도 일치)
+    - 영문/숫자로 시작·끝나면 단어 경계 적용 ("it"이 "digital"/"capital", "ai"가 "daily"/"email"에 일치하지 않음)
+    """
+    body = r"\s*".join(re.escape(ch) for ch in keyword)
+    if _is_word_char(keyword[0]):
+        body = r"(?<![a-z0-9])" + body
+    if _is_word_char(keyword[-1]):
+        body += r"(?![a-z0-9])"
+    return re.compile(body)
+
+
+def _matched_keywords(text: str, keywords: Sequence[str]) -> Set[str]:
+    """
+    text에 나온 키워드 집합. 긴 키워드부터 찾고 이미 일치한 구간은 짧은 키워드가 다시 쓰지 않음
+    ("한국은행"에 일치한 부분을 "한국"이 또 세지 않음)
+    """
+    text = (text or "").lower()
+    used = [False] * len(text)
+    found: Set[str] = set()
+    for k in sorted(set(keywords), key=len, reverse=True):
+        for m in _keyword_pattern(k).finditer(text):
+            if any(used[m.start():m.end()]):
+                continue
+            used[m.start():m.end()] = [True] * (m.end() - m.start())
+            found.add(k)
+    return found
+
+
+def plan_query_groups(sections: Sequence[str], queries: Dict[str, str], group_size: int) -> List[QueryGroup]:
+    """
+    섹션 순서대로 group_size개씩 묶음 → 검색 호출 수가 섹션 수/group_size로 줄어듦 (1이면 기존처럼 섹션별 1건)
+    """
+    size = max(1, int(group_size))
+    groups: List[QueryGroup] = []
+    for i in range(0, len(sections), size):
+        secs = list(sections[i:i + size])
+        terms = [queries.get(sec, sec) for sec in secs]
+        groups.append(QueryGroup(query=" | ".join(terms), sections=secs))
+    return groups
+
+
+def section_keywords(
+    sections: Sequence[str], queries: Dict[str, str], extra: Dict[str, List[str]],
+) -> Dict[str, List[str]]:
+    """
+    분류용 섹션 키워드 = 섹션 검색어 + 검색어의 단어들 + extra (정규화, 중복 제거)
+    여러 섹션에 같이 나오는 키워드(예: "한국 경제"/"세계 경제"의 "경제")는 어느 섹션 점수도 올리지 못하고
+    동점만 만들므로 모든 섹션에서 뺌
+    """
+    out: Dict[str, List[str]] = {}
+    for sec in sections:
+        q = queries.get(sec, sec)
+        words = [q] + q.split() + list(extra.get(sec) or [])
+        seen: List[str] = []
+        for w in words:
+            k = _norm(w)
+            if k and k not in seen:
+                seen.append(k)
+        out[sec] = seen
+    owners: Dict[str, int] = {}
+    for ks in out.values():
+        for k in ks:
+            owners[k] = owners.get(k, 0) + 1
+    return {sec: [k for k in ks if owners[k] == 1] for sec, ks in out.items()}
+
+
+def classify_item(item: NaverNewsItem, sections: Sequence[str], keywords: Dict[str, List[str]]) -> Optional[str]:
+    """
+    제목(2점)/요약(1점)에 나온 키워드 수로 섹션 결정. 최고점이 0이거나 동점이면 None (어느 섹션에도 넣지 않음)
+    """
+    all_keywords = [k for sec in sections for k in keywords.get(sec) or []]
+    in_title = _matched_keywords(item.title, all_keywords)
+    in_desc = _matched_keywords(item.description, all_keywords)
+    best, best_score, tie = None, 0, False
+    for sec in sections:
+        score = 0
+        for k in keywords.get(sec) or []:
+            score += 2 * (k in in_title) + (k in in_desc)
+        if score > best_score:
+            best, best_score, tie = sec, score, False
+        elif score and score == best_score:
+            tie = True
+    return None if tie else best
+
+
+def route_items(
+    items: List[NaverNewsItem], sections: Sequence[str], keywords: Dict[str, List[str]],
+) -> Tuple[Dict[str, List[NaverNewsItem]], int]:
+    """
+    묶음 검색 결과를 섹션별로 나눔 → ({section: items}, 분류 못 한 수). 입력 순서 유지
+    """
+    routed: Dict[str, List[NaverNewsItem]] = {sec: [] for sec in sections}
+    unclassified = 0
+    for it in items:
+        sec = classify_item(it, sections, keywords)
+        if sec is None:
+            unclassified += 1
+        else:
+            routed[sec].append(it)
+    return routed, unclassified
+
+
+def search_group(
+    api: NaverNewsSearchAPI,
+    group: QueryGroup,
+    keywords: Dict[str, List[str]],
+    need_per_section: int,
+    not_before: Optional[datetime] = None,
+    not_after: Optional[datetime] = None,
+    keep: Optional[Callable[[NaverNewsItem], bool]] = None,
+) -> Tuple[Dict[str, List[NaverNewsItem]], str]:
+    """
+    묶음 검색 1건(sim+date 동시) → 섹션별 결과와 사용한 정렬
+    후보가 부족한 섹션은 호출한 쪽에서 섹션 단독 검색으로 보충
+    """
+    with span("naver.group", query=group.query, sections=len(group.sections)) as sp:
+        items, used = api.search_speculative(
+            query=group.query,
+            need=need_per_section * len(group.sections),
+            not_before=not_before,
+            not_after=not_after,
+            keep=keep,
+        )
+        routed, unclassified = route_items(items, group.sections, keywords)
+        sp.set(used=used, items=len(items), unclassified=unclassified, routed={s: len(v) for s, v in routed.items()})
+    return routed, used
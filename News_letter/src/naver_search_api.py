@@ -1,12 +1,75 @@
 import re
-import requests
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from email.utils import parsedate_to_datetime
-from typing import List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 from urllib.parse import urlparse
 
-NAVER_NEWS_API_URL = "https://openapi.naver.com/v1/search/news.json"
+from src.article_cache import normalize_url
+from src.config import (
+    NAVER_API_BASE_URL, NAVER_MAX_PAGES, NAVER_PAGE_WORKERS, NAVER_SPECULATIVE_CANCEL, NAVER_FETCH_MARGIN,
+    NAVER_RPS, NAVER_DAILY_BUDGET, NAVER_RATE_LIMIT_RETRIES,
+)
+from src.http_client import TRANSPORT_ERRORS, http_get
+from src.naver_cache import NaverSearchCache
+from src.rate_limiter import TokenBucket
+from src.state_store import StateStore
+from src.time_utils import now_kst, run_date_str
+from src.tracing import bind, span
+
+NAVER_NEWS_API_URL = f"{NAVER_API_BASE_URL}/v1/search/news.json"
+# API 문서상 display 최대 100, start 최대 1000
+NAVER_MAX_DISPLAY = 100
+NAVER_MAX_START = 1000
+# StateStore api_usage 에 쓰는 API 이름
+_USAGE_API = "naver_search"
+# errorCode 010: 일일 한도 초과, 012: 속도 제한
+_QUOTA_CODES = {"010"}
+_RATE_CODES = {"012"}
+
+
+class NaverAPIError(RuntimeError):
+    """
+    네이버 검색 API 오류 (status: HTTP 상태, code: 응답 errorCode)
+    """
+
+    def __init__(self, message: str, status: int = 0, code: str = ""):
+        super().__init__(message)
+        self.status = status
+        self.code = code
+
+
+class NaverQuotaExceeded(NaverAPIError):
+    """
+    일일 호출 한도 초과 (errorCode 010 또는 NAVER_DAILY_BUDGET 소진) → 당일 재시도해도 소용없음
+    """
+
+
+class NaverRateLimited(NaverAPIError):
+    """
+    초당 호출 한도 초과 (errorCode 012 / HTTP 429)
+    """
+
+
+def _raise_for_naver(r: Any) -> None:
+    if r.status_code < 400:
+        return
+    code, message = "", ""
+    try:
+        data = r.json()
+        code = str(data.get("errorCode") or "")
+        message = data.get("errorMessage") or ""
+    except ValueError:
+        pass
+    text = f"naver search failed status={r.status_code} code={code} {message}".strip()
+    if code in _QUOTA_CODES:
+        raise NaverQuotaExceeded(text, r.status_code, code)
+    if code in _RATE_CODES or r.status_code == 429:
+        raise NaverRateLimited(text, r.status_code, code)
+    raise NaverAPIError(text, r.status_code, code)
 
 def _strip_html_tags(s: str) -> str:
     if not s:
@@ -35,6 +98,7 @@ class NaverNewsItem:
     originallink: str
     description: str
     pubdate_kst: Optional[datetime]
+    source_sort: str = ""  # 이 item을 가져온 검색 정렬 (sim / date)
 
     @property
     def original_host(self) -> str:
@@ -44,17 +108,151 @@ class NaverNewsItem:
     def is_original_hankyung(self) -> bool:
         return "hankyung.com" in self.original_host
 
+def nvitem_to_dict(item: NaverNewsItem) -> Dict[str, Any]:
+    return {
+        "title": item.title,
+        "link": item.link,
+        "originallink": item.originallink,
+        "description": item.description,
+        "pubdate_kst": item.pubdate_kst.isoformat() if item.pubdate_kst else None,
+        "source_sort": item.source_sort,
+    }
+
+def nvitem_from_dict(d: Dict[str, Any]) -> NaverNewsItem:
+    pub = d.get("pubdate_kst")
+    return NaverNewsItem(
+        title=d.get("title") or "",
+        link=d.get("link") or "",
+        originallink=d.get("originallink") or "",
+        description=d.get("description") or "",
+        pubdate_kst=datetime.fromisoformat(pub) if pub else None,
+        source_sort=d.get("source_sort") or "",
+    )
+
+
+def _in_window(item: NaverNewsItem, not_before: Optional[datetime], not_after: Optional[datetime]) -> bool:
+    if not_before is not None and (item.pubdate_kst is None or item.pubdate_kst < not_before):
+        return False
+    if not_after is not None and (item.pubdate_kst is None or item.pubdate_kst > not_after):
+        return False
+    return True
+
 class NaverNewsSearchAPI:
-    def __init__(self, client_id: str, client_secret: str, timeout_sec: int = 10):
+    """
+    store가 있으면 일별 호출 수를 StateStore에 누적
+    cache가 있으면 TTL 안의 같은 요청(query, sort, display, start)은 API를 호출하지 않음
+    - 초당 rps 이하로 호출 (TokenBucket), 하루 daily_budget 초과 시 보내지 않고 NaverQuotaExceeded
+    - 한도 초과/속도 제한이면 cache에 남은 같은 요청의 마지막 성공 응답(TTL 무시)으로 대체 (없으면 예외)
+    """
+
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        timeout_sec: int = 10,
+        store: Optional[StateStore] = None,
+        cache: Optional[NaverSearchCache] = None,
+        rps: int = NAVER_RPS,
+        daily_budget: int = NAVER_DAILY_BUDGET,
+    ):
         if not client_id or not client_secret:
             raise ValueError("NAVER_CLIENT_ID / NAVER_CLIENT_SECRET is missing.")
         self.client_id = client_id
         self.client_secret = client_secret
         self.timeout_sec = timeout_sec
+        self.store = store
+        self.cache = cache
+        self.daily_budget = daily_budget
+        # 버스트 없이 1/rps 간격으로 보냄 (서버는 1초 구간 단위로 세므로 버스트 허용 시 경계에서 초과)
+        self._bucket = TokenBucket(rate_per_sec=rps, capacity=1)
+        self._quota_lock = threading.Lock()
+        self._quota_day = ""
+        self._calls_today = 0
+        self._exhausted = False
+        # 이번 실행 통계 (calls/cache_hits/rate_limited/degraded)
+        self.stats: Dict[str, int] = {}
+
+    @property
+    def calls_today(self) -> int:
+        return self._calls_today
+
+    def _count(self, key: str) -> None:
+        with self._quota_lock:
+            self.stats[key] = self.stats.get(key, 0) + 1
 
-    def search_news(self, query: str, display: int, sort: str) -> List[NaverNewsItem]:
+    def _reserve_call(self) -> str:
+        """
+        일일 예산 확인 후 호출 1건 기록 (보내기 전에 기록) → 기준 날짜(KST)
+        """
+        day = run_date_str(now_kst())
+        with self._quota_lock:
+            if day != self._quota_day:
+                self._quota_day = day
+                self._calls_today, self._exhausted = self.store.load_api_usage(day, _USAGE_API) if self.store else (0, False)
+            if self._exhausted or (self.daily_budget > 0 and self._calls_today >= self.daily_budget):
+                raise NaverQuotaExceeded(
+                    f"naver daily budget exhausted day={day} calls={self._calls_today} budget={self.daily_budget}",
+                    code="budget",
+                )
+            self._calls_today += 1
+        if self.store:
+            total = self.store.add_api_calls(day, _USAGE_API)
+            with self._quota_lock:
+                self._calls_today = max(self._calls_today, total)
+        self._count("calls")
+        return day
+
+    def _mark_exhausted(self, day: str) -> None:
+        with self._quota_lock:
+            if day == self._quota_day:
+                self._exhausted = True
+        if self.store:
+            self.store.mark_api_exhausted(day, _USAGE_API)
+
+    def _request(
+        self, params: Dict[str, Any], headers: Dict[str, str], sp: Any, cancel: Optional[threading.Event] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        예산/초당 한도를 지켜 1회 호출, 속도 제한이면 Retry-After(없으면 1초)만큼 쉬고 NAVER_RATE_LIMIT_RETRIES번 재시도
+        cancel이 set되면 보내지 않고 None (속도 제한 대기 중에 취소된 요청은 한도를 쓰지 않음)
+        """
+        for attempt in range(max(0, NAVER_RATE_LIMIT_RETRIES) + 1):
+            self._bucket.acquire()
+            if cancel is not None and cancel.is_set():
+                return None
+            day = self._reserve_call()
+            r = http_get(NAVER_NEWS_API_URL, params=params, headers=headers, timeout_sec=self.timeout_sec)
+            sp.set(status=r.status_code, bytes=len(r.content or b""), tries=attempt + 1)
+            try:
+                _raise_for_naver(r)
+            except NaverQuotaExceeded:
+                self._mark_exhausted(day)
+                raise
+            except NaverRateLimited:
+                self._count("rate_limited")
+                if attempt >= NAVER_RATE_LIMIT_RETRIES:
+                    raise
+                try:
+                    wait = float(r.headers.get("Retry-After") or 1.0)
+                except ValueError:
+                    wait = 1.0
+                self._bucket.pause(wait)
+                continue
+            return r.json()
+        raise NaverRateLimited("naver search rate limited")
+
+    def search_news(self, query: str, display: int, sort: str, start: int = 1) -> List[NaverNewsItem]:
+        return self._search_page(query, display, sort, start)[0]
+
+    def _search_page(
+        self, query: str, display: int, sort: str, start: int = 1, cancel: Optional[threading.Event] = None,
+    ) -> Tuple[List[NaverNewsItem], int]:
+        """
+        1페이지 호출 → (items, total). cancel이 보내기 전에 set되면 ([], 0)
+        """
         # display는 문서상 최대 100 :contentReference[oaicite:3]{index=3}
-        display = max(1, min(int(display), 100))
+        display = max(1, min(int(display), NAVER_MAX_DISPLAY))
+        start = max(1, min(int(start), NAVER_MAX_START))
 
         headers = {
             "X-Naver-Client-Id": self.client_id,
@@ -63,10 +261,195 @@ class NaverNewsSearchAPI:
         params = {
             "query": query,
             "display": display,
-            "start": 1,
+            "start": start,
             "sort": sort,  # sim / date
         }
 
+        with span("naver.search", query=query, sort=sort, display=display, start=start) as sp:
+            hit = self.cache.get(query, sort, display, start) if self.cache else None
+            if hit is not None:
+                # TTL 안의 같은 호출: API 호출/한도 소모 없이 저장된 item 그대로 복원
+                self._count("cache_hits")
+                sp.set(cached=True, items=len(hit[0]))
+                return [nvitem_from_dict(d) for d in hit[0]], hit[1]
+
+            try:
+                data = self._request(params, headers, sp, cancel)
+            except (NaverQuotaExceeded, NaverRateLimited) as e:
+                stale = self.cache.get_stale(query, sort, display, start) if self.cache else None
+                sp.set(error_code=e.code or e.status)
+                if stale is None:
+                    raise
+                # 재시도 attempt를 쓰는 대신 같은 요청의 마지막 성공 응답으로 대체 (캐시 갱신 안 함)
+                items, total, fetched_at = stale
+                self._count("degraded")
+                sp.set(degraded=True, cached_age_sec=int(time.time() - fetched_at), items=len(items))
+                return [nvitem_from_dict(d) for d in items], total
+            if data is None:
+                sp.set(cancelled=True)
+                return [], 0
+            sp.set(items=len(data.get("items") or []))
+
+        out: List[NaverNewsItem] = []
+        for it in data.get("items") or []:
+            out.append(NaverNewsItem(
+                title=_strip_html_tags(it.get("title") or ""),
+                link=(it.get("link") or "").strip(),
+                originallink=(it.get("originallink") or "").strip(),
+                description=_strip_html_tags(it.get("description") or ""),
+                pubdate_kst=parse_naver_pubdate_to_kst(it.get("pubDate") or ""),
+                source_sort=sort,
+            ))
+        total = int(data.get("total") or 0)
+        if self.cache:
+            self.cache.put(query, sort, display, start, [nvitem_to_dict(x) for x in out], total)
+        return out, total
+
+    def iter_search_pages(
+        self,
+        query: str,
+        sort: str,
+        not_before: Optional[datetime] = None,
+        not_after: Optional[datetime] = None,
+        keep: Optional[Callable[[NaverNewsItem], bool]] = None,
+        max_pages: int = NAVER_MAX_PAGES,
+        max_workers: int = NAVER_PAGE_WORKERS,
+        cancel: Optional[threading.Event] = None,
+    ) -> Iterator[NaverNewsItem]:
+        """
+        start=1,101,...(최대 1000) 페이지를 이어서 받아 중복 제거 + 윈도우/keep 필터를 통과한 item만 yield (페이지 순서 유지)
+        - 1페이지로 total을 확인한 뒤 나머지는 max_workers개씩 동시에 요청
+        - sort=date: 페이지의 가장 오래된 pubDate가 not_before 이전이면 다음 페이지는 요청하지 않음
+        - 소비자가 중간에 멈추거나(break) cancel이 set되면 다음 묶음도 요청하지 않음
+        """
+        workers = max(1, int(max_workers))
+        seen: Set[str] = set()
+
+        def _accept(items: List[NaverNewsItem]) -> Iterator[NaverNewsItem]:
+            for it in items:
+                key = normalize_url(it.originallink or it.link)
+                if key in seen:
+                    continue
+                seen.add(key)
+                if _in_window(it, not_before, not_after) and (keep is None or keep(it)):
+                    yield it
+
+        def _last_page(items: List[NaverNewsItem]) -> bool:
+            if len(items) < NAVER_MAX_DISPLAY or (cancel is not None and cancel.is_set()):
+                return True
+            if sort != "date" or not_before is None:
+                return False
+            dates = [it.pubdate_kst for it in items if it.pubdate_kst is not None]
+            return bool(dates) and min(dates) < not_before
+
+        first, total = self._search_page(query, NAVER_MAX_DISPLAY, sort, 1, cancel)
+        yield from _accept(first)
+        if _last_page(first):
+            return
+
+        last_start = min(NAVER_MAX_START, total, max(1, max_pages) * NAVER_MAX_DISPLAY)
+        starts = list(range(1 + NAVER_MAX_DISPLAY, last_start + 1, NAVER_MAX_DISPLAY))
+        fetch = bind(self._search_page)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="naver-page") as ex:
+            for i in range(0, len(starts), workers):
+                if cancel is not None and cancel.is_set():
+                    return
+                futures = [ex.submit(fetch, query, NAVER_MAX_DISPLAY, sort, s, cancel) for s in starts[i:i + workers]]
+                for k, fut in enumerate(futures):
+                    try:
+                        items = fut.result()[0]
+                    except (NaverQuotaExceeded, NaverRateLimited):
+                        # 뒤 페이지에서 한도에 걸리면 이미 받은 페이지까지만 사용
+                        items = []
+                    yield from _accept(items)
+                    if _last_page(items):
+                        for f in futures[k + 1:]:
+                            f.cancel()
+                        return
+
+    def search_window(
+        self,
+        query: str,
+        sort: str,
+        not_before: Optional[datetime] = None,
+        not_after: Optional[datetime] = None,
+        keep: Optional[Callable[[NaverNewsItem], bool]] = None,
+        limit: int = 0,
+        cancel: Optional[threading.Event] = None,
+    ) -> List[NaverNewsItem]:
+        """
+        iter_search_pages 결과 목록 (limit>0이면 그만큼 모이면 더 요청하지 않음)
+        """
+        out: List[NaverNewsItem] = []
+        with span("naver.search_pages", query=query, sort=sort) as sp:
+            for it in self.iter_search_pages(query, sort, not_before, not_after, keep, cancel=cancel):
+                out.append(it)
+                if limit and len(out) >= limit:
+                    break
+            sp.set(items=len(out), cancelled=bool(cancel and cancel.is_set()))
+        return out
+
+    def search_speculative(
+        self,
+        query: str,
+        need: int,
+        not_before: Optional[datetime] = None,
+        not_after: Optional[datetime] = None,
+        keep: Optional[Callable[[NaverNewsItem], bool]] = None,
+        cancel_loser: bool = NAVER_SPECULATIVE_CANCEL,
+    ) -> Tuple[List[NaverNewsItem], str]:
+        """
+        sim(1페이지)과 date(윈도우 페이지 검색)를 동시에 요청 (sim 부족 → date 재요청의 직렬 왕복 제거)
+        선호 규칙은 기존과 같음: 필터 후 sim이 need개 이상이면 sim, 아니면 date
+        - date는 need + NAVER_FETCH_MARGIN개가 모이면 다음 페이지를 요청하지 않음
+        - sim 채택: cancel_loser면 date는 아직 보내지 않은 페이지 요청을 버리고 기다리지 않음, 아니면 date 결과를 뒤에 합침
+        - sim/date 한쪽의 API·네트워크 오류만 다른 쪽 결과로 대신함 (그 밖의 예외는 그대로 올림)
+        - date 채택: date 결과 뒤에 date에 없는 sim 결과를 합침
+        반환: (items, used) used = sim / date / sim+date / date+sim, 각 item.source_sort에 출처 기록
+        """
+        stop = threading.Event()
+        ex = ThreadPoolExecutor(max_workers=2, thread_name_prefix="naver-spec")
+        try:
+            with span("naver.speculative", query=query, need=need) as sp:
+                sim_f = ex.submit(bind(self.search_news), query, NAVER_MAX_DISPLAY, "sim")
+                date_f = ex.submit(
+                    bind(self.search_window), query, "date", not_before, not_after, keep, need + NAVER_FETCH_MARGIN, stop,
+                )
+
+                try:
+                    sim_items = [
+                        x for x in sim_f.result()
+                        if _in_window(x, not_before, not_after) and (keep is None or keep(x))
+                    ]
+                except (NaverAPIError, *TRANSPORT_ERRORS):
+                    # sim 실패 시 date 결과만으로 진행 (date도 실패하면 그 예외를 올림)
+                    sim_items = []
+                sp.set(sim=len(sim_items))
+
+                if len(sim_items) >= need and cancel_loser:
+                    stop.set()
+                    sp.set(used="sim", cancelled=not date_f.done())
+                    return sim_items, "sim"
+
+                if len(sim_items) >= need:
+                    try:
+                        date_items = date_f.result()
+                    except (NaverAPIError, *TRANSPORT_ERRORS):
+                        date_items = []
+                    first, rest, order = sim_items, date_items, ("sim", "date")
+                else:
+                    date_items = date_f.result()
+                    first, rest, order = date_items, sim_items, ("date", "sim")
+
+                seen = {normalize_url(x.originallink or x.link) for x in first}
+                extra = [x for x in rest if normalize_url(x.originallink or x.link) not in seen]
+                used = "+".join(order) if extra else order[0]
+                sp.set(used=used, date=len(date_items))
+                return first + extra, used
+        finally:
+            # 취소된 date 요청은 이미 보낸 페이지만 끝나면 종료 (대기 중인 페이지는 보내지 않음) → 기다리지 않음
+            ex.shutdown(wait=False)
+
     def search_sim_then_date(self, query: str, display: int = 30) -> Tuple[List[NaverNewsItem], str]:
         # 1) sim 우선
         items = self.search_news(query=query, display=display, sort="sim")
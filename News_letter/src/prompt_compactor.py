@@ -0,0 +1,128 @@
+import math
+import re
+from functools import lru_cache
+from typing import List, Set, Tuple
+
+# 기사 본문에서 버릴 줄 (기자 바이라인, 저작권 문구, 사진 설명, 링크 유도 문구)
+_BOILERPLATE_LINE_PATTERNS = [
+    # 기자 바이라인: "홍길동 기자 hong@hankyung.com", "(hong@hankyung.com)" 처럼 이메일로 끝나는 짧은 줄만
+    # (본문 문장 속 이메일 안내는 남김)
+    re.compile(r"^(?=.{1,60}$)[\[(]?(\S{2,12}\s?(기자|특파원|객원기자|선임기자)\s*)?[(<\[]?[\w.+-]+@[\w-]+\.[\w.]+[)>\]]*$"),
+    re.compile(r"^\S{2,4}\s?(기자|특파원|객원기자|선임기자)$"),
+    re.compile(r"(ⓒ|©|copyright|무단\s*전재|재배포\s*금지|저작권자)", re.IGNORECASE),
+    re.compile(r"^(사진|그래픽|영상)\s*=\s*"),
+    re.compile(r"^[▶▷☞※]"),
+]
+# 이 줄부터 끝까지는 관련기사/추천기사 목록
+_TAIL_MARKERS = {"관련기사", "관련 기사", "관련뉴스", "관련 뉴스", "추천기사", "많이 본 뉴스"}
+
+_SENT_SPLIT = re.compile(r"(?<=[.!?。])\s+")
+_WORD = re.compile(r"[0-9A-Za-z가-힣]+")
+
+
+@lru_cache(maxsize=1)
+def _tiktoken_encoder():
+    try:
+        import tiktoken  # type: ignore
+
+        return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """
+    로컬 토큰 수 계산. tiktoken이 있으면 o200k_base 기준, 없으면 한글 위주 근사치
+    """
+    if not text:
+        return 0
+    enc = _tiktoken_encoder()
+    if enc is not None:
+        return len(enc.encode(text))
+    hangul = len(re.findall(r"[가-힣]", text))
+    other = len(re.sub(r"\s|[가-힣]", "", text))
+    return math.ceil(hangul / 1.5 + other / 4)
+
+
+def strip_boilerplate(text: str) -> str:
+    out: List[str] = []
+    for line in (text or "").splitlines():
+        s = line.strip()
+        if not s:
+            continue
+        if s in _TAIL_MARKERS:
+            break
+        if any(p.search(s) for p in _BOILERPLATE_LINE_PATTERNS):
+            continue
+        out.append(s)
+    return "\n".join(out)
+
+
+def _title_terms(title: str) -> Set[str]:
+    # 2글자 이상 단어 + 한글 2-gram (조사 붙은 형태도 잡히도록)
+    terms: Set[str] = set()
+    for w in _WORD.findall((title or "").lower()):
+        if len(w) >= 2:
+            terms.add(w)
+            terms.update(w[i:i + 2] for i in range(len(w) - 1))
+    return terms
+
+
+def _relevance(sentence: str, terms: Set[str]) -> int:
+    s = sentence.lower()
+    return sum(1 for t in terms if t in s)
+
+
+def compact_article(title: str, text: str, budget_tokens: int) -> Tuple[str, int, int]:
+    """
+    boilerplate 제거 후 budget_tokens 이내로 줄인 본문과 (before, after) 토큰 수 반환
+    - 첫 문단(리드)은 항상 유지
+    - 나머지 문장은 제목과의 관련도 순으로 예산이 찰 때까지 고르고, 원래 순서로 이어붙임
+    budget_tokens <= 0 이면 boilerplate 제거만 수행
+    """
+    before = count_tokens(text or "")
+    cleaned = strip_boilerplate(text)
+    if budget_tokens <= 0 or count_tokens(cleaned) <= budget_tokens:
+        return cleaned, before, count_tokens(cleaned)
+
+    paras = cleaned.split("\n")
+    lead = paras[0]
+    used = count_tokens(lead)
+    if used > budget_tokens:
+        compacted = _truncate_to_budget(lead, budget_tokens)
+        return compacted, before, count_tokens(compacted)
+
+    sentences: List[Tuple[int, str]] = []
+    for p in paras[1:]:
+        for s in _SENT_SPLIT.split(p):
+            if s.strip():
+                sentences.append((len(sentences), s.strip()))
+
+    terms = _title_terms(title)
+    ranked = sorted(sentences, key=lambda x: (-_relevance(x[1], terms), x[0]))
+
+    keep: List[Tuple[int, str]] = []
+    for idx, s in ranked:
+        cost = count_tokens(s)
+        if used + cost > budget_tokens:
+            continue
+        keep.append((idx, s))
+        used += cost
+
+    keep.sort()
+    body = " ".join(s for _, s in keep)
+    compacted = lead + ("\n" + body if body else "")
+    return compacted, before, count_tokens(compacted)
+
+
+def _truncate_to_budget(text: str, budget_tokens: int) -> str:
+    # 리드 문단 자체가 예산을 넘는 경우: 문장 단위로 앞에서부터 자름
+    out: List[str] = []
+    used = 0
+    for s in _SENT_SPLIT.split(text):
+        cost = count_tokens(s)
+        if out and used + cost > budget_tokens:
+            break
+        out.append(s)
+        used += cost
+    return " ".join(out)
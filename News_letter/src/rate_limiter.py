@@ -0,0 +1,95 @@
+import asyncio
+import threading
+import time
+from typing import Tuple
+
+
+class TokenBucket:
+    """
+    토큰 버킷 rate limiter (스레드/asyncio 공용)
+    - rate_per_sec: 초당 충전량, capacity: 최대 누적량(버스트)
+    - pause(sec): 429 Retry-After 등으로 일정 시간 전체 발급 중단. 버킷을 비우고 재개 시점부터 충전
+      → 기다리던 요청은 재개 후 rate 간격으로 하나씩 나감 (재개 직후 한꺼번에 몰리지 않음)
+    - slow_down()/speed_up(): 429가 나면 발급 속도를 줄이고, 성공할 때마다 설정값까지 조금씩 되돌림
+    rate_per_sec <= 0 이면 제한 없음
+    """
+
+    def __init__(self, rate_per_sec: float, capacity: float):
+        self.rate_per_sec = float(rate_per_sec)
+        self.max_rate_per_sec = self.rate_per_sec
+        self.capacity = max(1.0, float(capacity))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._pauses = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def per_minute(cls, limit: int) -> "TokenBucket":
+        return cls(rate_per_sec=limit / 60.0, capacity=limit)
+
+    def _reserve(self, cost: float) -> Tuple[float, int]:
+        """
+        cost만큼 미리 차감하고 (실제 사용 가능 시점까지 기다려야 할 초, 예약 시점의 pause 횟수) 반환
+        """
+        with self._lock:
+            now = time.monotonic()
+            # 멈춤 중이면 멈춤이 끝나는 시점부터 충전/발급
+            start = max(now, self._paused_until)
+            if self.rate_per_sec <= 0:
+                return start - now, self._pauses
+            if start > self._updated:
+                self._tokens = min(self.capacity, self._tokens + (start - self._updated) * self.rate_per_sec)
+                self._updated = start
+            self._tokens -= min(float(cost), self.capacity)
+            wait = (self._updated - now) + max(0.0, -self._tokens / self.rate_per_sec)
+            return max(0.0, wait), self._pauses
+
+    def pause(self, sec: float) -> None:
+        with self._lock:
+            until = time.monotonic() + max(0.0, sec)
+            if until <= self._paused_until:
+                return
+            self._paused_until = until
+            # 쌓인 토큰/기존 예약을 버리고 재개 시점부터 다시 충전 (기다리던 요청은 깨어나서 다시 예약)
+            self._tokens = 0.0
+            self._updated = until
+            self._pauses += 1
+
+    @property
+    def pauses(self) -> int:
+        """
+        지금까지 pause로 발급을 멈춘 횟수 (같은 429 묶음인지 구분용)
+        """
+        return self._pauses
+
+    def slow_down(self, factor: float = 0.5, min_fraction: float = 1 / 16) -> None:
+        with self._lock:
+            if self.max_rate_per_sec > 0:
+                self.rate_per_sec = max(self.max_rate_per_sec * min_fraction, self.rate_per_sec * factor)
+
+    def speed_up(self, step_fraction: float = 0.05) -> None:
+        with self._lock:
+            if self.rate_per_sec < self.max_rate_per_sec:
+                self.rate_per_sec = min(self.max_rate_per_sec, self.rate_per_sec + self.max_rate_per_sec * step_fraction)
+
+    def acquire(self, cost: float = 1) -> float:
+        waited = 0.0
+        while True:
+            wait, pauses = self._reserve(cost)
+            if wait > 0:
+                time.sleep(wait)
+                waited += wait
+            # 기다리는 사이 pause가 걸렸으면 그 예약은 무효 → 재개 시점 기준으로 다시 예약
+            if pauses == self._pauses:
+                return waited
+
+    async def acquire_async(self, cost: float = 1) -> float:
+        waited = 0.0
+        while True:
+            wait, pauses = self._reserve(cost)
+            if wait > 0:
+                await asyncio.sleep(wait)
+                waited += wait
+            if pauses == self._pauses:
+                return waited
@@ -0,0 +1,229 @@
+import asyncio
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from src.config import FIXTURE_DIR, FIXTURE_MODE, REPLAY_JITTER_MS, REPLAY_LATENCY_MS
+
+# 녹화 파일에 남기지 않는 응답 헤더 (요청 헤더/인증정보는 애초에 저장하지 않음)
+_SKIP_RESPONSE_HEADERS = {"set-cookie", "content-encoding", "transfer-encoding", "content-length", "connection"}
+
+
+class FixtureMissingError(RuntimeError):
+    """
+    replay 모드에서 녹화되지 않은 요청
+    """
+
+
+def _key(*parts: Any) -> str:
+    h = hashlib.sha1()
+    for p in parts:
+        h.update(p if isinstance(p, bytes) else str(p).encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()[:24]
+
+
+def http_fixture_key(method: str, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    query = urlencode(sorted((k, str(v)) for k, v in (params or {}).items()))
+    return _key(method.upper(), url, query)
+
+
+class FixtureStore:
+    """
+    녹화 파일 저장소
+    - http/<key>.json (+ .body): RSS XML, 네이버 JSON, 기사 HTML
+    - llm/<key>.json (+ .body): OpenAI 요청 본문 해시 기준 응답
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        self._lock = threading.Lock()
+
+    def _paths(self, kind: str, key: str) -> Tuple[str, str]:
+        base = os.path.join(self.root, kind, key)
+        return base + ".json", base + ".body"
+
+    def save(self, kind: str, key: str, meta: Dict[str, Any], body: bytes) -> None:
+        meta_path, body_path = self._paths(kind, key)
+        with self._lock:
+            os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+            with open(body_path, "wb") as f:
+                f.write(body)
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump(meta, f, ensure_ascii=False, indent=2)
+
+    def load(self, kind: str, key: str) -> Optional[Tuple[Dict[str, Any], bytes]]:
+        meta_path, body_path = self._paths(kind, key)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                return meta, f.read()
+        except FileNotFoundError:
+            return None
+
+
+def fixture_now(now: datetime) -> datetime:
+    """
+    실행 기준 시각 (뉴스 윈도우/run_date 결정)
+    - record: now를 manifest.json에 저장
+    - replay: 녹화 당시 시각을 돌려줌 → 날짜가 바뀌어도 같은 기사·같은 프롬프트로 재생
+    """
+    path = os.path.join(FIXTURE_DIR, "manifest.json")
+    if FIXTURE_MODE == "record":
+        os.makedirs(FIXTURE_DIR, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"now": now.isoformat()}, f)
+    elif FIXTURE_MODE == "replay":
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return datetime.fromisoformat(json.load(f)["now"]).astimezone(now.tzinfo)
+        except FileNotFoundError:
+            raise FixtureMissingError(f"no fixture manifest: {path}")
+    return now
+
+
+def _replay_delay_sec() -> float:
+    if REPLAY_LATENCY_MS <= 0 and REPLAY_JITTER_MS <= 0:
+        return 0.0
+    return max(0.0, REPLAY_LATENCY_MS + random.uniform(-REPLAY_JITTER_MS, REPLAY_JITTER_MS)) / 1000.0
+
+
+def _response_headers(headers: Any) -> Dict[str, str]:
+    return {k: v for k, v in headers.items() if k.lower() not in _SKIP_RESPONSE_HEADERS}
+
+
+# ---- http_get (requests/httpx 공용 인터페이스) ----
+
+def _to_requests_response(url: str, meta: Dict[str, Any], body: bytes) -> requests.Response:
+    r = requests.Response()
+    r.status_code = int(meta.get("status") or 200)
+    r._content = body
+    r.headers = CaseInsensitiveDict(meta.get("headers") or {})
+    r.url = meta.get("final_url") or url
+    r.encoding = meta.get("encoding")
+    return r
+
+
+def record_http(store: FixtureStore, url: str, params: Optional[Dict[str, Any]], resp: Any) -> None:
+    meta = {
+        "method": "GET",
+        "url": url,
+        "params": params or {},
+        "status": resp.status_code,
+        "headers": _response_headers(resp.headers),
+        "final_url": str(getattr(resp, "url", url)),
+        "encoding": getattr(resp, "encoding", None),
+        "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    store.save("http", http_fixture_key("GET", url, params), meta, resp.content or b"")
+
+
+def replay_http(store: FixtureStore, url: str, params: Optional[Dict[str, Any]]) -> requests.Response:
+    hit = store.load("http", http_fixture_key("GET", url, params))
+    if hit is None:
+        raise FixtureMissingError(f"no http fixture for GET {url} params={params}")
+    delay = _replay_delay_sec()
+    if delay:
+        time.sleep(delay)
+    return _to_requests_response(url, *hit)
+
+
+# ---- OpenAI (httpx transport) ----
+
+def _llm_key(request: Any) -> str:
+    body = request.content or b""
+    ctype = request.headers.get("content-type", "")
+    if "boundary=" in ctype:
+        # multipart(Batch 입력 파일 업로드)의 boundary는 매번 랜덤 → 키에서 제외
+        boundary = ctype.split("boundary=", 1)[1].strip('"').encode("latin-1")
+        body = body.replace(boundary, b"")
+    return _key(request.method, request.url.path, body)
+
+
+def _to_httpx_response(request: Any, meta: Dict[str, Any], body: bytes) -> Any:
+    import httpx
+
+    return httpx.Response(
+        status_code=int(meta.get("status") or 200),
+        headers=meta.get("headers") or {},
+        content=body,
+        request=request,
+    )
+
+
+def _save_llm(store: FixtureStore, request: Any, response: Any, body: bytes) -> None:
+    meta = {
+        "method": request.method,
+        "path": request.url.path,
+        "status": response.status_code,
+        "headers": _response_headers(response.headers),
+        "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    store.save("llm", _llm_key(request), meta, body)
+
+
+def _load_llm(store: FixtureStore, request: Any) -> Tuple[Dict[str, Any], bytes]:
+    hit = store.load("llm", _llm_key(request))
+    if hit is None:
+        raise FixtureMissingError(f"no llm fixture for {request.method} {request.url.path}")
+    return hit
+
+
+def openai_http_client(async_client: bool) -> Optional[Any]:
+    """
+    FIXTURE_MODE가 record/replay이면 OpenAI(http_client=...)에 넘길 httpx 클라이언트, 아니면 None
+    - record: 실제 전송 후 응답을 llm/에 저장
+    - replay: 요청 본문 해시로 저장된 응답 반환 (네트워크 없음)
+    """
+    if FIXTURE_MODE not in ("record", "replay"):
+        return None
+    import httpx
+
+    store = FixtureStore(FIXTURE_DIR)
+    mode = FIXTURE_MODE
+
+    class _SyncTransport(httpx.BaseTransport):
+        def __init__(self):
+            self._inner = httpx.HTTPTransport() if mode == "record" else None
+
+        def handle_request(self, request):
+            request.read()
+            if mode == "replay":
+                delay = _replay_delay_sec()
+                if delay:
+                    time.sleep(delay)
+                return _to_httpx_response(request, *_load_llm(store, request))
+            resp = self._inner.handle_request(request)
+            body = resp.read()
+            _save_llm(store, request, resp, body)
+            return _to_httpx_response(request, {"status": resp.status_code, "headers": _response_headers(resp.headers)}, body)
+
+    class _AsyncTransport(httpx.AsyncBaseTransport):
+        def __init__(self):
+            self._inner = httpx.AsyncHTTPTransport() if mode == "record" else None
+
+        async def handle_async_request(self, request):
+            await request.aread()
+            if mode == "replay":
+                delay = _replay_delay_sec()
+                if delay:
+                    await asyncio.sleep(delay)
+                return _to_httpx_response(request, *_load_llm(store, request))
+            resp = await self._inner.handle_async_request(request)
+            body = await resp.aread()
+            _save_llm(store, request, resp, body)
+            return _to_httpx_response(request, {"status": resp.status_code, "headers": _response_headers(resp.headers)}, body)
+
+    if async_client:
+        return httpx.AsyncClient(transport=_AsyncTransport())
+    return httpx.Client(transport=_SyncTransport())
@@ -0,0 +1,82 @@
+import atexit
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+
+class SQLiteCache:
+    """
+    SQLite 캐시 공통 부분 (연결 관리 + 만료/용량 정리)
+    - StateStore와 같은 방식: 장수명 연결 1개를 check_same_thread=False + RLock으로 스레드 간 공유, close()로 닫음
+    - 하위 클래스는 _TABLE/_KEY_COL/_AGE_COL, max_age_sec/max_bytes를 정하고
+      테이블에 accessed_at(마지막 사용 epoch) 컬럼, max_bytes를 쓰면 size(바이트) 컬럼을 둠
+    """
+
+    _TABLE = ""
+    _KEY_COL = ""
+    _AGE_COL = ""
+
+    def __init__(self, db_path: str, max_age_sec: int, max_bytes: int = 0):
+        self.db_path = db_path
+        self.max_age_sec = max_age_sec
+        self.max_bytes = max_bytes
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._lock = threading.RLock()
+        self._con: Optional[sqlite3.Connection] = None
+        self._init_db()
+        atexit.register(self.close)
+
+    def _init_db(self):
+        raise NotImplementedError
+
+    @contextmanager
+    def _use(self) -> Iterator[sqlite3.Connection]:
+        """
+        공유 연결을 잠근 채로 사용. 쓰기는 안에서 commit, 예외면 롤백
+        """
+        with self._lock:
+            if self._con is None:
+                con = sqlite3.connect(self.db_path, timeout=30, cached_statements=64, check_same_thread=False)
+                con.execute("PRAGMA journal_mode=WAL")
+                con.execute("PRAGMA synchronous=NORMAL")
+                self._con = con
+            try:
+                yield self._con
+            except BaseException:
+                if self._con is not None and self._con.in_transaction:
+                    self._con.rollback()
+                raise
+
+    def close(self):
+        with self._lock:
+            con, self._con = self._con, None
+            if con is not None:
+                con.close()
+
+    def prune(self) -> int:
+        """
+        max_age_sec 지난 항목 삭제 + 전체 크기가 max_bytes를 넘으면 오래 안 쓴 순으로 삭제 (0이면 용량 제한 없음)
+        삭제된 행 수 반환
+        """
+        t, k = self._TABLE, self._KEY_COL
+        removed = 0
+        with self._use() as con:
+            cur = con.execute(f"DELETE FROM {t} WHERE {self._AGE_COL} < ?", (time.time() - self.max_age_sec,))
+            removed += cur.rowcount
+
+            total = con.execute(f"SELECT COALESCE(SUM(size), 0) FROM {t}").fetchone()[0] if self.max_bytes > 0 else 0
+            if 0 < self.max_bytes < total:
+                rows = con.execute(f"SELECT {k}, size FROM {t} ORDER BY accessed_at ASC").fetchall()
+                drop = []
+                for key, size in rows:
+                    if total <= self.max_bytes:
+                        break
+                    drop.append((key,))
+                    total -= size
+                con.executemany(f"DELETE FROM {t} WHERE {k} = ?", drop)
+                removed += len(drop)
+            con.commit()
+        return removed
@@ -1,35 +1,198 @@
+import atexit
+import hashlib
+import json
 import os
+import re
 import sqlite3
-from datetime import datetime
-from typing import Optional
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, Optional, Set, Tuple
+
+from src.article_cache import normalize_url
+from src.title_matcher import normalize_title
+
+
+def title_hash(title: str) -> str:
+    # 띄어쓰기/문장부호 차이는 같은 제목으로 취급
+    key = re.sub(r"[\W_]+", "", normalize_title(title))
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class PublishedHistory:
+    """
+    이미 발송한 기사 키 집합 (메모리 set이라 조회 O(1))
+    """
+    url_keys: Set[str] = field(default_factory=set)
+    title_hashes: Set[str] = field(default_factory=set)
+
+    def __len__(self) -> int:
+        return len(self.url_keys)
+
+    def contains(self, url: str, title: str) -> bool:
+        if url and normalize_url(url) in self.url_keys:
+            return True
+        return bool(title) and title_hash(title) in self.title_hashes
+
+
+# SQL은 모듈 상수로 고정 → 연결별 statement 캐시에서 재사용 (매번 다시 파싱하지 않음)
+_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS run_state (
+        run_date TEXT PRIMARY KEY,
+        status TEXT NOT NULL,
+        attempt INTEGER NOT NULL,
+        updated_at TEXT NOT NULL,
+        reason TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS published_items (
+        url_key TEXT PRIMARY KEY,
+        title_hash TEXT NOT NULL,
+        section TEXT NOT NULL,
+        run_date TEXT NOT NULL,
+        title TEXT
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_published_title_hash ON published_items(title_hash)",
+    "CREATE INDEX IF NOT EXISTS idx_published_run_date ON published_items(run_date)",
+    """
+    CREATE TABLE IF NOT EXISTS checkpoints (
+        run_date TEXT NOT NULL,
+        stage TEXT NOT NULL,
+        item_key TEXT NOT NULL,
+        payload TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        PRIMARY KEY (run_date, stage, item_key)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS api_usage (
+        day TEXT NOT NULL,
+        api TEXT NOT NULL,
+        calls INTEGER NOT NULL,
+        exhausted INTEGER NOT NULL DEFAULT 0,
+        updated_at TEXT NOT NULL,
+        PRIMARY KEY (day, api)
+    )
+    """,
+]
+
+_SELECT_STATUS_SQL = "SELECT status FROM run_state WHERE run_date = ?"
+_UPSERT_RUN_STATE_SQL = """
+    INSERT INTO run_state (run_date, status, attempt, updated_at, reason)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(run_date) DO UPDATE SET
+        status=excluded.status,
+        attempt=excluded.attempt,
+        updated_at=excluded.updated_at,
+        reason=excluded.reason
+"""
+_DELETE_RUN_STATE_SQL = "DELETE FROM run_state WHERE run_date = ?"
+_SELECT_PUBLISHED_SQL = "SELECT url_key, title_hash FROM published_items WHERE run_date >= ? AND run_date < ?"
+_INSERT_PUBLISHED_SQL = """
+    INSERT INTO published_items (url_key, title_hash, section, run_date, title)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(url_key) DO NOTHING
+"""
+_UPSERT_CHECKPOINT_SQL = """
+    INSERT INTO checkpoints (run_date, stage, item_key, payload, updated_at)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(run_date, stage, item_key) DO UPDATE SET
+        payload=excluded.payload,
+        updated_at=excluded.updated_at
+"""
+_SELECT_CHECKPOINTS_SQL = "SELECT item_key, payload FROM checkpoints WHERE run_date = ? AND stage = ?"
+_DELETE_CHECKPOINTS_SQL = "DELETE FROM checkpoints WHERE run_date <= ?"
+_ADD_API_CALLS_SQL = """
+    INSERT INTO api_usage (day, api, calls, exhausted, updated_at)
+    VALUES (?, ?, ?, 0, ?)
+    ON CONFLICT(day, api) DO UPDATE SET
+        calls=calls + excluded.calls,
+        updated_at=excluded.updated_at
+"""
+_MARK_API_EXHAUSTED_SQL = """
+    INSERT INTO api_usage (day, api, calls, exhausted, updated_at)
+    VALUES (?, ?, 0, 1, ?)
+    ON CONFLICT(day, api) DO UPDATE SET
+        exhausted=1,
+        updated_at=excluded.updated_at
+"""
+_SELECT_API_USAGE_SQL = "SELECT calls, exhausted FROM api_usage WHERE day = ? AND api = ?"
+
 
 class StateStore:
+    """
+    실행 상태/발송 이력/체크포인트 저장소 (SQLite)
+    - 장수명 연결 1개 (WAL + synchronous=NORMAL)를 스레드 간 공유: check_same_thread=False + RLock으로 직렬화
+      → 워커 스레드마다 연결이 생겨 남는 일 없이 close()로 확실히 닫힘
+    - batch(): 여러 쓰기를 한 트랜잭션으로 묶음 (밖에서는 쓰기 1건 = 트랜잭션 1건)
+    """
+
     def __init__(self, db_path: str):
         self.db_path = db_path
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._lock = threading.RLock()
+        self._con: Optional[sqlite3.Connection] = None
+        self._depth = 0
         self._init_db()
+        atexit.register(self.close)
+
+    @contextmanager
+    def _use(self) -> Iterator[sqlite3.Connection]:
+        """
+        공유 연결을 잠근 채로 사용 (다른 스레드의 batch 트랜잭션에 끼어들지 않음)
+        """
+        with self._lock:
+            if self._con is None:
+                # isolation_level=None: 트랜잭션은 batch()에서 직접 BEGIN/COMMIT
+                con = sqlite3.connect(
+                    self.db_path, timeout=30, isolation_level=None, cached_statements=64, check_same_thread=False,
+                )
+                con.execute("PRAGMA journal_mode=WAL")
+                con.execute("PRAGMA synchronous=NORMAL")
+                self._con = con
+            yield self._con
 
-    def _connect(self):
-        return sqlite3.connect(self.db_path)
+    def close(self):
+        with self._lock:
+            con, self._con = self._con, None
+            if con is not None:
+                con.close()
+
+    @contextmanager
+    def batch(self) -> Iterator[sqlite3.Connection]:
+        """
+        with store.batch(): 안의 쓰기를 한 번에 커밋 (중첩 시 가장 바깥에서 커밋, 예외면 롤백)
+        트랜잭션 동안 잠금을 유지하므로 다른 스레드의 쓰기/읽기는 끝날 때까지 대기
+        """
+        with self._use() as con:
+            if self._depth == 0:
+                con.execute("BEGIN IMMEDIATE")
+            self._depth += 1
+            try:
+                yield con
+            except BaseException:
+                self._depth -= 1
+                if self._depth == 0:
+                    con.execute("ROLLBACK")
+                raise
+            self._depth -= 1
+            if self._depth == 0:
+                con.execute("COMMIT")
 
     def _init_db(self):
-        with self._connect() as con:
-            con.execute("""
-                CREATE TABLE IF NOT EXISTS run_state (
-                    run_date TEXT PRIMARY KEY,
-                    status TEXT NOT NULL,
-                    attempt INTEGER NOT NULL,
-                    updated_at TEXT NOT NULL,
-                    reason TEXT
-                )
-            """)
-            con.commit()
+        with self.batch() as con:
+            for sql in _SCHEMA:
+                con.execute(sql)
 
     def is_success(self, run_date: str) -> bool:
-        with self._connect() as con:
-            cur = con.execute("SELECT status FROM run_state WHERE run_date = ?", (run_date,))
-            row = cur.fetchone()
-            return bool(row and row[0] == "SUCCESS")
+        with self._use() as con:
+            row = con.execute(_SELECT_STATUS_SQL, (run_date,)).fetchone()
+        return bool(row and row[0] == "SUCCESS")
 
     def mark_running(self, run_date: str, attempt: int = 1):
         self._upsert(run_date, "RUNNING", attempt, None)
@@ -42,19 +205,81 @@ class StateStore:
 
     def _upsert(self, run_date: str, status: str, attempt: int, reason: Optional[str]):
         now = datetime.now().isoformat(timespec="seconds")
-        with self._connect() as con:
-            con.execute("""
-                INSERT INTO run_state (run_date, status, attempt, updated_at, reason)
-                VALUES (?, ?, ?, ?, ?)
-                ON CONFLICT(run_date) DO UPDATE SET
-                    status=excluded.status,
-                    attempt=excluded.attempt,
-                    updated_at=excluded.updated_at,
-                    reason=excluded.reason
-            """, (run_date, status, int(attempt), now, reason))
-            con.commit()
+        with self.batch() as con:
+            con.execute(_UPSERT_RUN_STATE_SQL, (run_date, status, int(attempt), now, reason))
 
     def reset(self, run_date: str):
-        with self._connect() as con:
-            con.execute("DELETE FROM run_state WHERE run_date = ?", (run_date,))
-            con.commit()
+        with self.batch() as con:
+            con.execute(_DELETE_RUN_STATE_SQL, (run_date,))
+
+    def load_published(self, before_run_date: str, lookback_days: int) -> PublishedHistory:
+        """
+        before_run_date 이전 lookback_days일 동안 발송한 기사 키 (당일 재실행은 제외)
+        """
+        start = (datetime.strptime(before_run_date, "%Y-%m-%d") - timedelta(days=lookback_days)).strftime("%Y-%m-%d")
+        history = PublishedHistory()
+        with self._use() as con:
+            rows = con.execute(_SELECT_PUBLISHED_SQL, (start, before_run_date)).fetchall()
+        for url_key, th in rows:
+            history.url_keys.add(url_key)
+            history.title_hashes.add(th)
+        return history
+
+    def mark_published(self, run_date: str, items: Iterable[Tuple[str, str, str]]) -> int:
+        """
+        items: (section, url, title). 같은 URL은 처음 발송한 날짜를 유지
+        """
+        rows = [(normalize_url(url), title_hash(title), sec, run_date, title) for sec, url, title in items if url]
+        with self.batch() as con:
+            con.executemany(_INSERT_PUBLISHED_SQL, rows)
+        return len(rows)
+
+    def save_checkpoint(self, run_date: str, stage: str, item_key: str, payload: Dict[str, Any]):
+        """
+        단계(stage)별 항목 단위 진행 상황 저장 (재시도 attempt에서 이어서 실행)
+        """
+        self.save_checkpoints(run_date, stage, {item_key: payload})
+
+    def save_checkpoints(self, run_date: str, stage: str, payloads: Dict[str, Dict[str, Any]]):
+        now = datetime.now().isoformat(timespec="seconds")
+        rows = [(run_date, stage, k, json.dumps(v, ensure_ascii=False), now) for k, v in payloads.items()]
+        with self.batch() as con:
+            con.executemany(_UPSERT_CHECKPOINT_SQL, rows)
+
+    def load_checkpoints(self, run_date: str, stage: str) -> Dict[str, Dict[str, Any]]:
+        with self._use() as con:
+            rows = con.execute(_SELECT_CHECKPOINTS_SQL, (run_date, stage)).fetchall()
+        return {k: json.loads(p) for k, p in rows}
+
+    def clear_checkpoints(self, up_to_run_date: str):
+        """
+        up_to_run_date 이하 날짜의 체크포인트 삭제 (성공 후 정리)
+        """
+        with self.batch() as con:
+            con.execute(_DELETE_CHECKPOINTS_SQL, (up_to_run_date,))
+
+    def add_api_calls(self, day: str, api: str, n: int = 1) -> int:
+        """
+        외부 API 일별 호출 수 누적 (요청을 보내기 전에 기록) → 누적 후 호출 수
+        """
+        now = datetime.now().isoformat(timespec="seconds")
+        with self.batch() as con:
+            con.execute(_ADD_API_CALLS_SQL, (day, api, int(n), now))
+            row = con.execute(_SELECT_API_USAGE_SQL, (day, api)).fetchone()
+        return int(row[0]) if row else int(n)
+
+    def mark_api_exhausted(self, day: str, api: str):
+        """
+        서버가 일일 한도 초과를 알린 날: 같은 날 남은 호출은 보내지 않음
+        """
+        now = datetime.now().isoformat(timespec="seconds")
+        with self.batch() as con:
+            con.execute(_MARK_API_EXHAUSTED_SQL, (day, api, now))
+
+    def load_api_usage(self, day: str, api: str) -> Tuple[int, bool]:
+        """
+        (호출 수, 한도 소진 여부)
+        """
+        with self._use() as con:
+            row = con.execute(_SELECT_API_USAGE_SQL, (day, api)).fetchone()
+        return (int(row[0]), bool(row[1])) if row else (0, False)
@@ -0,0 +1,307 @@
+import zlib
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, List, Optional
+
+# HK ↔ 네이버 제목 매칭 기준 (토큰 Jaccard)
+MATCH_THRESHOLD = 0.35
+# 문자 n-gram 코사인 유사도 기준 (method="ngram")
+NGRAM_MATCH_THRESHOLD = 0.40
+NGRAM_RANGE = (2, 3)
+_NGRAM_FEATURES = 1 << 18
+
+_PUNCT = ["[", "]", "(", ")", "…", "\"", "'", "’", "“", "”", "·", "|"]
+
+
+def normalize_title(s: str) -> str:
+    s = (s or "").lower()
+    for ch in _PUNCT:
+        s = s.replace(ch, " ")
+    s = " ".join(s.split())
+    return s.strip()
+
+
+def title_tokens(s: str) -> FrozenSet[str]:
+    return frozenset(normalize_title(s).split())
+
+
+def jaccard(a: str, b: str) -> float:
+    sa = title_tokens(a)
+    sb = title_tokens(b)
+    if not sa or not sb:
+        return 0.0
+    return len(sa & sb) / len(sa | sb)
+
+
+@dataclass
+class TitleMatch:
+    hk_idx: int
+    nv_idx: int          # 매칭 실패 시 -1
+    score: float         # 매칭 실패 시에도 최고 점수(best) 기록
+
+    @property
+    def matched(self) -> bool:
+        return self.nv_idx >= 0
+
+
+class TitleIndex:
+    """
+    제목 토큰 역색인: 토큰을 공유하는 후보만 Jaccard 점수 계산
+    (제목 정규화/토큰화는 생성 시 한 번만)
+    """
+
+    def __init__(self, titles: List[str]):
+        self.tokens: List[FrozenSet[str]] = [title_tokens(t) for t in titles]
+        self.postings: Dict[str, List[int]] = defaultdict(list)
+        for j, toks in enumerate(self.tokens):
+            for tok in toks:
+                self.postings[tok].append(j)
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def add(self, title: str) -> int:
+        j = len(self.tokens)
+        toks = title_tokens(title)
+        self.tokens.append(toks)
+        for tok in toks:
+            self.postings[tok].append(j)
+        return j
+
+    def scores(self, query: FrozenSet[str]) -> Dict[int, float]:
+        """
+        query 토큰과 겹치는 문서들의 {인덱스: Jaccard}
+        """
+        if not query:
+            return {}
+        inter: Dict[int, int] = defaultdict(int)
+        for tok in query:
+            for j in self.postings.get(tok, ()):
+                inter[j] += 1
+        nq = len(query)
+        return {j: c / (nq + len(self.tokens[j]) - c) for j, c in inter.items()}
+
+
+def _char_ngrams(title: str) -> List[str]:
+    # 띄어쓰기 차이를 무시하도록 공백 제거 후 2~3글자 n-gram
+    s = normalize_title(title).replace(" ", "")
+    lo, hi = NGRAM_RANGE
+    grams: List[str] = []
+    for n in range(lo, hi + 1):
+        grams.extend(s[k:k + n] for k in range(len(s) - n + 1))
+    return grams
+
+
+def _hashed_ngram_matrix(titles: List[str]) -> Any:
+    """
+    제목별 문자 n-gram을 해시해 L2 정규화한 희소 행렬 (len(titles) x _NGRAM_FEATURES)
+    """
+    import numpy as np
+    from scipy import sparse
+
+    rows: List[int] = []
+    cols: List[int] = []
+    for i, t in enumerate(titles):
+        for g in _char_ngrams(t):
+            rows.append(i)
+            cols.append(zlib.crc32(g.encode("utf-8")) & (_NGRAM_FEATURES - 1))
+
+    m = sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.float64), (rows, cols)),
+        shape=(len(titles), _NGRAM_FEATURES),
+    )
+    m.sum_duplicates()
+    norms = np.sqrt(np.asarray(m.multiply(m).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return sparse.diags(1.0 / norms) @ m
+
+
+def ngram_similarity_matrix(hk_titles: List[str], nv_titles: List[str]) -> Any:
+    """
+    HK x 네이버 문자 n-gram 코사인 유사도 전체 행렬 (numpy ndarray, 한 번의 희소 행렬곱)
+    numpy/scipy 필요
+    """
+    import numpy as np
+
+    if not hk_titles or not nv_titles:
+        return np.zeros((len(hk_titles), len(nv_titles)))
+    a = _hashed_ngram_matrix(hk_titles)
+    b = _hashed_ngram_matrix(nv_titles)
+    return (a @ b.T).toarray()
+
+
+def _greedy_from_matrix(scores: Any, threshold: float) -> List[TitleMatch]:
+    import numpy as np
+
+    n_hk, n_nv = scores.shape
+    available = np.ones(n_nv, dtype=bool)
+    out: List[TitleMatch] = []
+    for i in range(n_hk):
+        if not available.any():
+            out.append(TitleMatch(i, -1, 0.0))
+            continue
+        row = np.where(available, scores[i], -1.0)
+        j = int(np.argmax(row))
+        best = float(max(row[j], 0.0))
+        if best > 0 and best >= threshold:
+            available[j] = False
+            out.append(TitleMatch(i, j, best))
+        else:
+            out.append(TitleMatch(i, -1, best))
+    return out
+
+
+def jaccard_score_matrix(hk_titles: List[str], nv_titles: List[str]) -> List[List[float]]:
+    """
+    HK x 네이버 토큰 Jaccard 전체 행렬 (역색인으로 겹치는 쌍만 계산, 나머지 0)
+    """
+    index = TitleIndex(nv_titles)
+    rows: List[List[float]] = []
+    for title in hk_titles:
+        row = [0.0] * len(nv_titles)
+        for j, score in index.scores(title_tokens(title)).items():
+            row[j] = score
+        rows.append(row)
+    return rows
+
+
+def _hungarian_max(weights: List[List[float]]) -> List[int]:
+    """
+    가중치 합 최대 1:1 배정 (순수 파이썬 헝가리안, O(n^2 m), n <= m)
+    반환: 행별 배정 열 인덱스
+    """
+    n = len(weights)
+    m = len(weights[0]) if n else 0
+    inf = float("inf")
+    # 최소 비용 문제로 바꿔 풀기 (1-indexed 전위 잠재값 방식)
+    u = [0.0] * (n + 1)
+    v = [0.0] * (m + 1)
+    p = [0] * (m + 1)
+    way = [0] * (m + 1)
+    for i in range(1, n + 1):
+        p[0] = i
+        j0 = 0
+        minv = [inf] * (m + 1)
+        used = [False] * (m + 1)
+        while True:
+            used[j0] = True
+            i0 = p[j0]
+            delta = inf
+            j1 = 0
+            row = weights[i0 - 1]
+            for j in range(1, m + 1):
+                if used[j]:
+                    continue
+                cur = -row[j - 1] - u[i0] - v[j]
+                if cur < minv[j]:
+                    minv[j] = cur
+                    way[j] = j0
+                if minv[j] < delta:
+                    delta = minv[j]
+                    j1 = j
+            for j in range(m + 1):
+                if used[j]:
+                    u[p[j]] += delta
+                    v[j] -= delta
+                else:
+                    minv[j] -= delta
+            j0 = j1
+            if p[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+
+    assign = [-1] * n
+    for j in range(1, m + 1):
+        if p[j]:
+            assign[p[j] - 1] = j - 1
+    return assign
+
+
+def _optimal_from_matrix(scores: Any, threshold: float) -> List[TitleMatch]:
+    """
+    threshold 이상인 쌍만으로 점수 합이 최대가 되는 1:1 배정
+    scipy가 있으면 linear_sum_assignment, 없으면 순수 파이썬 헝가리안
+    """
+    rows = [list(map(float, r)) for r in scores]
+    n_hk = len(rows)
+    n_nv = len(rows[0]) if n_hk else 0
+    best = [max(r) if r else 0.0 for r in rows]
+    out = [TitleMatch(i, -1, max(best[i], 0.0)) for i in range(n_hk)]
+    if not n_hk or not n_nv:
+        return out
+
+    # 임계값 미만은 0으로, 후보가 하나도 없는 행/열은 빼고 작은 행렬만 풂
+    w = [[x if x >= threshold and x > 0 else 0.0 for x in r] for r in rows]
+    live_r = [i for i in range(n_hk) if any(w[i])]
+    live_c = [j for j in range(n_nv) if any(w[i][j] for i in live_r)]
+    if not live_r:
+        return out
+    sub = [[w[i][j] for j in live_c] for i in live_r]
+    try:
+        import numpy as np
+        from scipy.optimize import linear_sum_assignment
+
+        r_idx, c_idx = linear_sum_assignment(np.asarray(sub), maximize=True)
+        sub_pairs = list(zip(r_idx.tolist(), c_idx.tolist()))
+    except ImportError:
+        if len(live_r) <= len(live_c):
+            sub_pairs = list(enumerate(_hungarian_max(sub)))
+        else:
+            t = [list(col) for col in zip(*sub)]
+            sub_pairs = [(i, j) for j, i in enumerate(_hungarian_max(t))]
+
+    pairs = [(live_r[a], live_c[b]) for a, b in sub_pairs if b >= 0]
+    for i, j in pairs:
+        if w[i][j] > 0:
+            out[i] = TitleMatch(i, j, w[i][j])
+    return out
+
+
+def match_titles(
+    hk_titles: List[str],
+    nv_titles: List[str],
+    threshold: Optional[float] = None,
+    method: str = "jaccard",
+    assignment: str = "greedy",
+) -> List[TitleMatch]:
+    """
+    HK 제목과 네이버 제목을 1:1 매칭. 점수가 threshold 미만이면 매칭 없음.
+    - assignment="greedy": HK 순서대로 아직 쓰이지 않은 최고 점수 항목 (동점이면 네이버 인덱스가 작은 쪽)
+    - assignment="optimal": 점수 행렬을 한 번 만들고 전체 점수 합이 최대가 되도록 배정
+    - method="jaccard": 공백 토큰 Jaccard + 역색인 (기본, threshold 기본 MATCH_THRESHOLD)
+    - method="ngram": 문자 2~3-gram 코사인 행렬 (numpy/scipy, threshold 기본 NGRAM_MATCH_THRESHOLD)
+    """
+    if method == "ngram":
+        th = NGRAM_MATCH_THRESHOLD if threshold is None else threshold
+        scores = ngram_similarity_matrix(hk_titles, nv_titles)
+        if assignment == "optimal":
+            return _optimal_from_matrix(scores, th)
+        return _greedy_from_matrix(scores, th)
+
+    threshold = MATCH_THRESHOLD if threshold is None else threshold
+    if assignment == "optimal":
+        return _optimal_from_matrix(jaccard_score_matrix(hk_titles, nv_titles), threshold)
+
+    index = TitleIndex(nv_titles)
+    used = set()
+    out: List[TitleMatch] = []
+
+    for i, title in enumerate(hk_titles):
+        best_j = -1
+        best_score = 0.0
+        for j, score in index.scores(title_tokens(title)).items():
+            if j in used:
+                continue
+            if score > best_score or (score == best_score and best_j >= 0 and j < best_j):
+                best_score = score
+                best_j = j
+
+        if best_j >= 0 and best_score >= threshold:
+            used.add(best_j)
+            out.append(TitleMatch(i, best_j, best_score))
+        else:
+            out.append(TitleMatch(i, -1, best_score))
+    return out
@@ -0,0 +1,193 @@
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+class Span:
+    """
+    시간 구간 1개 (중첩 가능). attrs에는 섹션/기사 번호/바이트/토큰 등 기록
+    """
+
+    def __init__(self, name: str, parent: Optional["Span"], attrs: Dict[str, Any]):
+        self.name = name
+        self.parent = parent
+        self.attrs: Dict[str, Any] = dict(attrs)
+        self.thread = threading.current_thread().name
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+        self.error: Optional[str] = None
+        self.children: List["Span"] = []
+        self._lock = threading.Lock()
+
+    def set(self, **attrs: Any) -> None:
+        self.attrs.update(attrs)
+
+    @property
+    def duration(self) -> float:
+        return ((self.end if self.end is not None else time.perf_counter()) - self.start)
+
+    def _add_child(self, child: "Span") -> None:
+        with self._lock:
+            self.children.append(child)
+
+    def to_dict(self, t0: float) -> Dict[str, Any]:
+        d: Dict[str, Any] = {
+            "name": self.name,
+            "start_ms": round((self.start - t0) * 1000, 1),
+            "duration_ms": round(self.duration * 1000, 1),
+            "thread": self.thread,
+        }
+        if self.attrs:
+            d["attrs"] = self.attrs
+        if self.error:
+            d["error"] = self.error
+        if self.children:
+            d["children"] = [c.to_dict(t0) for c in sorted(self.children, key=lambda c: c.start)]
+        return d
+
+
+_current: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar("trace_span", default=None)
+
+
+class Tracer:
+    """
+    실행 1회분 span 트리
+    - 부모는 contextvars로 추적: 같은 스레드/asyncio 태스크는 자동으로 중첩됨
+    - ThreadPoolExecutor 작업은 문맥이 전달되지 않으므로 bind(fn)으로 감싸서 submit
+    """
+
+    def __init__(self):
+        self.roots: List[Span] = []
+        self._lock = threading.Lock()
+        self._t0 = time.perf_counter()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.roots = []
+            self._t0 = time.perf_counter()
+
+    @contextmanager
+    def span(self, name: str, **attrs: Any) -> Iterator[Span]:
+        parent = _current.get()
+        sp = Span(name, parent, attrs)
+        if parent is not None:
+            parent._add_child(sp)
+        else:
+            with self._lock:
+                self.roots.append(sp)
+        token = _current.set(sp)
+        try:
+            yield sp
+        except BaseException as e:
+            sp.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            sp.end = time.perf_counter()
+            _current.reset(token)
+
+    def to_dict(self) -> Dict[str, Any]:
+        roots = sorted(self.roots, key=lambda s: s.start)
+        total = sum(r.duration for r in roots)
+        return {
+            "total_ms": round(total * 1000, 1),
+            "spans": [r.to_dict(self._t0) for r in roots],
+            "critical_path": [step for r in roots for step in critical_path(r)],
+            "by_name": _summary_by_name(roots),
+        }
+
+    def write_json(self, path: str, **meta: Any) -> str:
+        data = dict(meta)
+        data.update(self.to_dict())
+        d = os.path.dirname(path)
+        if d:
+            os.makedirs(d, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2, default=str)
+        return path
+
+
+def critical_path(root: Span, depth: int = 0) -> List[Dict[str, Any]]:
+    """
+    root 종료 시점을 결정한 span 사슬:
+    가장 늦게 끝난 자식부터, 그 자식 시작 전에 끝난 자식을 거슬러 올라가며 고르고 각 자식 안으로 재귀
+    (병렬 구간에서는 가장 느린 작업만 경로에 남음, 부모 시간의 1% 미만 구간은 생략)
+    """
+    total = root.duration or 1e-9
+    chain: List[Span] = []
+    cursor = root.end if root.end is not None else time.perf_counter()
+    for c in sorted(root.children, key=lambda c: c.end or 0.0, reverse=True):
+        if (c.end or 0.0) <= cursor + 1e-6:
+            chain.append(c)
+            cursor = c.start
+    chain.reverse()
+
+    out: List[Dict[str, Any]] = []
+    for c in chain:
+        if c.duration / total < 0.01:
+            continue
+        step: Dict[str, Any] = {
+            "name": c.name,
+            "depth": depth,
+            "duration_ms": round(c.duration * 1000, 1),
+            "share_of_parent": round(c.duration / total, 3),
+        }
+        if c.attrs:
+            step["attrs"] = c.attrs
+        out.append(step)
+        out.extend(critical_path(c, depth + 1))
+    return out
+
+
+def _summary_by_name(roots: List[Span]) -> Dict[str, Dict[str, Any]]:
+    acc: Dict[str, Dict[str, Any]] = {}
+    stack = list(roots)
+    while stack:
+        sp = stack.pop()
+        a = acc.setdefault(sp.name, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+        ms = sp.duration * 1000
+        a["count"] += 1
+        a["total_ms"] = round(a["total_ms"] + ms, 1)
+        a["max_ms"] = round(max(a["max_ms"], ms), 1)
+        stack.extend(sp.children)
+    return dict(sorted(acc.items(), key=lambda kv: -kv[1]["total_ms"]))
+
+
+# 프로세스 기본 tracer
+TRACER = Tracer()
+
+
+def span(name: str, **attrs: Any):
+    return TRACER.span(name, **attrs)
+
+
+def traced(name: Optional[str] = None):
+    """
+    @traced("stage") 데코레이터: 함수 호출 전체를 span으로 기록
+    """
+    def deco(fn: Callable) -> Callable:
+        span_name = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with TRACER.span(span_name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return deco
+
+
+def bind(fn: Callable) -> Callable:
+    """
+    현재 span 문맥을 묶은 함수 반환 (executor.submit(bind(fn), ...) 으로 워커 스레드에 부모 span 전달)
+    호출마다 문맥을 새로 복사하므로 여러 작업에 같은 bind 결과를 써도 안전
+    """
+    ctx = contextvars.copy_context()
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        return ctx.copy().run(fn, *args, **kwargs)
+    return wrapper
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# News_letter 폴더를 import 경로에 추가 (src./bench. 패키지)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
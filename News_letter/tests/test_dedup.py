@@ -0,0 +1,89 @@
+import logging
+
+import pytest
+
+import run
+from src.hankyung_rss import HKItem
+from src.naver_search_api import NaverNewsItem
+
+SECTIONS = ["A", "B"]
+LOGGER = logging.getLogger("test_dedup")
+
+
+def _hk(sec: str, title: str, link: str) -> HKItem:
+    return HKItem(section=sec, title=title, link=link, published_kst=None)
+
+
+def _nv(title: str, originallink: str) -> NaverNewsItem:
+    return NaverNewsItem(title=title, link="", originallink=originallink, description="", pubdate_kst=None)
+
+
+def _cands(hk, nv):
+    return {
+        sec: run.SectionCandidates(sec=sec, hk_raw_count=len(hk[sec]), hk_cands=hk[sec], nv_cands=nv[sec], nv_used_sort="sim")
+        for sec in SECTIONS
+    }
+
+
+@pytest.fixture
+def mode(monkeypatch):
+    monkeypatch.setattr(run, "DEDUP_SECTION_PRIORITY", SECTIONS)
+    monkeypatch.setattr(run, "HK_TOP_N", 5)
+    monkeypatch.setattr(run, "NAVER_TOP_N", 5)
+
+    def _set(m: str) -> None:
+        monkeypatch.setattr(run, "DEDUP_MODE", m)
+
+    return _set
+
+
+STORY = "한은 기준금리 동결 결정 물가 안정 우선"
+HK = {
+    "A": [_hk("A", STORY, "https://www.hankyung.com/article/2024001?utm_source=naver")],
+    "B": [_hk("B", STORY, "https://hankyung.com/article/2024001"), _hk("B", "반도체 수출 반등", "https://www.hankyung.com/article/2024002")],
+}
+
+
+def test_hk_duplicate_is_skipped_by_lower_priority_section(mode):
+    mode("skip")
+    out = run._select_sections(_cands(HK, {"A": [], "B": []}), LOGGER)
+    assert [h.title for h in out["A"][0]] == [STORY]
+    assert [h.title for h in out["B"][0]] == ["반도체 수출 반등"]
+
+
+def test_hk_duplicate_is_shared_in_share_mode(mode):
+    mode("share")
+    out = run._select_sections(_cands(HK, {"A": [], "B": []}), LOGGER)
+    assert len(out["B"][0]) == 2
+    assert out["B"][1] == {0: ("A", 0)}
+
+
+def test_naver_copy_of_other_sections_hk_story_is_skipped(mode):
+    mode("skip")
+    # 우선순위가 높은 A 섹션의 네이버 후보가 B 섹션 HK 기사의 사본 (URL 정규화로 일치)
+    nv = {"A": [_nv("반도체 수출 반등 조짐", "https://hankyung.com/article/2024002/")], "B": []}
+    out = run._select_sections(_cands(HK, nv), LOGGER)
+    assert out["A"][2] == []
+
+
+def test_naver_copy_matched_by_title_only(mode):
+    mode("share")
+    nv = {"A": [], "B": [_nv("[속보] 한은 기준금리 동결 결정… 물가 안정 우선", "https://other.example.com/n/1")]}
+    # share 모드에선 B도 그 HK 기사를 실으므로 사본은 관련 기사로 유지
+    assert len(run._select_sections(_cands(HK, nv), LOGGER)["B"][2]) == 1
+    mode("skip")
+    assert run._select_sections(_cands(HK, nv), LOGGER)["B"][2] == []
+
+
+def test_naver_copy_of_own_hk_story_is_kept(mode):
+    mode("skip")
+    nv = {"A": [_nv(STORY, "https://n.news.naver.com/x")], "B": [_nv("반도체 수출 반등", "https://other.example.com/2")]}
+    out = run._select_sections(_cands(HK, nv), LOGGER)
+    assert len(out["A"][2]) == 1 and len(out["B"][2]) == 1
+
+
+def test_off_mode_keeps_everything(mode):
+    mode("off")
+    nv = {"A": [_nv("반도체 수출 반등", "https://hankyung.com/article/2024002")], "B": []}
+    out = run._select_sections(_cands(HK, nv), LOGGER)
+    assert len(out["B"][0]) == 2 and len(out["A"][2]) == 1
@@ -0,0 +1,28 @@
+from datetime import timedelta
+from email.utils import format_datetime
+
+from src.hankyung_rss import iter_rss_items
+from src.time_utils import now_kst
+
+NOW = now_kst()
+
+
+def _feed(hours_ago):
+    items = "".join(
+        f"<item><title>기사 {i}</title><link>https://www.hankyung.com/article/{i}</link>"
+        f"<pubDate>{format_datetime(NOW - timedelta(hours=h))}</pubDate></item>"
+        for i, h in enumerate(hours_ago)
+    )
+    return f'<?xml version="1.0" encoding="UTF-8"?><rss><channel>{items}</channel></rss>'.encode("utf-8")
+
+
+def _titles(feed, grace):
+    return [x.title for x in iter_rss_items(feed, "IT", not_before=NOW - timedelta(hours=24), cutoff_grace=grace)]
+
+
+def test_cutoff_stops_after_grace_old_items():
+    # 최신순이 깨진 피드: 오래된 item 3개 뒤에 창 안 item
+    feed = _feed([1, 2, 30, 40, 50, 3])
+    assert _titles(feed, 3) == ["기사 0", "기사 1"]
+    assert _titles(feed, 4) == ["기사 0", "기사 1", "기사 5"]
+    assert _titles(feed, 0) == ["기사 0", "기사 1", "기사 5"]
@@ -0,0 +1,40 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import src.http_client as http_client
+
+
+def test_concurrent_requests_are_capped_per_host(monkeypatch):
+    lock = threading.Lock()
+    state = {"now": 0, "peak": 0}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            with lock:
+                state["now"] += 1
+                state["peak"] = max(state["peak"], state["now"])
+            time.sleep(0.05)
+            with lock:
+                state["now"] -= 1
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+        def log_message(self, *args):
+            pass
+
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    monkeypatch.setattr(http_client, "HTTP_POOL_PER_HOST", 2)
+    monkeypatch.setattr(http_client, "_host_slots", {})
+    url = f"http://127.0.0.1:{srv.server_address[1]}/"
+    try:
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            codes = list(ex.map(lambda _: http_client.http_get(url).status_code, range(12)))
+    finally:
+        srv.shutdown()
+    assert codes == [200] * 12
+    assert state["peak"] <= 2
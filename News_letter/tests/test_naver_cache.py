@@ -0,0 +1,76 @@
+import time
+
+import pytest
+
+import src.naver_search_api as nsa
+from bench.standin_server import StandinConfig, start_standin_server
+from src.naver_cache import NaverSearchCache
+from src.naver_search_api import NaverNewsSearchAPI, NaverQuotaExceeded
+
+ITEMS = [{"title": "기사", "link": "https://n.news.naver.com/1", "originallink": "", "description": "", "pubdate_kst": None}]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    return now
+
+
+def _cache(tmp_path, **kw) -> NaverSearchCache:
+    return NaverSearchCache(str(tmp_path / "cache" / "naver.sqlite"), **kw)
+
+
+def test_ttl_and_stale_window(tmp_path, clock):
+    cache = _cache(tmp_path, ttl_sec=600, stale_sec=3600)
+    cache.put("경제", "sim", 10, 1, ITEMS, 42)
+    created = clock[0]
+
+    clock[0] += 599
+    assert cache.get("경제", "sim", 10, 1) == (ITEMS, 42)
+    assert cache.get("경제", "date", 10, 1) is None  # 정렬이 다르면 다른 키
+
+    clock[0] += 2
+    assert cache.get("경제", "sim", 10, 1) is None
+    assert cache.get_stale("경제", "sim", 10, 1) == (ITEMS, 42, created)
+
+    # prune은 stale_sec 지난 항목만 삭제 (TTL만 지난 항목은 대체 응답용으로 남김)
+    assert cache.prune() == 0
+    clock[0] = created + 3601
+    assert cache.get_stale("경제", "sim", 10, 1) is None
+    assert cache.prune() == 1
+
+
+def test_lru_eviction_keeps_recently_used(tmp_path, clock):
+    cache = _cache(tmp_path, max_entries=2)
+    cache.put("a", "sim", 10, 1, ITEMS, 1)
+    clock[0] += 1
+    cache.put("b", "sim", 10, 1, ITEMS, 1)
+    clock[0] += 1
+    assert cache.get("a", "sim", 10, 1) is not None  # a를 최근 사용으로 갱신
+    clock[0] += 1
+    cache.put("c", "sim", 10, 1, ITEMS, 1)
+
+    assert cache.get("b", "sim", 10, 1) is None
+    assert cache.get("a", "sim", 10, 1) is not None
+    assert cache.get("c", "sim", 10, 1) is not None
+
+
+def test_quota_error_falls_back_to_stale_entry(tmp_path, clock, monkeypatch):
+    srv = start_standin_server(StandinConfig(latency_ms=0, naver_daily_quota=1))
+    monkeypatch.setattr(nsa, "NAVER_NEWS_API_URL", srv.base_url + "/v1/search/news.json")
+    try:
+        api = NaverNewsSearchAPI("id", "secret", cache=_cache(tmp_path, ttl_sec=600), rps=100, daily_budget=0)
+        fresh = api.search_news("경제", display=10, sort="sim")
+        assert fresh
+
+        clock[0] += 601  # TTL 경과 → 다시 호출하지만 서버 한도 초과(010)
+        stale = api.search_news("경제", display=10, sort="sim")
+        assert [x.title for x in stale] == [x.title for x in fresh]
+        assert api.stats["degraded"] == 1 and srv.stats["naver_calls"] == 2
+
+        # 캐시에 없는 요청은 대체할 응답이 없으므로 예외
+        with pytest.raises(NaverQuotaExceeded):
+            api.search_news("반도체", display=10, sort="sim")
+    finally:
+        srv.shutdown()
@@ -0,0 +1,57 @@
+from src.naver_query_planner import _matched_keywords, classify_item, plan_query_groups, route_items, section_keywords
+from src.naver_search_api import NaverNewsItem
+
+QUERIES = {"한국 경제": "한국 경제", "세계 경제": "세계 경제", "IT": "IT 인공지능"}
+EXTRA = {"한국 경제": ["한국은행", "코스피"], "세계 경제": ["미국", "연준"], "IT": ["AI", "반도체"]}
+SECTIONS = list(QUERIES)
+
+
+def _item(title: str, description: str = "") -> NaverNewsItem:
+    return NaverNewsItem(title=title, link="", originallink="", description=description, pubdate_kst=None)
+
+
+def _classify(title: str, description: str = ""):
+    return classify_item(_item(title, description), SECTIONS, section_keywords(SECTIONS, QUERIES, EXTRA))
+
+
+def test_plan_query_groups_joins_with_or():
+    groups = plan_query_groups(SECTIONS, QUERIES, 2)
+    assert [g.query for g in groups] == ["한국 경제 | 세계 경제", "IT 인공지능"]
+    assert [g.sections for g in groups] == [["한국 경제", "세계 경제"], ["IT"]]
+
+
+def test_shared_words_are_dropped_from_every_section():
+    kw = section_keywords(SECTIONS, QUERIES, EXTRA)
+    assert "경제" not in kw["한국 경제"] and "경제" not in kw["세계 경제"]
+    assert "한국" in kw["한국 경제"] and "세계" in kw["세계 경제"]
+
+
+def test_generic_economy_headline_does_not_tie_on_shared_word():
+    assert _classify("한국 경제 성장률 2%대 회복") == "한국 경제"
+    assert _classify("세계 경제 둔화 우려 커져") == "세계 경제"
+
+
+def test_latin_keywords_match_on_word_boundaries():
+    assert _classify("Digital capital markets rally") is None
+    assert _classify("Daily email newsletter launch") is None
+    assert _classify("IT 업계 감원 바람") == "IT"
+    assert _classify("AI가 바꾸는 업무 방식") == "IT"
+    assert _matched_keywords("openai, it-services", ["it", "ai"]) == {"it"}
+
+
+def test_longer_keyword_consumes_its_span():
+    assert _matched_keywords("한국은행 기준금리 동결", ["한국", "한국은행"]) == {"한국은행"}
+    assert _matched_keywords("한국은행과 한국 정부", ["한국", "한국은행"]) == {"한국", "한국은행"}
+
+
+def test_spaced_query_keyword_matches_either_spacing():
+    assert _matched_keywords("세계 경제 전망", ["세계경제"]) == {"세계경제"}
+    assert _matched_keywords("세계경제 전망", ["세계경제"]) == {"세계경제"}
+
+
+def test_route_items_counts_unclassified():
+    items = [_item("미국 연준 금리 인하"), _item("반도체 수출 호조"), _item("날씨 맑음")]
+    routed, unclassified = route_items(items, SECTIONS, section_keywords(SECTIONS, QUERIES, EXTRA))
+    assert [x.title for x in routed["세계 경제"]] == ["미국 연준 금리 인하"]
+    assert [x.title for x in routed["IT"]] == ["반도체 수출 호조"]
+    assert unclassified == 1
@@ -0,0 +1,111 @@
+import pytest
+
+import src.naver_search_api as nsa
+from bench.standin_server import StandinConfig, start_standin_server
+from src.naver_search_api import NaverAPIError, NaverNewsSearchAPI, NaverQuotaExceeded, NaverRateLimited, _raise_for_naver
+from src.state_store import StateStore
+from src.time_utils import now_kst, run_date_str
+
+
+class _Resp:
+    def __init__(self, status_code: int, body=None):
+        self.status_code = status_code
+        self._body = body
+
+    def json(self):
+        if self._body is None:
+            raise ValueError("no json")
+        return self._body
+
+
+@pytest.mark.parametrize(
+    "status, body, exc",
+    [
+        (429, {"errorCode": "010", "errorMessage": "Query limit exceeded."}, NaverQuotaExceeded),
+        (429, {"errorCode": "012", "errorMessage": "Rate limit exceeded."}, NaverRateLimited),
+        (429, None, NaverRateLimited),
+        (400, {"errorCode": "SE01"}, NaverAPIError),
+        (500, None, NaverAPIError),
+    ],
+)
+def test_error_classification(status, body, exc):
+    with pytest.raises(exc) as ei:
+        _raise_for_naver(_Resp(status, body))
+    assert type(ei.value) is exc
+    assert ei.value.status == status
+
+
+@pytest.fixture
+def standin(monkeypatch):
+    servers = []
+
+    def _start(**kw):
+        srv = start_standin_server(StandinConfig(latency_ms=0, **kw))
+        servers.append(srv)
+        monkeypatch.setattr(nsa, "NAVER_NEWS_API_URL", srv.base_url + "/v1/search/news.json")
+        return srv
+
+    yield _start
+    for srv in servers:
+        srv.shutdown()
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = StateStore(str(tmp_path / "state.sqlite"))
+    yield s
+    s.close()
+
+
+def _api(store, **kw) -> NaverNewsSearchAPI:
+    return NaverNewsSearchAPI("id", "secret", store=store, rps=100, **kw)
+
+
+def test_daily_budget_is_shared_through_store(standin, store):
+    srv = standin()
+    api = _api(store, daily_budget=3)
+    for _ in range(3):
+        api.search_news("경제", display=10, sort="sim")
+    with pytest.raises(NaverQuotaExceeded) as ei:
+        api.search_news("경제", display=10, sort="sim")
+    assert ei.value.code == "budget"
+    assert srv.stats["naver_calls"] == 3
+
+    # 같은 날 새 클라이언트(재시도 attempt)도 누적 호출 수를 이어받아 보내지 않음
+    with pytest.raises(NaverQuotaExceeded):
+        _api(store, daily_budget=3).search_news("경제", display=10, sort="sim")
+    assert srv.stats["naver_calls"] == 3
+    assert store.load_api_usage(run_date_str(now_kst()), "naver_search") == (3, False)
+
+
+def test_server_quota_010_marks_day_exhausted(standin, store):
+    srv = standin(naver_daily_quota=2)
+    api = _api(store, daily_budget=0)
+    api.search_news("경제", display=10, sort="sim")
+    api.search_news("경제", display=10, sort="date")
+    with pytest.raises(NaverQuotaExceeded) as ei:
+        api.search_news("경제", display=10, sort="sim")
+    assert ei.value.code == "010"
+    assert store.load_api_usage(run_date_str(now_kst()), "naver_search") == (3, True)
+
+    # 소진된 날은 예산과 무관하게 더 보내지 않음
+    with pytest.raises(NaverQuotaExceeded):
+        _api(store, daily_budget=0).search_news("경제", display=10, sort="sim")
+    assert srv.stats["naver_calls"] == 3
+
+
+def test_rate_limit_012_is_retried_then_raised(standin, store, monkeypatch):
+    srv = standin(naver_qps=1)
+    monkeypatch.setattr(nsa, "NAVER_RATE_LIMIT_RETRIES", 0)
+    api = _api(store, daily_budget=0)
+    api.search_news("경제", display=10, sort="sim")
+    with pytest.raises(NaverRateLimited) as ei:
+        api.search_news("경제", display=10, sort="date")
+    assert ei.value.code == "012"
+    assert api.stats["rate_limited"] == 1
+    # 속도 제한은 일일 한도 소진으로 기록하지 않음 (호출 수에는 포함)
+    assert store.load_api_usage(run_date_str(now_kst()), "naver_search") == (2, False)
+
+    monkeypatch.setattr(nsa, "NAVER_RATE_LIMIT_RETRIES", 2)
+    api.search_news("경제", display=10, sort="date")  # Retry-After만큼 쉬고 재시도 → 성공
+    assert srv.stats.get("rate_limited", 0) >= 2
@@ -0,0 +1,31 @@
+import pytest
+
+from src.prompt_compactor import strip_boilerplate
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "hong@hankyung.com",
+        "홍길동 기자 hong@hankyung.com",
+        "홍길동기자 hong.gd@hankyung.com",
+        "워싱턴=홍길동 특파원 hong@hankyung.com",
+        "홍길동 기자(hong@hankyung.com)",
+        "[홍길동 기자 hong@hankyung.com]",
+        "<hong@hankyung.com>",
+    ],
+)
+def test_byline_lines_are_dropped(line):
+    assert strip_boilerplate(f"본문 첫 문장입니다.\n{line}") == "본문 첫 문장입니다."
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "제보는 tip@hankyung.com 으로 받습니다.",
+        "회사 측은 문의를 help@company.co.kr 로 보내 달라고 밝혔다.",
+        "홍길동 기자 " + "a" * 50 + "@hankyung.com",  # 길이 상한 초과
+    ],
+)
+def test_sentences_with_email_are_kept(line):
+    assert strip_boilerplate(line) == line
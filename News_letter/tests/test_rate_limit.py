@@ -0,0 +1,83 @@
+import asyncio
+import time
+
+from bench.standin_server import StandinConfig, start_standin_server
+from src.rate_limiter import TokenBucket
+
+
+def test_pause_releases_waiters_spaced_out():
+    bucket = TokenBucket(rate_per_sec=20, capacity=10)
+    bucket.pause(0.2)
+
+    async def waiters():
+        t0 = time.monotonic()
+        stamps = []
+
+        async def one():
+            await bucket.acquire_async(1)
+            stamps.append(time.monotonic() - t0)
+
+        await asyncio.gather(*(one() for _ in range(5)))
+        return sorted(stamps)
+
+    stamps = asyncio.run(waiters())
+    assert stamps[0] >= 0.19
+    # 재개 직후 한꺼번에 나가지 않고 1/rate 간격
+    assert all(b - a >= 0.04 for a, b in zip(stamps, stamps[1:]))
+
+
+def test_pause_invalidates_reservations_made_before_it():
+    bucket = TokenBucket(rate_per_sec=10, capacity=1)
+    bucket.acquire(1)
+
+    async def run():
+        t0 = time.monotonic()
+        task = asyncio.ensure_future(bucket.acquire_async(1))  # 약 0.1초 뒤로 예약
+        await asyncio.sleep(0.02)
+        bucket.pause(0.3)
+        await task
+        return time.monotonic() - t0
+
+    assert asyncio.run(run()) >= 0.3
+
+
+def test_slow_down_and_recover():
+    bucket = TokenBucket.per_minute(600)
+    bucket.slow_down()
+    assert bucket.rate_per_sec == 5
+    for _ in range(100):
+        bucket.speed_up()
+    assert bucket.rate_per_sec == 10
+
+
+def test_scheduler_keeps_429s_bounded_against_standin():
+    from openai import AsyncOpenAI
+    from src.gpt_rewriter_grounded import RewriteJob, RewriteScheduler
+
+    srv = start_standin_server(StandinConfig(latency_ms=50, rpm=5, window_sec=1.0))
+    jobs = [
+        RewriteJob(
+            title=f"테스트 기사 {i}",
+            article_text="\n".join(f"{i}번 기사 {k}번째 문장입니다. 수치와 발표 내용이 포함되어 있습니다." for k in range(10)),
+            published_dt_str="2025-12-24 10:00",
+            section="IT",
+        )
+        for i in range(20)
+    ]
+
+    async def run():
+        client = AsyncOpenAI(api_key="standin", base_url=srv.base_url + "/v1", max_retries=0)
+        try:
+            sched = RewriteScheduler(client, "standin", rpm=500, max_concurrency=8, max_retries=5)
+            return sched, await sched.rewrite_all(jobs)
+        finally:
+            await client.close()
+
+    try:
+        sched, results = asyncio.run(run())
+    finally:
+        srv.shutdown()
+    assert all(r.ok for r in results)
+    # 버스트 후 Retry-After마다 전원이 다시 몰리면 jobs 수를 넘김
+    assert sched.rate_limited <= len(jobs) // 2
+    assert srv.stats.get("rate_limited", 0) == sched.rate_limited
@@ -0,0 +1,63 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.article_cache import ArticleCache
+from src.llm_cache import ResponseCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    return now
+
+
+def test_article_cache_prune_by_age_then_lru_size(tmp_path, clock):
+    cache = ArticleCache(str(tmp_path / "cache" / "article.sqlite"), max_age_sec=100, max_bytes=25)
+    cache.put("https://a.com/old", "x" * 10, "h", None, None)
+    clock[0] += 50
+    for name in ("b", "c", "d"):
+        cache.put(f"https://a.com/{name}", "x" * 10, "h", None, None)
+        clock[0] += 1
+    assert cache.get("https://a.com/b") is not None  # b를 최근 사용으로 갱신
+
+    clock[0] += 50  # old만 max_age_sec 경과
+    # old 삭제(나이) 후 30바이트 > 25 → 가장 오래 안 쓴 c 삭제
+    assert cache.prune() == 2
+    assert cache.get("https://a.com/old") is None
+    assert cache.get("https://a.com/c") is None
+    assert cache.get("https://a.com/b") is not None and cache.get("https://a.com/d") is not None
+    cache.close()
+
+
+def test_article_cache_shares_one_connection_across_threads(tmp_path):
+    cache = ArticleCache(str(tmp_path / "article.sqlite"))
+
+    def work(i: int):
+        cache.put(f"https://a.com/{i}", f"본문 {i}", "h", None, None)
+        return cache.get(f"https://a.com/{i}").text
+
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        assert list(ex.map(work, range(40))) == [f"본문 {i}" for i in range(40)]
+    con = cache._con
+    assert con is not None
+    cache.close()
+    assert cache._con is None
+    # 닫은 뒤 다시 쓰면 새 연결로 열림
+    assert cache.get("https://a.com/1").text == "본문 1"
+    assert cache._con is not con
+    cache.close()
+
+
+def test_response_cache_prune_uses_created_at(tmp_path, clock):
+    cache = ResponseCache(str(tmp_path / "llm.sqlite"), max_age_sec=100)
+    cache.put("m", "old", {"ok": True})
+    clock[0] += 60
+    cache.put("m", "new", {"ok": True})
+    clock[0] += 50
+    assert cache.get("m", "old") is not None  # 사용해도 created_at 기준으로 만료
+    assert cache.prune() == 1
+    assert cache.get("m", "old") is None and cache.get("m", "new") == {"ok": True}
+    cache.close()
@@ -0,0 +1,99 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.state_store import StateStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = StateStore(str(tmp_path / "state" / "state.sqlite"))
+    yield s
+    s.close()
+
+
+def test_published_history_window(store):
+    store.mark_published("2024-05-01", [("A", "https://www.hankyung.com/article/1", "오래된 기사")])
+    store.mark_published("2024-05-08", [("A", "https://www.hankyung.com/article/2?utm_source=x", "지난주 기사")])
+    store.mark_published("2024-05-10", [("A", "https://www.hankyung.com/article/3", "오늘 기사")])
+
+    history = store.load_published("2024-05-10", lookback_days=7)
+    assert len(history) == 1
+    # URL은 정규화 키로, 제목은 띄어쓰기/문장부호 무시 해시로 조회
+    assert history.contains("https://hankyung.com/article/2", "")
+    assert history.contains("", "지난주  기사!")
+    # lookback 밖(7일 초과)과 당일 재실행분은 제외
+    assert not history.contains("https://www.hankyung.com/article/1", "오래된 기사")
+    assert not history.contains("https://www.hankyung.com/article/3", "오늘 기사")
+
+
+def test_published_keeps_first_run_date(store):
+    store.mark_published("2024-05-01", [("A", "https://www.hankyung.com/article/1", "기사")])
+    store.mark_published("2024-05-09", [("B", "https://www.hankyung.com/article/1", "기사")])
+    # 같은 URL은 처음 발송한 날짜 유지 → 5/9 기준 3일 창에는 안 잡힘
+    assert len(store.load_published("2024-05-10", lookback_days=3)) == 0
+    assert len(store.load_published("2024-05-10", lookback_days=30)) == 1
+
+
+def test_checkpoint_save_resume_clear(tmp_path):
+    path = str(tmp_path / "state.sqlite")
+    s = StateStore(path)
+    s.save_checkpoint("2024-05-09", "rewrite", "a", {"ok": True, "text": "요약 1"})
+    s.save_checkpoints("2024-05-10", "rewrite", {"b": {"ok": True}, "c": {"ok": False}})
+    s.save_checkpoint("2024-05-10", "rewrite", "c", {"ok": True})  # 같은 키는 덮어씀
+    s.save_checkpoint("2024-05-10", "fetch", "b", {"len": 120})
+    s.close()
+
+    # 재시도 attempt: 새 연결로 열어도 단계별로 이어서 읽힘
+    s = StateStore(path)
+    assert s.load_checkpoints("2024-05-10", "rewrite") == {"b": {"ok": True}, "c": {"ok": True}}
+    assert s.load_checkpoints("2024-05-10", "fetch") == {"b": {"len": 120}}
+    assert s.load_checkpoints("2024-05-09", "rewrite") == {"a": {"ok": True, "text": "요약 1"}}
+
+    s.clear_checkpoints("2024-05-09")
+    assert s.load_checkpoints("2024-05-09", "rewrite") == {}
+    assert len(s.load_checkpoints("2024-05-10", "rewrite")) == 2
+    s.clear_checkpoints("2024-05-10")
+    assert s.load_checkpoints("2024-05-10", "fetch") == {}
+    s.close()
+
+
+def test_batch_under_threads_and_close(store):
+    inside = threading.Event()
+    release = threading.Event()
+
+    def failing_batch():
+        # 다른 스레드 쓰기가 이 트랜잭션에 섞여 함께 롤백되지 않아야 함
+        with pytest.raises(RuntimeError):
+            with store.batch():
+                store.add_api_calls("2024-05-10", "rolled_back", 1)
+                inside.set()
+                release.wait(5)
+                raise RuntimeError("boom")
+
+    def worker(i: int):
+        with store.batch():
+            for j in range(10):
+                store.add_api_calls("2024-05-10", "naver", 1)
+                store.save_checkpoint("2024-05-10", "fetch", f"{i}-{j}", {"i": i})
+
+    t = threading.Thread(target=failing_batch)
+    t.start()
+    assert inside.wait(5)
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        futs = [ex.submit(worker, i) for i in range(8)]
+        release.set()
+        for f in futs:
+            f.result()
+    t.join(5)
+
+    assert store.load_api_usage("2024-05-10", "rolled_back") == (0, False)
+    assert store.load_api_usage("2024-05-10", "naver") == (80, False)
+    assert len(store.load_checkpoints("2024-05-10", "fetch")) == 80
+
+    store.close()
+    assert store._con is None
+    store.close()  # 두 번 닫아도 무방
+    # 닫은 뒤 다시 쓰면 새 연결로 열림
+    assert store.add_api_calls("2024-05-10", "naver", 1) == 81